@@ -0,0 +1,107 @@
+"""initial schema
+
+Baseline revision: databases created earlier by Base.metadata.create_all are adopted
+in place (existing tables are kept, missing columns/indexes are added).
+Later revisions create their tables/indexes with if_not_exists, so a database that
+create_all built from newer models (AUTO_CREATE_TABLES=true) upgrades as well.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_columns():
+    return {
+        "users": [
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("email", sa.String(length=255), nullable=False),
+            sa.Column("hashed_password", sa.String(length=255), nullable=False),
+            sa.Column("is_active", sa.Boolean(), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        ],
+        "interviews": [
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("company", sa.String(length=255), nullable=False),
+            sa.Column("role", sa.String(length=255), nullable=False),
+            sa.Column("resume_text", sa.Text(), nullable=True),
+            sa.Column("resume_file_path", sa.String(), nullable=True),
+            sa.Column("resume_file_url", sa.String(), nullable=True),
+            sa.Column("status", sa.String(length=50), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        ],
+        "questions": [
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("interview_id", sa.Integer(), nullable=False),
+            sa.Column("index_num", sa.Integer(), nullable=False),
+            sa.Column("text", sa.Text(), nullable=False),
+            sa.Column("audio_url", sa.String(length=512), nullable=True),
+            sa.Column("is_followup", sa.Boolean(), nullable=True),
+            sa.ForeignKeyConstraint(["interview_id"], ["interviews.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        ],
+        "answers": [
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("question_id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("text", sa.Text(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+            sa.ForeignKeyConstraint(["question_id"], ["questions.id"]),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        ],
+    }
+
+
+_INDEXES = [
+    ("ix_users_email", "users", ["email"], True),
+    ("ix_users_id", "users", ["id"], False),
+    ("ix_interviews_id", "interviews", ["id"], False),
+    ("ix_questions_id", "questions", ["id"], False),
+    ("ix_answers_id", "answers", ["id"], False),
+]
+
+
+def upgrade() -> None:
+    # 기존 배포 DB는 Base.metadata.create_all 로 만들어져 있으므로 baseline 으로 채택한다:
+    # 없는 테이블/인덱스만 만들고, create_all 이후 모델에 추가됐던 컬럼(resume_file_* 등)은 보충
+    inspector = sa.inspect(op.get_bind())
+    existing_tables = set(inspector.get_table_names())
+    for table, elements in _table_columns().items():
+        if table not in existing_tables:
+            op.create_table(table, *elements)
+            continue
+        existing_columns = {c["name"] for c in inspector.get_columns(table)}
+        for element in elements:
+            if isinstance(element, sa.Column) and element.name not in existing_columns:
+                op.add_column(table, element)
+
+    for name, table, columns, unique in _INDEXES:
+        if name not in {ix["name"] for ix in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns, unique=unique)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_answers_id", table_name="answers")
+    op.drop_table("answers")
+    op.drop_index("ix_questions_id", table_name="questions")
+    op.drop_table("questions")
+    op.drop_index("ix_interviews_id", table_name="interviews")
+    op.drop_table("interviews")
+    op.drop_index("ix_users_id", table_name="users")
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_table("users")
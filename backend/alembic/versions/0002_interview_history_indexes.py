@@ -0,0 +1,28 @@
+"""interview history indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_interviews_user_created_id", "interviews", ["user_id", "created_at", "id"], unique=False, if_not_exists=True)
+    # 질문/답변 개수 집계 서브쿼리용 FK 인덱스
+    op.create_index("ix_questions_interview_id", "questions", ["interview_id"], unique=False, if_not_exists=True)
+    op.create_index("ix_answers_question_id", "answers", ["question_id"], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_answers_question_id", table_name="answers")
+    op.drop_index("ix_questions_interview_id", table_name="questions")
+    op.drop_index("ix_interviews_user_created_id", table_name="interviews")
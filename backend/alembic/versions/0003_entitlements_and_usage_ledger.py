@@ -0,0 +1,51 @@
+"""entitlements and usage ledger
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "entitlements",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("credits", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.CheckConstraint("credits >= 0", name="ck_entitlements_credits_non_negative"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id"),
+        if_not_exists=True,
+    )
+    op.create_table(
+        "usage_ledger",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("delta", sa.Integer(), nullable=False),
+        sa.Column("reason", sa.String(length=50), nullable=False),
+        sa.Column("reference", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("reason", "reference", name="uq_usage_ledger_reason_reference"),
+        if_not_exists=True,
+    )
+    op.create_index("ix_usage_ledger_id", "usage_ledger", ["id"], unique=False, if_not_exists=True)
+    op.create_index("ix_usage_ledger_user_id", "usage_ledger", ["user_id"], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_usage_ledger_user_id", table_name="usage_ledger")
+    op.drop_index("ix_usage_ledger_id", table_name="usage_ledger")
+    op.drop_table("usage_ledger")
+    op.drop_table("entitlements")
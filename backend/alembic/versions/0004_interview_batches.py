@@ -0,0 +1,63 @@
+"""interview batches
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "interview_batches",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("company", sa.String(length=255), nullable=False),
+        sa.Column("role", sa.String(length=255), nullable=False),
+        sa.Column("status", sa.String(length=50), nullable=True),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.Column("completed", sa.Integer(), nullable=False),
+        sa.Column("failed", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        if_not_exists=True,
+    )
+    op.create_index("ix_interview_batches_id", "interview_batches", ["id"], unique=False, if_not_exists=True)
+    op.create_index("ix_interview_batches_user_id", "interview_batches", ["user_id"], unique=False, if_not_exists=True)
+
+    op.create_table(
+        "interview_batch_items",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("batch_id", sa.Integer(), nullable=False),
+        sa.Column("filename", sa.String(length=255), nullable=False),
+        sa.Column("status", sa.String(length=50), nullable=True),
+        sa.Column("interview_id", sa.Integer(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(["batch_id"], ["interview_batches.id"]),
+        sa.ForeignKeyConstraint(["interview_id"], ["interviews.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        if_not_exists=True,
+    )
+    op.create_index("ix_interview_batch_items_id", "interview_batch_items", ["id"], unique=False, if_not_exists=True)
+    op.create_index("ix_interview_batch_items_batch_id", "interview_batch_items", ["batch_id"], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_interview_batch_items_batch_id", table_name="interview_batch_items")
+    op.drop_index("ix_interview_batch_items_id", table_name="interview_batch_items")
+    op.drop_table("interview_batch_items")
+    op.drop_index("ix_interview_batches_user_id", table_name="interview_batches")
+    op.drop_index("ix_interview_batches_id", table_name="interview_batches")
+    op.drop_table("interview_batches")
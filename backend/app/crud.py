@@ -1,6 +1,9 @@
 # backend/app/crud.py
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from datetime import datetime
+from sqlalchemy import String, and_, cast, func, insert, literal, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+from typing import List, Optional, Tuple
 
 from . import models
 
@@ -46,6 +49,19 @@ def create_interview_with_file(
     return itv
 
 
+def set_resume_file(db: Session, interview_id: int, resume_file_path: str, resume_file_url: str) -> None:
+    db.query(models.Interview).filter(models.Interview.id == interview_id).update(
+        {"resume_file_path": resume_file_path, "resume_file_url": resume_file_url}
+    )
+    db.commit()
+
+
+def delete_interview(db: Session, interview_id: int) -> None:
+    """질문이 만들어지기 전의 면접 행 삭제 (생성 요청이 크레딧 부족으로 거절된 경우)"""
+    db.query(models.Interview).filter(models.Interview.id == interview_id).delete()
+    db.commit()
+
+
 def set_interview_status(db: Session, interview_id: int, status: str) -> models.Interview:
     itv = db.query(models.Interview).filter(models.Interview.id == interview_id).first()
     itv.status = status
@@ -72,3 +88,258 @@ def create_answer(db: Session, question_id: int, user_id: int, text: str) -> mod
     db.commit()
     db.refresh(ans)
     return ans
+
+
+def set_resume_text(db: Session, interview_id: int, resume_text: str) -> None:
+    db.query(models.Interview).filter(models.Interview.id == interview_id).update({"resume_text": resume_text})
+    db.commit()
+
+
+def list_turns(db: Session, interview_id: int) -> List[Tuple[str, str]]:
+    """면접의 (질문, 답변) 턴 목록 - 답변 순서대로"""
+    rows = (
+        db.query(models.Question.text, models.Answer.text)
+        .join(models.Answer, models.Answer.question_id == models.Question.id)
+        .filter(models.Question.interview_id == interview_id)
+        .order_by(models.Answer.id.asc())
+        .all()
+    )
+    return [(q_text, a_text) for q_text, a_text in rows]
+
+
+def get_question(db: Session, question_id: int) -> Optional[models.Question]:
+    return db.query(models.Question).filter(models.Question.id == question_id).first()
+
+
+def set_question_audio_url(db: Session, question_id: int, audio_url: str) -> None:
+    db.query(models.Question).filter(models.Question.id == question_id).update({"audio_url": audio_url})
+    db.commit()
+
+
+def keyset_value(db: Session, created_at: datetime):
+    """created_at 비교용 바인딩 값 (keyset pagination, 증분 export 등에서 공용)"""
+    # SQLite는 server_default(CURRENT_TIMESTAMP)로 "YYYY-MM-DD HH:MM:SS" 문자열을 저장하므로
+    # 같은 형식으로 바인딩해야 동일 시각 비교가 맞는다
+    if db.get_bind().dialect.name == "sqlite":
+        fmt = "%Y-%m-%d %H:%M:%S.%f" if created_at.microsecond else "%Y-%m-%d %H:%M:%S"
+        return created_at.strftime(fmt)
+    return created_at
+
+
+def list_interview_summaries(
+    db: Session,
+    user_id: int,
+    limit: int,
+    cursor: Optional[Tuple[datetime, int]] = None,
+    status: Optional[str] = None,
+    company: Optional[str] = None,
+):
+    """
+    사용자 면접 목록 (최신순) - (created_at, id) keyset pagination.
+    질문/답변 개수는 컬렉션 로딩 없이 상관 서브쿼리로 집계한다.
+    """
+    # 두 개수 모두 본 질문 기준 (꼬리질문과 그 답변은 제외)
+    is_main_question = models.Question.is_followup.is_not(True)
+    question_count = (
+        select(func.count(models.Question.id))
+        .where(models.Question.interview_id == models.Interview.id, is_main_question)
+        .correlate(models.Interview)
+        .scalar_subquery()
+    )
+    answer_count = (
+        select(func.count(models.Answer.id))
+        .join(models.Question, models.Answer.question_id == models.Question.id)
+        .where(models.Question.interview_id == models.Interview.id, is_main_question)
+        .correlate(models.Interview)
+        .scalar_subquery()
+    )
+    query = db.query(
+        models.Interview.id,
+        models.Interview.company,
+        models.Interview.role,
+        models.Interview.status,
+        models.Interview.created_at,
+        question_count.label("question_count"),
+        answer_count.label("answer_count"),
+    ).filter(models.Interview.user_id == user_id)
+
+    if status:
+        query = query.filter(models.Interview.status == status)
+    if company:
+        query = query.filter(models.Interview.company == company)
+    if cursor is not None:
+        created_at, last_id = cursor
+        created_at = keyset_value(db, created_at)
+        query = query.filter(or_(
+            models.Interview.created_at < created_at,
+            and_(models.Interview.created_at == created_at, models.Interview.id < last_id),
+        ))
+
+    return query.order_by(models.Interview.created_at.desc(), models.Interview.id.desc()).limit(limit).all()
+
+
+def get_credits(db: Session, user_id: int) -> Optional[int]:
+    """남은 크레딧 (entitlement 행이 없으면 None)"""
+    return db.query(models.Entitlement.credits).filter(models.Entitlement.user_id == user_id).scalar()
+
+
+def debit_credits(db: Session, user_id: int, amount: int, reason: str, reference: Optional[str] = None) -> Optional[int]:
+    """
+    잔액이 충분할 때만 차감 - 조건부 UPDATE 한 번으로 처리해서 동시 요청에도 이중 사용이 없다.
+    차감 후 잔액을 반환하고, 잔액이 부족하면 None.
+    """
+    stmt = (
+        update(models.Entitlement)
+        .where(models.Entitlement.user_id == user_id, models.Entitlement.credits >= amount)
+        .values(credits=models.Entitlement.credits - amount)
+        .returning(models.Entitlement.credits)
+    )
+    remaining = db.execute(stmt).scalar_one_or_none()
+    if remaining is None:
+        db.rollback()
+        return None
+    db.add(models.UsageLedger(user_id=user_id, delta=-amount, reason=reason, reference=reference))
+    db.commit()
+    return remaining
+
+
+def add_credits(db: Session, user_id: int, amount: int, reason: str, reference: Optional[str] = None) -> Optional[int]:
+    """
+    크레딧 적립. (reason, reference)가 이미 처리된 경우 None (중복 결제 검증 등).
+    적립 후 잔액 반환.
+    """
+    for _ in range(2):
+        try:
+            db.add(models.UsageLedger(user_id=user_id, delta=amount, reason=reason, reference=reference))
+            db.flush()
+        except IntegrityError:
+            db.rollback()
+            return None
+        stmt = (
+            update(models.Entitlement)
+            .where(models.Entitlement.user_id == user_id)
+            .values(credits=models.Entitlement.credits + amount)
+            .returning(models.Entitlement.credits)
+        )
+        remaining = db.execute(stmt).scalar_one_or_none()
+        if remaining is None:
+            db.add(models.Entitlement(user_id=user_id, credits=amount))
+            remaining = amount
+        try:
+            db.commit()
+            return remaining
+        except IntegrityError:
+            # 다른 요청이 동시에 entitlement 행을 만든 경우 - 한 번 더 시도
+            db.rollback()
+    raise RuntimeError("크레딧 적립 실패")
+
+
+def create_batch(db: Session, user_id: int, company: str, role: str, filenames: List[str]) -> models.InterviewBatch:
+    batch = models.InterviewBatch(user_id=user_id, company=company, role=role, status="queued", total=len(filenames), completed=0, failed=0)
+    db.add(batch)
+    db.flush()
+    db.execute(insert(models.InterviewBatchItem), [
+        {"batch_id": batch.id, "filename": filename, "status": "pending"} for filename in filenames
+    ])
+    db.commit()
+    db.refresh(batch)
+    return batch
+
+
+def get_batch(db: Session, batch_id: int, user_id: int) -> Optional[models.InterviewBatch]:
+    return db.query(models.InterviewBatch).filter(models.InterviewBatch.id == batch_id, models.InterviewBatch.user_id == user_id).first()
+
+
+def update_batch(db: Session, batch_id: int, **values) -> None:
+    db.query(models.InterviewBatch).filter(models.InterviewBatch.id == batch_id).update(values)
+    db.commit()
+
+
+def update_batch_item(db: Session, item_id: int, **values) -> None:
+    db.query(models.InterviewBatchItem).filter(models.InterviewBatchItem.id == item_id).update(values)
+    db.commit()
+
+
+def finish_batch(db: Session, batch_id: int, **values) -> bool:
+    """
+    진행 중(queued/running)인 배치를 finished 로 전환.
+    이미 끝난 배치면 False - 배치 실행과 중단 복구가 같은 배치를 두 번 마무리하지 않도록
+    """
+    result = db.execute(
+        update(models.InterviewBatch)
+        .where(models.InterviewBatch.id == batch_id, models.InterviewBatch.status.in_(("queued", "running")))
+        .values(status="finished", **values)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def list_stale_batches(db: Session, created_before: datetime) -> List[models.InterviewBatch]:
+    """created_before 이전에 만들어졌는데 아직 끝나지 않은 배치"""
+    return db.query(models.InterviewBatch).filter(
+        models.InterviewBatch.status.in_(("queued", "running")),
+        models.InterviewBatch.created_at < keyset_value(db, created_before),
+    ).all()
+
+
+def list_interrupted_interview_charges(db: Session, created_before: datetime) -> List[Tuple[int, int, int]]:
+    """
+    크레딧을 차감했지만 질문 없이 멈춘 면접 (생성 중 인스턴스 종료 등) - 아직 환불되지 않은 것만.
+    차감 내역의 reference(interview:<id>)로 면접과 연결한다. (interview_id, user_id, 차감액) 목록
+    """
+    charge = aliased(models.UsageLedger)
+    refund = aliased(models.UsageLedger)
+    reference = literal("interview:") + cast(models.Interview.id, String)
+    rows = db.execute(
+        select(models.Interview.id, models.Interview.user_id, charge.delta)
+        .join(charge, and_(charge.reason == "interview", charge.reference == reference))
+        .where(
+            models.Interview.status == "created",
+            models.Interview.created_at < keyset_value(db, created_before),
+            ~select(models.Question.id).where(models.Question.interview_id == models.Interview.id).exists(),
+            ~select(refund.id).where(refund.reason == "interview_refund", refund.reference == charge.reference).exists(),
+        )
+    ).all()
+    return [(interview_id, user_id, -delta) for interview_id, user_id, delta in rows]
+
+
+def fail_unfinished_batch_items(db: Session, batch_id: int, error: str) -> None:
+    db.query(models.InterviewBatchItem).filter(
+        models.InterviewBatchItem.batch_id == batch_id, models.InterviewBatchItem.status != "done"
+    ).update({"status": "failed", "error": error})
+    db.commit()
+
+
+def bulk_create_interviews(db: Session, user_id: int, company: str, role: str, results: List[dict]) -> List[int]:
+    """
+    배치 결과를 면접/질문 bulk INSERT 로 저장하고 배치 항목을 완료 처리.
+    results: [{"item_id", "resume_file_path", "resume_file_url", "resume_text", "questions": [(index, text, audio_url)]}]
+    """
+    interview_ids = db.scalars(
+        insert(models.Interview).returning(models.Interview.id, sort_by_parameter_order=True),
+        [
+            {
+                "user_id": user_id,
+                "company": company,
+                "role": role,
+                "resume_file_path": r["resume_file_path"],
+                "resume_file_url": r["resume_file_url"],
+                "resume_text": r["resume_text"],
+                "status": "created",
+            }
+            for r in results
+        ],
+    ).all()
+    question_rows = [
+        {"interview_id": interview_id, "index_num": index, "text": text, "audio_url": audio_url, "is_followup": False}
+        for interview_id, r in zip(interview_ids, results)
+        for index, text, audio_url in r["questions"]
+    ]
+    if question_rows:
+        db.execute(insert(models.Question), question_rows)
+    db.execute(update(models.InterviewBatchItem), [
+        {"id": r["item_id"], "status": "done", "interview_id": interview_id}
+        for interview_id, r in zip(interview_ids, results)
+    ])
+    db.commit()
+    return list(interview_ids)
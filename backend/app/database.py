@@ -1,14 +1,10 @@
 # backend/app/database.py
-from dotenv import load_dotenv
-load_dotenv()
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker, declarative_base
-from google.cloud.sql.connector import Connector
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 import os
 import logging
+import threading
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./thefasthire.db")
@@ -18,10 +14,20 @@ DB_USER = os.getenv("DB_USER")
 DB_PASSWORD = os.getenv("DB_PASSWORD")
 DB_NAME = os.getenv("DB_NAME")
 
+# 로컬 SQLite 튜닝 (단일 노드 배포용)
+SQLITE_SINGLE_WRITER = os.getenv("SQLITE_SINGLE_WRITER", "true").lower() == "true"
+SQLITE_READ_POOL_SIZE = int(os.getenv("SQLITE_READ_POOL_SIZE", "8"))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_WRITE_TIMEOUT = float(os.getenv("SQLITE_WRITE_TIMEOUT", "30"))  # 쓰기 커넥션 대기 최대 시간(초)
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+
 Base = declarative_base()
 
 def create_cloud_sql_engine():
     """Google Cloud SQL 연결 엔진 생성"""
+    # Connector는 import/생성 비용이 커서 Cloud SQL 모드에서만 불러온다
+    from google.cloud.sql.connector import Connector
     connector = Connector()
     
     def getconn():
@@ -49,13 +55,43 @@ def create_cloud_sql_engine():
         pool_recycle=300
     )
 
+def _is_file_sqlite() -> bool:
+    # 인메모리 DB는 커넥션마다 별개의 DB라 WAL/쓰기 전용 커넥션을 쓸 수 없다
+    return DATABASE_URL.startswith("sqlite") and ":memory:" not in DATABASE_URL and DATABASE_URL.rstrip("/") not in ("sqlite:", "sqlite+pysqlite:")
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")  # 읽기와 쓰기가 서로 막지 않음
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute("PRAGMA synchronous=NORMAL")  # WAL에서는 NORMAL이어도 손상 없음 (체크포인트 시에만 fsync)
+        cursor.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}")
+        cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
+
+def create_sqlite_engine(pool_size: int, max_overflow: int, pool_timeout: float = 30):
+    """튜닝된 파일 SQLite 엔진 (WAL + pragma)"""
+    engine = create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+    )
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
+    return engine
+
 def create_local_engine():
     """로컬 데이터베이스 연결 엔진 생성"""
     if DATABASE_URL.startswith("sqlite"):
-        return create_engine(
-            DATABASE_URL, 
-            connect_args={"check_same_thread": False}
-        )
+        if not _is_file_sqlite():
+            return create_engine(
+                DATABASE_URL, 
+                connect_args={"check_same_thread": False}
+            )
+        return create_sqlite_engine(pool_size=SQLITE_READ_POOL_SIZE, max_overflow=SQLITE_READ_POOL_SIZE)
     else:
         # PostgreSQL 연결 (SSL 포함)
         connect_args = {}
@@ -71,15 +107,72 @@ def create_local_engine():
             connect_args=connect_args
         )
 
-# 환경에 따른 엔진 선택
-if CLOUD_SQL_INSTANCE and GOOGLE_CLOUD_PROJECT:
-    logger.info("Google Cloud SQL 모드로 연결")
-    engine = create_cloud_sql_engine()
-else:
-    logger.info("로컬 데이터베이스 모드로 연결")
-    engine = create_local_engine()
+class SQLiteRoutingSession(Session):
+    """
+    SQLite 단일 writer 세션
+    - 읽기는 읽기 풀, flush/INSERT/UPDATE/DELETE는 커넥션 1개짜리 쓰기 엔진으로 보낸다
+    - 쓰기 커넥션이 풀에서 대기열 역할을 하므로 프로세스 내 쓰기는 순서대로 commit 되고 "database is locked"가 나지 않는다
+    - 한 번 쓰기를 시작한 트랜잭션은 commit/rollback 까지 쓰기 커넥션에서 읽는다 (자기 쓰기 결과를 보도록)
+    """
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.info.get("sqlite_writing") or self._flushing or getattr(clause, "is_dml", False):
+            self.info["sqlite_writing"] = True
+            return _writer_engine
+        return _engine
+
+@event.listens_for(SQLiteRoutingSession, "after_transaction_end")
+def _release_sqlite_writer(session, transaction):
+    if transaction.parent is None:
+        session.info.pop("sqlite_writing", None)
+
+_engine = None
+_writer_engine = None
+_engine_lock = threading.Lock()
+_session_factory = sessionmaker(autocommit=False, autoflush=False)
+
+def get_engine():
+    """환경에 따른 엔진 선택 - 첫 사용 시 생성 (cold start 시 import 경로에서 제외)"""
+    global _engine, _writer_engine, _session_factory
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                if CLOUD_SQL_INSTANCE and GOOGLE_CLOUD_PROJECT:
+                    logger.info("Google Cloud SQL 모드로 연결")
+                    engine = create_cloud_sql_engine()
+                else:
+                    logger.info("로컬 데이터베이스 모드로 연결")
+                    engine = create_local_engine()
+                if SQLITE_SINGLE_WRITER and _is_file_sqlite() and not (CLOUD_SQL_INSTANCE and GOOGLE_CLOUD_PROJECT):
+                    _writer_engine = create_sqlite_engine(pool_size=1, max_overflow=0, pool_timeout=SQLITE_WRITE_TIMEOUT)
+                    _session_factory = sessionmaker(class_=SQLiteRoutingSession, autocommit=False, autoflush=False)
+                else:
+                    _session_factory.configure(bind=engine)
+                _engine = engine
+    return _engine
+
+def _reset_after_fork():
+    # fork 이전에 열린 커넥션은 부모 소유이므로 닫지 않고 풀에서만 버린다
+    global _engine_lock
+    _engine_lock = threading.Lock()
+    if _engine is not None:
+        _engine.dispose(close=False)
+    if _writer_engine is not None:
+        _writer_engine.dispose(close=False)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+def __getattr__(name):
+    # 기존 `database.engine` 접근 호환
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def SessionLocal():
+    """새 세션 생성 (엔진이 없으면 먼저 생성)"""
+    get_engine()
+    return _session_factory()
 
 def get_db():
     """데이터베이스 세션 의존성"""
@@ -92,7 +185,7 @@ def get_db():
 def test_db_connection():
     """데이터베이스 연결 테스트"""
     try:
-        with engine.connect() as connection:
+        with get_engine().connect() as connection:
             result = connection.execute(text("SELECT 1"))
             logger.info("데이터베이스 연결 테스트 성공")
             return True
@@ -103,8 +196,22 @@ def test_db_connection():
 def create_tables():
     """테이블 생성"""
     try:
-        Base.metadata.create_all(bind=engine)
+        Base.metadata.create_all(bind=get_engine())
         logger.info("테이블 생성 완료")
     except Exception as e:
         logger.error(f"테이블 생성 실패: {e}")
         raise
+
+def warm_up_pool(connections: int = 2):
+    """커넥션 풀 미리 열기 - 첫 요청이 연결 수립 비용을 내지 않도록"""
+    engine = get_engine()
+    opened = []
+    try:
+        for _ in range(connections):
+            conn = engine.connect()
+            conn.execute(text("SELECT 1"))
+            opened.append(conn)
+    finally:
+        for conn in opened:
+            conn.close()  # 풀로 반환
+    logger.info(f"DB 커넥션 {len(opened)}개 warm-up 완료")
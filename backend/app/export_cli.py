@@ -0,0 +1,14 @@
+# backend/app/export_cli.py
+"""
+분석용 export CLI - python -m app.export_cli <interviews|questions|answers> [옵션]
+
+app 모듈들은 import 시점에 환경변수(DATABASE_URL 등)를 읽으므로 .env를 가장 먼저 로드한다
+"""
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from .services.export_service import main  # noqa: E402
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# backend/app/logging_config.py
+"""
+비동기(큐 기반) 구조화 로깅
+
+- 요청 경로의 로거는 QueueHandler로 레코드만 큐에 넣고, 실제 stdout 쓰기는 QueueListener 스레드가 담당
+  → 이벤트 루프가 stdout I/O에 막히지 않고 요청 간 출력이 섞이지 않는다
+- 레코드는 JSON 한 줄 (request_id, 단계별 소요시간 포함)
+- DEBUG 로그는 LOG_DEBUG_SAMPLE_RATE 비율로 샘플링
+"""
+import atexit
+import contextvars
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json")  # json | text
+LOG_DEBUG_SAMPLE_RATE = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "0.1"))
+
+request_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
+timings_var: contextvars.ContextVar[Optional[Dict[str, float]]] = contextvars.ContextVar("stage_timings", default=None)
+
+# LogRecord 기본 속성 - 이외의 속성은 extra로 보고 JSON에 포함
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id"}
+
+
+@contextmanager
+def stage(name: str):
+    """현재 요청의 단계별 소요시간(ms) 기록 - 요청 종료 로그에 함께 출력된다"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = timings_var.get()
+        if timings is not None:
+            timings[name] = round(timings.get(name, 0.0) + (time.perf_counter() - started) * 1000, 2)
+
+
+class RequestContextFilter(logging.Filter):
+    """호출한 스레드/태스크의 request_id를 레코드에 복사 (큐에 넣기 전에 실행되어야 함)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class DebugSamplingFilter(logging.Filter):
+    """DEBUG 레코드만 일정 비율로 통과"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        return random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            payload["request_id"] = record.request_id
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _StructuredQueueHandler(logging.handlers.QueueHandler):
+    """
+    기본 QueueHandler.prepare는 메시지를 문자열로 포맷해 extra 필드를 잃으므로,
+    메시지/traceback만 미리 계산하고 나머지 속성은 유지한 채 큐에 넣는다.
+    원본 레코드는 같은 레코드를 받는 다른 핸들러(caplog 등)를 위해 그대로 두고 복사본을 넣는다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_queue_handler: Optional[_StructuredQueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _make_output_handler() -> logging.Handler:
+    handler = logging.StreamHandler(sys.stdout)
+    if LOG_FORMAT == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s"))
+    return handler
+
+
+def _start_listener() -> None:
+    global _listener
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler.queue = log_queue
+    _listener = logging.handlers.QueueListener(log_queue, _make_output_handler(), respect_handler_level=False)
+    _listener.start()
+
+
+def _reset_after_fork():
+    # 리스너 스레드는 fork 시 복제되지 않으므로 워커마다 새 큐/리스너를 띄운다
+    if _queue_handler is not None:
+        _start_listener()
+
+
+def shutdown_logging() -> None:
+    """큐에 남은 레코드를 모두 출력하고 리스너 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def setup_logging() -> None:
+    """루트 로거를 큐 기반 핸들러로 구성 (여러 번 호출해도 한 번만 적용)"""
+    global _queue_handler
+    if _queue_handler is not None:
+        return
+
+    _queue_handler = _StructuredQueueHandler(queue.SimpleQueue())
+    _queue_handler.addFilter(RequestContextFilter())
+    _queue_handler.addFilter(DebugSamplingFilter(LOG_DEBUG_SAMPLE_RATE))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(LOG_LEVEL)
+
+    # uvicorn 로거도 같은 큐를 거치도록 (접근 로그는 요청 미들웨어가 구조화해서 남김)
+    for name in ("uvicorn", "uvicorn.error"):
+        uv_logger = logging.getLogger(name)
+        uv_logger.handlers = []
+        uv_logger.propagate = True
+    logging.getLogger("uvicorn.access").disabled = True
+
+    _start_listener()
+    atexit.register(shutdown_logging)
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=_reset_after_fork)
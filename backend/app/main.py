@@ -1,7 +1,10 @@
 #C:\Users\user\모든 개발\thefasthire\backend\app\main.py
 import os
+import asyncio
 import logging
 import sys
+import time
+import uuid
 from pathlib import Path
 
 from contextlib import asynccontextmanager
@@ -10,6 +13,11 @@ from dotenv import load_dotenv
 # 환경변수 먼저 로드
 load_dotenv()
 
+from .logging_config import setup_logging, request_id_var, timings_var
+
+# 로깅 설정 - 큐 기반 비동기 JSON 로깅 (다른 모듈 import 전에 구성)
+setup_logging()
+
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -17,25 +25,65 @@ from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from .database import Base, engine
-from .routers import user, interview, payment
+from .database import SessionLocal, create_tables, warm_up_pool
+from .routers import user, interview, payment, batch, export
+from .services import resilience, interview_service, audio_service, openai_client, gcs_service, entitlement_service, batch_service
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
+access_logger = logging.getLogger("app.access")
+
+def warm_up():
+    """선택적 warm-up: DB 풀 연결과 외부 API HTTP 세션을 미리 준비"""
+    try:
+        warm_up_pool(int(os.getenv("WARMUP_DB_CONNECTIONS", "2")))
+        # TLS 연결까지 미리 맺어 두기 위한 가벼운 호출
+        openai_client.get_client().with_options(timeout=5, max_retries=0).models.list()
+        if os.getenv("GCS_BUCKET_NAME"):
+            gcs_service.get_storage_client()
+        logger.info("Warm-up completed")
+    except Exception as e:
+        logger.warning(f"Warm-up failed: {e}")
+
+
+def _recover_batches():
+    try:
+        recovered = batch_service.recover_stale_batches()
+        if recovered:
+            logger.info(f"Recovered {recovered} stale batches")
+    except Exception as e:
+        logger.warning(f"Batch recovery failed: {e}")
+
+
+def _recover_interview_charges():
+    db = SessionLocal()
+    try:
+        recovered = entitlement_service.recover_interrupted_interviews(db)
+        if recovered:
+            logger.info(f"Refunded {recovered} interrupted interviews")
+    except Exception as e:
+        logger.warning(f"Interview charge recovery failed: {e}")
+    finally:
+        db.close()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # 시작 시 DB 테이블 생성
-    logger.info("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    # 스키마는 배포 전 마이그레이션 단계(alembic upgrade head)에서 관리
+    # 로컬 개발 편의를 위해서만 AUTO_CREATE_TABLES=true 로 테이블 자동 생성
+    if os.getenv("AUTO_CREATE_TABLES", "false").lower() == "true":
+        logger.info("Creating database tables...")
+        create_tables()
+
+    # warm-up은 요청 처리를 막지 않도록 백그라운드 스레드에서 실행
+    if os.getenv("WARMUP_ON_START", "false").lower() == "true":
+        asyncio.get_running_loop().run_in_executor(None, warm_up)
+
+    # 이전 인스턴스 종료로 멈춘 배치 정리 (실패 처리 + 환불), 생성 도중 끊긴 면접 환불
+    asyncio.get_running_loop().run_in_executor(None, _recover_batches)
+    asyncio.get_running_loop().run_in_executor(None, _recover_interview_charges)
     
-     # 미디어 디렉토리 생성 - audio_service.py와 일관성 유지
-    audio_dir = Path(os.getenv("AUDIO_DIR", "./media/audio"))
-    audio_dir.mkdir(parents=True, exist_ok=True)
+    # 미디어 디렉토리 생성 - 워커 프로세스마다 실행됨
+    audio_dir = audio_service.ensure_audio_dir()
     logger.info(f"Audio directory created: {audio_dir}")
     
     # 미디어 루트 디렉토리도 확인
@@ -46,8 +94,9 @@ async def lifespan(app: FastAPI):
     
     yield
     
-    # 종료 시 정리 작업
+    # 종료 시 정리 작업 - 진행 중인 hedge 요청까지 마무리
     logger.info("Application shutting down...")
+    resilience.shutdown(wait=True)
 
 
 def validate_required_env_vars():
@@ -98,6 +147,40 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 시간 예산 설정 - 외부 API 호출 타임아웃은 남은 예산 안에서 계산됨
+@app.middleware("http")
+async def request_deadline_middleware(request: Request, call_next):
+    with resilience.request_deadline():
+        return await call_next(request)
+
+# 요청 ID / 단계별 소요시간 - 요청마다 구조화된 접근 로그 1건
+@app.middleware("http")
+async def request_context_middleware(request: Request, call_next):
+    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    request_id_token = request_id_var.set(request_id)
+    timings = {}
+    timings_token = timings_var.set(timings)
+    started = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        response.headers["X-Request-ID"] = request_id
+        return response
+    finally:
+        access_logger.info(
+            f"{request.method} {request.url.path} {status_code}",
+            extra={
+                "method": request.method,
+                "path": request.url.path,
+                "status": status_code,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                "timings": timings,
+            },
+        )
+        timings_var.reset(timings_token)
+        request_id_var.reset(request_id_token)
+
 # 전역 예외 처리
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
@@ -113,6 +196,30 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         content={"detail": "입력 데이터를 확인해주세요.", "errors": exc.errors()}
     )
 
+@app.exception_handler(resilience.CircuitOpenError)
+async def circuit_open_handler(request: Request, exc: resilience.CircuitOpenError):
+    logger.warning(f"Circuit open: {exc}")
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "AI 서비스가 일시적으로 불안정합니다. 잠시 후 다시 시도해주세요."},
+        headers={"Retry-After": str(int(resilience.BREAKER_RESET_SECONDS))}
+    )
+
+@app.exception_handler(entitlement_service.InsufficientCreditsError)
+async def insufficient_credits_handler(request: Request, exc: entitlement_service.InsufficientCreditsError):
+    return JSONResponse(
+        status_code=status.HTTP_402_PAYMENT_REQUIRED,
+        content={"detail": "크레딧이 부족합니다. 결제 후 다시 시도해주세요."}
+    )
+
+@app.exception_handler(resilience.DeadlineExceeded)
+async def deadline_exceeded_handler(request: Request, exc: resilience.DeadlineExceeded):
+    logger.warning(f"Deadline exceeded: {request.url.path}")
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={"detail": "요청 처리 시간이 초과되었습니다."}
+    )
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     logger.error(f"Unexpected error: {str(exc)}", exc_info=True)
@@ -137,6 +244,8 @@ app.mount("/media", StaticFiles(directory=str(media_dir)), name="media")
 app.include_router(user.router, prefix="/users", tags=["users"])
 app.include_router(interview.router, prefix="/interviews", tags=["interviews"])  
 app.include_router(payment.router, prefix="/payments", tags=["payments"])
+app.include_router(batch.router, prefix="/batches", tags=["batches"])
+app.include_router(export.router, prefix="/exports", tags=["exports"])
 
 @app.get("/health", tags=["health"])
 def health():
@@ -148,6 +257,14 @@ def health():
         "media_dir": str(media_dir.absolute()),  # 디버깅용 추가
         "audio_dir": str(Path(os.getenv("AUDIO_DIR", "./media/audio")).absolute())
     }
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """
+    LLM 사용량 지표 (prompt caching 적중 토큰 포함)
+    카운터는 워커 프로세스별이므로 worker_pid 기준으로 모아서 합산해야 전체 값이 된다
+    """
+    return {"worker_pid": os.getpid(), "llm": interview_service.get_usage_stats()}
+
 @app.get("/", include_in_schema=False)
 def root():
     """루트 경로"""
@@ -1,5 +1,5 @@
 # backend/app/models.py
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean, Index, CheckConstraint, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -32,11 +32,16 @@ class Interview(Base):
     user = relationship("User", back_populates="interviews")
     questions = relationship("Question", back_populates="interview")
 
+    __table_args__ = (
+        # 사용자별 면접 목록 keyset pagination (created_at, id) 용
+        Index("ix_interviews_user_created_id", "user_id", "created_at", "id"),
+    )
+
 
 class Question(Base):
     __tablename__ = "questions"
     id = Column(Integer, primary_key=True, index=True)
-    interview_id = Column(Integer, ForeignKey("interviews.id"), nullable=False)
+    interview_id = Column(Integer, ForeignKey("interviews.id"), nullable=False, index=True)
     index_num = Column(Integer, nullable=False)  # 1..5 or followup=0?
     text = Column(Text, nullable=False)
     audio_url = Column(String(512), nullable=True)  # where audio stored
@@ -49,9 +54,67 @@ class Question(Base):
 class Answer(Base):
     __tablename__ = "answers"
     id = Column(Integer, primary_key=True, index=True)
-    question_id = Column(Integer, ForeignKey("questions.id"), nullable=False)
+    question_id = Column(Integer, ForeignKey("questions.id"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     text = Column(Text, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     question = relationship("Question", back_populates="answers")
+
+
+class Entitlement(Base):
+    """사용자별 남은 크레딧 - 차감은 항상 조건부 UPDATE로만 수행"""
+    __tablename__ = "entitlements"
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    credits = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        CheckConstraint("credits >= 0", name="ck_entitlements_credits_non_negative"),
+    )
+
+
+class UsageLedger(Base):
+    """크레딧 적립/차감 내역 (payment, signup, interview, answer, refund ...)"""
+    __tablename__ = "usage_ledger"
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    delta = Column(Integer, nullable=False)
+    reason = Column(String(50), nullable=False)
+    reference = Column(String(255), nullable=True)  # 결제 session_id 등 - 같은 결제의 중복 적립 방지
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("reason", "reference", name="uq_usage_ledger_reason_reference"),
+    )
+
+
+class InterviewBatch(Base):
+    """채용 담당자용 일괄 면접 생성 작업"""
+    __tablename__ = "interview_batches"
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    company = Column(String(255), nullable=False)
+    role = Column(String(255), nullable=False)
+    status = Column(String(50), default="queued")  # queued, running, finished
+    total = Column(Integer, nullable=False, default=0)
+    completed = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    items = relationship("InterviewBatchItem", back_populates="batch", order_by="InterviewBatchItem.id")
+
+
+class InterviewBatchItem(Base):
+    """배치 내 이력서 1건의 진행 상태"""
+    __tablename__ = "interview_batch_items"
+    id = Column(Integer, primary_key=True, index=True)
+    batch_id = Column(Integer, ForeignKey("interview_batches.id"), nullable=False, index=True)
+    filename = Column(String(255), nullable=False)
+    status = Column(String(50), default="pending")  # pending, uploading, generating, synthesizing, done, failed
+    interview_id = Column(Integer, ForeignKey("interviews.id"), nullable=True)
+    error = Column(Text, nullable=True)
+
+    batch = relationship("InterviewBatch", back_populates="items")
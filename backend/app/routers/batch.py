@@ -0,0 +1,66 @@
+# backend/app/routers/batch.py
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, File, UploadFile, Form, status
+from sqlalchemy.orm import Session
+from typing import List
+
+from ..database import get_db
+from .. import crud, schemas, models
+from ..routers.user import get_current_user
+from ..services import batch_service, entitlement_service
+
+router = APIRouter(tags=["batches"])
+
+
+def _batch_out(batch: models.InterviewBatch) -> schemas.InterviewBatchOut:
+    out = schemas.InterviewBatchOut.model_validate(batch)
+    out.resumes_per_minute = batch_service.resumes_per_minute(batch)
+    return out
+
+
+@router.post("", response_model=schemas.InterviewBatchOut, status_code=status.HTTP_202_ACCEPTED)
+async def create_batch(
+    background_tasks: BackgroundTasks,
+    company: str = Form(...),
+    role: str = Form(...),
+    resume_files: List[UploadFile] = File(...),
+    current_user: models.User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """여러 이력서로 면접을 일괄 생성 - 바로 202를 반환하고 GET /batches/{id} 로 진행 상황 조회"""
+    if not resume_files:
+        raise HTTPException(status_code=400, detail="파일이 업로드되지 않았습니다")
+    if len(resume_files) > batch_service.BATCH_MAX_FILES:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {batch_service.BATCH_MAX_FILES}개까지 업로드할 수 있습니다")
+
+    # 요청이 끝나면 UploadFile이 닫히므로 내용을 미리 읽어 둔다
+    contents = []
+    for resume_file in resume_files:
+        if not resume_file.filename or not resume_file.filename.lower().endswith('.pdf'):
+            raise HTTPException(status_code=400, detail="PDF 파일만 업로드 가능합니다")
+        content = await resume_file.read()
+        if len(content) == 0:
+            raise HTTPException(status_code=400, detail=f"빈 파일은 업로드할 수 없습니다: {resume_file.filename}")
+        contents.append((resume_file.filename, content, resume_file.content_type))
+
+    # 전체 건수만큼 한 번에 차감 - 실패한 건은 배치 종료 시 환불
+    entitlement_service.debit(db, current_user.id, entitlement_service.INTERVIEW_CREDIT_COST * len(contents), "batch")
+
+    batch = crud.create_batch(db, current_user.id, company, role, [filename for filename, _, _ in contents])
+    files = [
+        batch_service.BatchFile(item_id=item.id, filename=filename, content=content, content_type=content_type)
+        for item, (filename, content, content_type) in zip(batch.items, contents)
+    ]
+    background_tasks.add_task(batch_service.run_batch, batch.id, current_user.id, company, role, files)
+    return _batch_out(batch)
+
+
+@router.get("/{batch_id}", response_model=schemas.InterviewBatchOut)
+def get_batch(batch_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+    """배치 진행 상황 (항목별 상태, 처리량 포함)"""
+    batch = crud.get_batch(db, batch_id, current_user.id)
+    if not batch:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    if batch_service.is_stale(batch):
+        batch_service.recover_stale_batches()
+        db.refresh(batch)
+    return _batch_out(batch)
@@ -0,0 +1,46 @@
+# backend/app/routers/export.py
+import os
+import secrets
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from ..services import export_service
+
+router = APIRouter(tags=["exports"])
+
+# 분석 파이프라인 전용 - 설정되지 않으면 export 엔드포인트 비활성화
+EXPORT_API_TOKEN = os.getenv("EXPORT_API_TOKEN")
+
+_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+
+def _check_export_token(token: Optional[str]) -> None:
+    if not EXPORT_API_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not token or not secrets.compare_digest(token, EXPORT_API_TOKEN):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid export token")
+
+
+@router.get("/{entity}")
+def export_entity(
+    entity: str,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    since_created_at: Optional[datetime] = Query(None, description="증분 export watermark (이 시각 이후)"),
+    since_id: Optional[int] = Query(None, ge=0, description="증분 export watermark (같은 시각이면 이 id 이후)"),
+    gzip: bool = False,
+    x_export_token: Optional[str] = Header(None),
+):
+    """면접/질문/답변 행을 NDJSON 또는 CSV로 스트리밍 (created_at, id 순)"""
+    _check_export_token(x_export_token)
+    if entity not in export_service.EXPORT_ENTITIES:
+        raise HTTPException(status_code=404, detail="Unknown export entity")
+
+    filename = f"{entity}.{format}" + (".gz" if gzip else "")
+    return StreamingResponse(
+        export_service.iter_export(entity, format, since_created_at, since_id, compress=gzip),
+        media_type="application/gzip" if gzip else _MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,30 +1,100 @@
 # backend/app/routers/interview.py
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, File, UploadFile, Form, Query, WebSocket, WebSocketDisconnect
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
-from typing import List
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional
+from datetime import datetime
+import asyncio
+import base64
+import json
+import logging
+import os
 
-from ..database import get_db
+from ..database import get_db, SessionLocal
+from ..logging_config import stage
 from .. import crud, schemas, models
-from ..routers.user import get_current_user
-from ..services import interview_service, audio_service  # 함수로 import
+from ..routers.user import get_current_user, get_user_from_token
+from ..services import interview_service, audio_service, stt_service, entitlement_service, resilience  # 함수로 import
+from ..services.entitlement_service import InsufficientCreditsError
 from ..services.gcs_service import GCSService
+from ..services.resilience import CircuitOpenError, DeadlineExceeded
 from app import crud  # 이 라인이 파일 상단에 있는지 확인
 
 router = APIRouter(tags=["interviews"])
+logger = logging.getLogger(__name__)
+
+# true면 첫 질문 오디오만 동기 생성하고 나머지는 백그라운드 prefetch / 첫 조회 시 생성
+LAZY_QUESTION_AUDIO = os.getenv("LAZY_QUESTION_AUDIO", "true").lower() == "true"
+# 백그라운드 prefetch 전체 시간 예산 (요청 마감과 별개)
+PREFETCH_DEADLINE_SECONDS = float(os.getenv("PREFETCH_DEADLINE_SECONDS", "300"))
+
+# 음성 답변 업로드 제한 (OpenAI 전사 API 파일 한도 25MB)
+STT_MAX_SEGMENT_BYTES = int(os.getenv("STT_MAX_SEGMENT_BYTES", str(5 * 1024 * 1024)))
+STT_MAX_SEGMENTS = int(os.getenv("STT_MAX_SEGMENTS", "120"))
+
+# 면접 세션 WebSocket - 하트비트 간격/허용 누락 횟수, 처리 대기 가능한 메시지 수
+SESSION_HEARTBEAT_SECONDS = float(os.getenv("SESSION_HEARTBEAT_SECONDS", "20"))
+SESSION_MAX_MISSED_HEARTBEATS = int(os.getenv("SESSION_MAX_MISSED_HEARTBEATS", "2"))
+SESSION_MAX_PENDING = int(os.getenv("SESSION_MAX_PENDING", "4"))
+# WebSocket 연결 후 인증 메시지를 기다리는 시간
+WS_AUTH_TIMEOUT_SECONDS = float(os.getenv("WS_AUTH_TIMEOUT_SECONDS", "10"))
+
+FINISH_MESSAGE = "감사합니다. 이로써 모의 면접은 끝났습니다."
+
+
+def ensure_question_audio(db: Session, question: models.Question) -> str:
+    """질문 오디오가 없으면 생성해서 저장 (질문별 single-flight)"""
+    if question.audio_url:
+        return question.audio_url
+
+    def _synthesize() -> str:
+        db.refresh(question)  # 다른 요청이 먼저 채웠을 수 있음
+        if question.audio_url:
+            return question.audio_url
+        audio_url = audio_service.synthesize_to_file(
+            question.text,
+            filename_hint=f"question-{question.index_num}-interview{question.interview_id}"
+        )
+        crud.set_question_audio_url(db, question.id, audio_url)
+        return audio_url
+
+    return audio_service.single_flight(f"question-audio-{question.id}", _synthesize)
+
+
+def prefetch_question_audio(question_ids: List[int]):
+    """백그라운드: 남은 질문 오디오를 index_num 순서대로 미리 생성"""
+    db = SessionLocal()
+    # BackgroundTasks는 요청 컨텍스트에서 실행되므로, 면접 생성에서 이미 소진된 요청 마감 대신 별도 마감을 쓴다
+    try:
+        with resilience.detached_deadline(PREFETCH_DEADLINE_SECONDS):
+            for question_id in question_ids:
+                question = crud.get_question(db, question_id)
+                if question is None:
+                    continue
+                try:
+                    ensure_question_audio(db, question)
+                except Exception as e:
+                    # 실패해도 첫 조회 시 다시 생성되므로 로그만 남김
+                    logger.warning(f"Question audio prefetch failed (question {question_id}): {e}")
+    finally:
+        db.close()
+
 
 @router.post("", response_model=schemas.InterviewOut)
 async def create_interview(
+    background_tasks: BackgroundTasks,
     company: str = Form(...),
     role: str = Form(...),
     resume_file: UploadFile = File(...),
     current_user: models.User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    # 디버깅용 로그 추가
-    print(f"Received data - company: {company}, role: {role}")
-    print(f"File info - filename: {resume_file.filename if resume_file else 'None'}")
+    # 디버깅용 로그 (DEBUG는 샘플링됨)
+    logger.debug("Create interview request", extra={"company": company, "role": role, "resume_filename": resume_file.filename if resume_file else None})
 
+    interview = None
+    charged = False
     try:
         # 파일 존재 및 파일명 검증 개선
         if not resume_file or not resume_file.filename:
@@ -39,33 +109,41 @@ async def create_interview(
         
         if len(content) == 0:
             raise HTTPException(status_code=400, detail="빈 파일은 업로드할 수 없습니다")
+
+        # Interview 생성 후 크레딧 차감 (조건부 UPDATE 1회) - 이후 단계가 실패하면 환불.
+        # 차감 내역은 면접 id로 남겨서, 요청이 인스턴스 종료로 끊겨도 기동 시 복구에서 환불된다
+        interview = crud.create_interview(db, current_user.id, company, role, resume_text=None)
+        entitlement_service.debit(
+            db, current_user.id, entitlement_service.INTERVIEW_CREDIT_COST, "interview",
+            reference=entitlement_service.interview_reference(interview.id),
+        )
+        charged = True
         
         # GCS에 파일 업로드
-        gcs_service = GCSService()
-        file_path, file_url = await gcs_service.upload_file(resume_file)
-        
-        # Interview 생성
-        interview = crud.create_interview_with_file(
-            db=db, 
-            user_id=current_user.id, 
-            company=company, 
-            role=role,
-            resume_file_path=file_path,
-            resume_file_url=file_url
-        )
+        with stage("upload"):
+            gcs_service = GCSService()
+            file_path, file_url = await gcs_service.upload_file(resume_file)
+        crud.set_resume_file(db, interview.id, file_path, file_url)
+        # 꼬리질문 컨텍스트용 이력서 텍스트 저장
+        resume_text = await run_in_threadpool(interview_service.extract_pdf_text, content)  # CPU 작업 - 이벤트 루프 밖에서
+        crud.set_resume_text(db, interview.id, resume_text)
         
         # PDF 기반 질문 생성 - 함수 직접 호출
-        questions_data = interview_service.generate_questions_from_pdf(
-            file_path, company, role
-        )
+        with stage("questions_llm"):
+            questions_data = await run_in_threadpool(
+                interview_service.generate_questions_from_pdf, file_path, company, role
+            )
         
         # 질문들을 데이터베이스에 저장
         for i, (index, question_text) in enumerate(questions_data):
-            # audio_service 함수 직접 호출
-            audio_url = audio_service.synthesize_to_file(
-                question_text, 
-                filename_hint=f"question-{index}-interview{interview.id}"
-            )
+            audio_url = None
+            if not LAZY_QUESTION_AUDIO:
+                # audio_service 함수 직접 호출
+                audio_url = await run_in_threadpool(
+                    audio_service.synthesize_to_file,
+                    question_text,
+                    filename_hint=f"question-{index}-interview{interview.id}"
+                )
             crud.create_question(
                 db=db,
                 interview_id=interview.id,
@@ -79,6 +157,13 @@ async def create_interview(
         db.refresh(interview)
         questions = crud.list_questions(db, interview_id=interview.id)
 
+        if LAZY_QUESTION_AUDIO and questions:
+            # 첫 질문만 바로 생성, 나머지는 응답 후 순서대로 prefetch
+            with stage("tts"):
+                await run_in_threadpool(ensure_question_audio, db, questions[0])
+            db.refresh(questions[0])
+            background_tasks.add_task(prefetch_question_audio, [q.id for q in questions[1:]])
+
         # InterviewOut 스키마에 맞게 반환
         return schemas.InterviewOut(
             id=interview.id,
@@ -96,13 +181,25 @@ async def create_interview(
             ) for q in questions]
         )
         
-    except HTTPException:
-        raise  # HTTPException은 그대로 재발생
+    except InsufficientCreditsError:
+        if interview is not None:
+            crud.delete_interview(db, interview.id)
+        raise  # 402
+    except (HTTPException, CircuitOpenError, DeadlineExceeded):
+        if charged:
+            entitlement_service.refund(
+                db, current_user.id, entitlement_service.INTERVIEW_CREDIT_COST, "interview",
+                reference=entitlement_service.interview_reference(interview.id),
+            )
+        raise  # HTTPException 및 503/504 대상 예외는 그대로 재발생
     except Exception as e:
-        # 상세한 에러 정보 출력
-        import traceback
-        error_details = traceback.format_exc()
-        print(f"Detailed error: {error_details}")
+        if charged:
+            entitlement_service.refund(
+                db, current_user.id, entitlement_service.INTERVIEW_CREDIT_COST, "interview",
+                reference=entitlement_service.interview_reference(interview.id),
+            )
+        # 상세한 에러 정보는 로그로만 남김
+        logger.error(f"Interview creation failed: {e}", exc_info=True)
         
         # 클라이언트에게는 안전한 메시지만 전달
         raise HTTPException(
@@ -111,6 +208,47 @@ async def create_interview(
 
         )
 
+def _encode_cursor(created_at: datetime, interview_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{interview_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str):
+    try:
+        created_at, interview_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(interview_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="잘못된 cursor 값입니다")
+
+
+@router.get("", response_model=schemas.InterviewPageOut)
+def list_interviews(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    company: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """면접 기록 목록 (최신순, cursor 기반 페이지네이션)"""
+    rows = crud.list_interview_summaries(
+        db,
+        user_id=current_user.id,
+        limit=limit + 1,  # 다음 페이지 존재 여부 확인용 1건 추가 조회
+        cursor=_decode_cursor(cursor) if cursor else None,
+        status=status,
+        company=company,
+    )
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1].created_at, rows[-1].id)
+    return schemas.InterviewPageOut(
+        items=[schemas.InterviewSummaryOut.model_validate(row) for row in rows],
+        next_cursor=next_cursor,
+    )
+
+
 @router.get("/{interview_id}", response_model=schemas.InterviewOut)
 def get_interview(interview_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
     itv = db.query(models.Interview).filter(models.Interview.id == interview_id, models.Interview.user_id == current_user.id).first()
@@ -127,6 +265,18 @@ def list_interview_questions(interview_id: int, db: Session = Depends(get_db), c
     return crud.list_questions(db, interview_id=interview_id)
 
 
+@router.get("/{interview_id}/questions/{question_id}/audio", response_model=schemas.QuestionOut)
+def get_question_audio(interview_id: int, question_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+    """질문 오디오 조회 - 아직 생성되지 않았으면 이 요청에서 생성 (prefetch와 중복 생성 없음)"""
+    itv = db.query(models.Interview).filter(models.Interview.id == interview_id, models.Interview.user_id == current_user.id).first()
+    q = db.query(models.Question).filter(models.Question.id == question_id, models.Question.interview_id == interview_id).first()
+    if not itv or not q:
+        raise HTTPException(status_code=404, detail="Question/Interview not found")
+    ensure_question_audio(db, q)
+    db.refresh(q)
+    return q
+
+
 # 다른 라우터 함수들도 함수 직접 호출로 수정
 @router.post("/answer", response_model=schemas.FollowupOut)
 def submit_answer(req: schemas.AnswerCreate, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
@@ -136,15 +286,395 @@ def submit_answer(req: schemas.AnswerCreate, db: Session = Depends(get_db), curr
     if not q or not itv:
         raise HTTPException(status_code=404, detail="Question/Interview not found")
 
-    # Save answer
-    crud.create_answer(db, question_id=q.id, user_id=current_user.id, text=req.answer_text)
+    # 크레딧 차감 - 꼬리질문 생성이 실패하면 환불
+    with entitlement_service.charge(db, current_user.id, entitlement_service.ANSWER_CREDIT_COST, "answer"):
+        # Save answer
+        crud.create_answer(db, question_id=q.id, user_id=current_user.id, text=req.answer_text)
+
+        follow = create_followup_question(db, itv, q, req.answer_text)
+    return {"question": follow}
+
+
+def create_followup_question(db: Session, itv: models.Interview, q: models.Question, answer_text: str) -> models.Question:
+    """저장된 답변에 대한 꼬리질문 1개 생성 (텍스트/음성 답변 공용)"""
+    # 이전 턴(방금 저장한 답변 제외)을 컨텍스트로 전달
+    history = crud.list_turns(db, interview_id=itv.id)[:-1]
 
     # Generate exactly one follow-up for this answer - 함수 직접 호출
-    follow_text = interview_service.generate_followup(previous_question=q.text, answer_text=req.answer_text)
-    follow_audio_url = audio_service.synthesize_to_file(follow_text, filename_hint=f"followup-q{q.index_num}-interview{itv.id}")
-    follow = crud.create_question(db, interview_id=itv.id, index_num=q.index_num, text=follow_text, is_followup=True, audio_url=follow_audio_url)
+    with stage("followup_llm"):
+        follow_text = interview_service.generate_followup(
+            previous_question=q.text,
+            answer_text=answer_text,
+            company=itv.company,
+            role=itv.role,
+            resume_text=itv.resume_text,
+            history=history,
+        )
+    with stage("tts"):
+        follow_audio_url = audio_service.synthesize_to_file(follow_text, filename_hint=f"followup-q{q.index_num}-interview{itv.id}")
+    return crud.create_question(db, interview_id=itv.id, index_num=q.index_num, text=follow_text, is_followup=True, audio_url=follow_audio_url)
 
-    return {"question": follow}
+
+def _get_owned_question(db: Session, interview_id: int, question_id: int, user_id: int):
+    q = db.query(models.Question).filter(models.Question.id == question_id, models.Question.interview_id == interview_id).first()
+    itv = db.query(models.Interview).filter(models.Interview.id == interview_id, models.Interview.user_id == user_id).first()
+    return itv, q
+
+
+async def _receive_auth_token(websocket: WebSocket) -> Optional[str]:
+    """
+    연결 직후 첫 메시지 {"type": "auth", "token"} 에서 JWT를 꺼낸다 (형식이 다르거나 시간 초과면 None).
+    토큰을 URL 쿼리로 받으면 Cloud Run 요청 로그에 그대로 남기 때문
+    """
+    try:
+        data = await asyncio.wait_for(websocket.receive_json(), timeout=WS_AUTH_TIMEOUT_SECONDS)
+    except (asyncio.TimeoutError, KeyError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("type") != "auth" or not isinstance(data.get("token"), str):
+        return None
+    return data["token"]
+
+
+def _owned_question_user(db: Session, token: str, interview_id: int, question_id: int) -> Optional[int]:
+    """토큰 사용자가 질문의 면접 소유자면 user_id"""
+    user = get_user_from_token(db, token)
+    if user is None:
+        return None
+    itv, q = _get_owned_question(db, interview_id, question_id, user.id)
+    return user.id if itv and q else None
+
+
+@router.websocket("/{interview_id}/questions/{question_id}/answer/stream")
+async def stream_spoken_answer(
+    websocket: WebSocket,
+    interview_id: int,
+    question_id: int,
+    audio_format: str = Query("webm", alias="format"),
+):
+    """
+    음성 답변 스트리밍 업로드 (녹음 중 세그먼트 단위 전사)
+
+    - client → {"type": "auth", "token"}: 연결 직후 첫 메시지 (실패 시 1008로 종료)
+    - client → binary: 단독으로 디코딩 가능한 오디오 세그먼트
+    - client → text {"type": "end"}: 녹음 종료
+    - server → {"type": "partial", "seq", "text"}: 세그먼트 전사 결과 (도착 순서와 무관)
+    - server → {"type": "final", "answer_id", "text"}: 최종 transcript 저장 완료
+    - server → {"type": "followup", "question"}: 꼬리질문 (QuestionOut)
+    - server → {"type": "error", "detail"}: 전사/꼬리질문 실패 (이후 연결 종료)
+    """
+    session = None
+    partial_tasks = []
+    try:
+        await websocket.accept()
+        # 인증/소유권 확인용 세션은 바로 닫는다 - 녹음하는 동안 DB 커넥션을 잡고 있지 않도록
+        token = await _receive_auth_token(websocket)
+        user_id = await _with_db(_owned_question_user, token, interview_id, question_id) if token else None
+        if user_id is None:
+            await websocket.close(code=1008)
+            return
+
+        send_lock = asyncio.Lock()
+
+        async def send(message: dict):
+            async with send_lock:
+                await websocket.send_json(message)
+
+        async def report_partial(seq: int, fut):
+            try:
+                text = await asyncio.wrap_future(fut)
+            except Exception:
+                return  # 실패는 finalize 단계에서 한 번에 보고
+            await send({"type": "partial", "seq": seq, "text": text})
+
+        session = stt_service.TranscriptionSession(audio_format=audio_format)
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                session.cancel()
+                return
+            if message.get("bytes") is not None:
+                audio = message["bytes"]
+                if len(audio) > STT_MAX_SEGMENT_BYTES or session.segment_count >= STT_MAX_SEGMENTS:
+                    session.cancel()
+                    await send({"type": "error", "detail": "오디오 업로드 한도를 초과했습니다"})
+                    await websocket.close(code=1009)
+                    return
+                seq, fut = session.add_segment(audio)
+                partial_tasks.append(asyncio.create_task(report_partial(seq, fut)))
+            elif message.get("text") is not None:
+                try:
+                    data = json.loads(message["text"])
+                except ValueError:
+                    continue
+                if data.get("type") == "end":
+                    break
+
+        # 녹음이 끝나면 남은 세그먼트 전사만 기다렸다가 바로 답변 저장 → 꼬리질문 생성
+        try:
+            transcript = await run_in_threadpool(session.finalize)
+        except Exception as e:
+            logger.warning(f"Spoken answer transcription failed (question {question_id}): {e}")
+            await send({"type": "error", "detail": "음성 인식 중 오류가 발생했습니다"})
+            await websocket.close(code=1011)
+            return
+        await asyncio.gather(*partial_tasks)
+        if not transcript:
+            await send({"type": "error", "detail": "음성을 인식하지 못했습니다"})
+            await websocket.close(code=1000)
+            return
+
+        # 저장/꼬리질문 생성용 세션은 전사가 끝난 뒤에 연다
+        db = SessionLocal()
+        try:
+            cost = entitlement_service.ANSWER_CREDIT_COST
+            try:
+                await run_in_threadpool(entitlement_service.debit, db, user_id, cost, "answer")
+            except InsufficientCreditsError:
+                await send({"type": "error", "detail": "크레딧이 부족합니다"})
+                await websocket.close(code=1008)
+                return
+            try:
+                itv, q = await run_in_threadpool(_get_owned_question, db, interview_id, question_id, user_id)
+                answer = await run_in_threadpool(crud.create_answer, db, q.id, user_id, transcript)
+                await send({"type": "final", "answer_id": answer.id, "text": transcript})
+
+                follow = await run_in_threadpool(create_followup_question, db, itv, q, transcript)
+            except (WebSocketDisconnect, asyncio.CancelledError):
+                await run_in_threadpool(entitlement_service.refund, db, user_id, cost, "answer")
+                raise
+            except Exception as e:
+                logger.warning(f"Spoken answer follow-up failed (question {question_id}): {e}")
+                await run_in_threadpool(entitlement_service.refund, db, user_id, cost, "answer")
+                await send({"type": "error", "detail": "꼬리질문 생성 중 오류가 발생했습니다"})
+                await websocket.close(code=1011)
+                return
+            await send({"type": "followup", "question": schemas.QuestionOut.model_validate(follow).model_dump()})
+        finally:
+            db.close()
+        await websocket.close(code=1000)
+    except WebSocketDisconnect:
+        if session is not None:
+            session.cancel()
+    finally:
+        for task in partial_tasks:
+            task.cancel()
+
+
+async def _next_in_thread(it):
+    """동기 iterator의 다음 값을 스레드풀에서 가져온다 (끝나면 None)"""
+    return await run_in_threadpool(next, it, None)
+
+
+async def _with_db(fn, *args):
+    """
+    fn(db, *args)를 짧은 DB 세션에서 스레드풀로 실행.
+    오래 열려 있는 WebSocket이 유휴 중에 풀 커넥션을 잡고 있지 않도록 작업마다 세션을 열고 닫는다
+    (반환값은 세션 밖에서 쓰이므로 ORM 객체가 아닌 값이어야 한다)
+    """
+    def run():
+        db = SessionLocal()
+        try:
+            return fn(db, *args)
+        finally:
+            db.close()
+
+    return await run_in_threadpool(run)
+
+
+def _load_session_state(db: Session, token: str, interview_id: int):
+    """세션 시작 시 필요한 값만 복사 - (user_id, interview 정보, 질문 목록) / 권한이 없으면 None"""
+    user = get_user_from_token(db, token)
+    if user is None:
+        return None
+    itv = db.query(models.Interview).filter(models.Interview.id == interview_id, models.Interview.user_id == user.id).first()
+    if itv is None:
+        return None
+    interview = {"company": itv.company, "role": itv.role, "resume_text": itv.resume_text, "status": itv.status}
+    questions = [schemas.QuestionOut.model_validate(q) for q in crud.list_questions(db, interview_id)]
+    return user.id, interview, questions
+
+
+@router.websocket("/{interview_id}/session")
+async def interview_session(websocket: WebSocket, interview_id: int):
+    """
+    면접 세션 채널 - 연결 시 한 번만 인증/소유권 확인하고, 이후 턴은 같은 연결에서 처리
+
+    - client → {"type": "auth", "token"}: 연결 직후 첫 메시지 (실패 시 1008로 종료)
+    - client → {"type": "answer", "question_id", "answer_text"}
+    - client → {"type": "finish"}: 면접 종료 (POST /{interview_id}/finish 와 동일)
+    - client ↔ {"type": "ping"} / {"type": "pong"}: 하트비트 (서버는 유휴 상태가 길어지면 ping, 응답이 없으면 종료)
+    - server → {"type": "ready", "questions"}: 현재 질문 목록 (QuestionOut)
+    - server → {"type": "answer_saved", "question_id", "answer_id"}
+    - server → {"type": "followup_delta", "text"}: 꼬리질문 텍스트 조각
+    - server → {"type": "followup", "question"}: 저장된 꼬리질문 (QuestionOut, audio_url은 audio_end에서 전달)
+    - server → {"type": "audio_start", "question_id", "format"}, binary 오디오 청크, {"type": "audio_end", "question_id", "audio_url"}
+    - server → {"type": "error", "detail"}: 해당 턴만 실패, 세션은 유지
+
+    면접/질문은 연결 시 값으로 복사해 두고, DB 작업은 작업마다 짧은 세션에서 실행한다 (_with_db)
+    """
+    try:
+        await websocket.accept()
+        token = await _receive_auth_token(websocket)
+        state = await _with_db(_load_session_state, token, interview_id) if token else None
+        if state is None:
+            await websocket.close(code=1008)
+            return
+        user_id, interview, question_list = state
+        questions = {q.id: q for q in question_list}
+
+        # 처리 중인 턴이 있으면 메시지는 여기서 대기 - 가득 차면 거절
+        inbox: asyncio.Queue = asyncio.Queue(maxsize=SESSION_MAX_PENDING)
+        send_lock = asyncio.Lock()
+
+        async def send(message: dict):
+            async with send_lock:
+                await websocket.send_json(message)
+
+        async def send_bytes(data: bytes):
+            # 클라이언트가 느리면 여기서 대기하고, 그동안 TTS 스트림도 더 읽지 않는다
+            async with send_lock:
+                await websocket.send_bytes(data)
+
+        async def receive_loop() -> bool:
+            """클라이언트 메시지 수신 + 하트비트. 하트비트 응답이 없어 끝났으면 True"""
+            missed = 0
+            try:
+                while True:
+                    try:
+                        message = await asyncio.wait_for(websocket.receive(), timeout=SESSION_HEARTBEAT_SECONDS)
+                    except asyncio.TimeoutError:
+                        missed += 1
+                        if missed > SESSION_MAX_MISSED_HEARTBEATS:
+                            logger.info(f"Interview session {interview_id} timed out")
+                            return True
+                        await send({"type": "ping"})
+                        continue
+                    missed = 0
+                    if message["type"] == "websocket.disconnect":
+                        return False
+                    if message.get("text") is None:
+                        continue
+                    try:
+                        data = json.loads(message["text"])
+                    except ValueError:
+                        await send({"type": "error", "detail": "잘못된 메시지 형식입니다"})
+                        continue
+                    if data.get("type") == "ping":
+                        await send({"type": "pong"})
+                    elif data.get("type") == "pong":
+                        continue
+                    else:
+                        try:
+                            inbox.put_nowait(data)
+                        except asyncio.QueueFull:
+                            await send({"type": "error", "detail": "이전 답변을 처리하는 중입니다"})
+            finally:
+                # 연결이 끊기면 대기 중인 답변은 처리하지 않는다 (크레딧 차감 방지)
+                while not inbox.empty():
+                    inbox.get_nowait()
+                inbox.put_nowait(None)
+
+        async def handle_answer(data: dict):
+            q = questions.get(data.get("question_id"))
+            answer_text = (data.get("answer_text") or "").strip()
+            if q is None:
+                await send({"type": "error", "detail": "Question not found"})
+                return
+            if not answer_text:
+                await send({"type": "error", "detail": "답변이 비어 있습니다"})
+                return
+            if interview["status"] == "finished":
+                await send({"type": "error", "detail": "이미 종료된 면접입니다"})
+                return
+
+            cost = entitlement_service.ANSWER_CREDIT_COST
+            try:
+                await _with_db(entitlement_service.debit, user_id, cost, "answer")
+            except InsufficientCreditsError:
+                await send({"type": "error", "detail": "크레딧이 부족합니다"})
+                return
+
+            chunks = None
+            try:
+                answer_id = await _with_db(lambda db: crud.create_answer(db, q.id, user_id, answer_text).id)
+                await send({"type": "answer_saved", "question_id": q.id, "answer_id": answer_id})
+
+                history = (await _with_db(crud.list_turns, interview_id))[:-1]
+                chunks = interview_service.stream_followup(
+                    previous_question=q.text,
+                    answer_text=answer_text,
+                    company=interview["company"],
+                    role=interview["role"],
+                    resume_text=interview["resume_text"],
+                    history=history,
+                )
+                parts = []
+                while (delta := await _next_in_thread(chunks)) is not None:
+                    parts.append(delta)
+                    await send({"type": "followup_delta", "text": delta})
+                follow_text = "".join(parts).strip()
+                if not follow_text:
+                    raise ValueError("빈 꼬리질문")
+                follow = await _with_db(lambda db: schemas.QuestionOut.model_validate(
+                    crud.create_question(db, interview_id, q.index_num, follow_text, True, None)
+                ))
+            except (WebSocketDisconnect, asyncio.CancelledError):
+                await _with_db(entitlement_service.refund, user_id, cost, "answer")
+                raise
+            except Exception as e:
+                logger.warning(f"Interview session {interview_id} follow-up failed: {e}")
+                await _with_db(entitlement_service.refund, user_id, cost, "answer")
+                await send({"type": "error", "detail": "꼬리질문 생성 중 오류가 발생했습니다"})
+                return
+            finally:
+                if chunks is not None:
+                    await run_in_threadpool(chunks.close)
+
+            questions[follow.id] = follow
+            await send({"type": "followup", "question": follow.model_dump()})
+
+            # 꼬리질문 음성은 받는 대로 바로 전달 - 실패해도 질문은 저장되어 있으므로
+            # GET /{interview_id}/questions/{question_id}/audio 에서 다시 생성된다
+            out_path, audio_url = audio_service.new_audio_file(f"followup-q{q.index_num}-interview{interview_id}")
+            audio = audio_service.stream_to_file(follow_text, out_path)
+            try:
+                await send({"type": "audio_start", "question_id": follow.id, "format": audio_service.OPENAI_TTS_FORMAT})
+                while (chunk := await _next_in_thread(audio)) is not None:
+                    await send_bytes(chunk)
+                await _with_db(crud.set_question_audio_url, follow.id, audio_url)
+                questions[follow.id] = follow.model_copy(update={"audio_url": audio_url})
+                await send({"type": "audio_end", "question_id": follow.id, "audio_url": audio_url})
+            except WebSocketDisconnect:
+                raise
+            except Exception as e:
+                logger.warning(f"Interview session {interview_id} follow-up audio failed: {e}")
+                await send({"type": "error", "detail": "꼬리질문 음성 생성 중 오류가 발생했습니다"})
+            finally:
+                await run_in_threadpool(audio.close)
+
+        receiver = asyncio.create_task(receive_loop())
+        try:
+            await send({"type": "ready", "questions": [q.model_dump() for q in questions.values()]})
+            while True:
+                data = await inbox.get()
+                if data is None:
+                    if receiver.result():
+                        await websocket.close(code=1001)
+                    break
+                if data.get("type") == "answer":
+                    await handle_answer(data)
+                elif data.get("type") == "finish":
+                    await _with_db(crud.set_interview_status, interview_id, "finished")
+                    interview["status"] = "finished"
+                    await send({"type": "finished", "message": FINISH_MESSAGE, "status": "finished"})
+                    await websocket.close(code=1000)
+                    break
+                else:
+                    await send({"type": "error", "detail": "알 수 없는 메시지입니다"})
+        finally:
+            receiver.cancel()
+    except WebSocketDisconnect:
+        pass
 
 
 @router.post("/{interview_id}/finish")
@@ -153,4 +683,4 @@ def finish_interview(interview_id: int, db: Session = Depends(get_db), current_u
     if not itv:
         raise HTTPException(status_code=404, detail="Interview not found")
     crud.set_interview_status(db, interview_id, "finished")
-    return {"message": "감사합니다. 이로써 모의 면접은 끝났습니다.", "status": "finished"}
+    return {"message": FINISH_MESSAGE, "status": "finished"}
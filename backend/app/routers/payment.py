@@ -2,20 +2,44 @@
 from fastapi import APIRouter, HTTPException, Depends, Form
 from sqlalchemy.orm import Session
 from ..database import get_db
+from ..routers.user import get_current_user
+from ..services import entitlement_service
 import os
 
 
 router = APIRouter(prefix="/payments", tags=["payments"])
 
+# 실제 결제 게이트웨이 검증이 붙기 전까지는 크레딧 적립을 막아 둔다
+# (켜면 검증 없이 session_id만으로 적립되므로 로컬/테스트 전용)
+PAYMENT_GRANTS_ENABLED = os.getenv("PAYMENT_GRANTS_ENABLED", "false").lower() == "true"
+
 
 # Placeholder: integrate Stripe/Bootpay/Cloud Payments as needed.
-# This route can verify payment session and mark entitlement in DB.
+# This route verifies the payment session and grants credits in the usage ledger.
 
 
 @router.post("/verify")
-def verify_payment(session_id: str = Form(...), db: Session = Depends(get_db)):
+def verify_payment(session_id: str = Form(...), db: Session = Depends(get_db), current_user=Depends(get_current_user)):
     # TODO: implement real gateway verification
+    if not PAYMENT_GRANTS_ENABLED:
+        raise HTTPException(status_code=501, detail="결제 검증이 아직 지원되지 않습니다")
     if not session_id:
         raise HTTPException(status_code=400, detail="Missing session_id")
-    # Assume verification succeeded
-    return {"status": "verified", "session_id": session_id}
+    # Assume verification succeeded (PAYMENT_GRANTS_ENABLED=true 인 로컬/테스트 환경에서만)
+    # 같은 session_id는 ledger의 (reason, reference) 유니크 제약으로 한 번만 적립됨
+    credits = entitlement_service.grant(
+        db, current_user.id, entitlement_service.PAYMENT_CREDIT_GRANT, "payment", reference=session_id
+    )
+    if credits is None:
+        return {
+            "status": "already_verified",
+            "session_id": session_id,
+            "credits": entitlement_service.get_credits(db, current_user.id),
+        }
+    return {"status": "verified", "session_id": session_id, "credits": credits}
+
+
+@router.get("/credits")
+def get_credits(db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+    """남은 크레딧 조회"""
+    return {"credits": entitlement_service.get_credits(db, current_user.id)}
@@ -8,6 +8,7 @@ from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 
 from ..database import get_db
 from .. import crud, schemas
+from ..services import entitlement_service
 
 import os
 
@@ -36,18 +37,22 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
-def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)):
-    cred_exc = HTTPException(status_code=401, detail="Could not validate credentials")
+def get_user_from_token(db: Session, token: str):
+    """JWT 검증 후 사용자 반환 (실패 시 None) - WebSocket 등 OAuth2 의존성을 못 쓰는 곳에서도 사용"""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise cred_exc
     except JWTError:
-        raise cred_exc
-    user = crud.get_user_by_email(db, email=email)
+        return None
+    email: str = payload.get("sub")
+    if email is None:
+        return None
+    return crud.get_user_by_email(db, email=email)
+
+
+def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)):
+    user = get_user_from_token(db, token)
     if user is None:
-        raise cred_exc
+        raise HTTPException(status_code=401, detail="Could not validate credentials")
     return user
 
 
@@ -56,6 +61,7 @@ def register(req: schemas.UserCreate, db: Session = Depends(get_db)):
     if crud.get_user_by_email(db, email=req.email):
         raise HTTPException(status_code=400, detail="Email already registered")
     user = crud.create_user(db, email=req.email, hashed_password=hash_password(req.password))
+    entitlement_service.grant_signup_credits(db, user.id)
     return user
 
 
@@ -56,6 +56,23 @@ class InterviewOut(BaseModel):
 
 
 
+class InterviewSummaryOut(BaseModel):
+    id: int
+    company: str
+    role: str
+    status: str
+    created_at: datetime
+    question_count: int = 0
+    answer_count: int = 0
+    class Config:
+        from_attributes = True
+
+
+class InterviewPageOut(BaseModel):
+    items: List[InterviewSummaryOut] = []
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 그대로 전달
+
+
 class AnswerCreate(BaseModel):
     interview_id: int
     question_id: int
@@ -64,3 +81,30 @@ class AnswerCreate(BaseModel):
 
 class FollowupOut(BaseModel):
     question: QuestionOut
+
+
+class InterviewBatchItemOut(BaseModel):
+    id: int
+    filename: str
+    status: str
+    interview_id: Optional[int] = None
+    error: Optional[str] = None
+    class Config:
+        from_attributes = True
+
+
+class InterviewBatchOut(BaseModel):
+    id: int
+    company: str
+    role: str
+    status: str
+    total: int
+    completed: int
+    failed: int
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    resumes_per_minute: Optional[float] = None
+    items: List[InterviewBatchItemOut] = []
+    class Config:
+        from_attributes = True
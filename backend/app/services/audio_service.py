@@ -1,46 +1,146 @@
 # backend/app/services/audio_service.py
 import os
 import uuid
+import threading
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Iterator, Optional, Tuple, TypeVar
 
 from fastapi.responses import StreamingResponse
 
-# OpenAI official SDK
-from openai import OpenAI
+from . import resilience
+from .openai_client import get_client
 
 MEDIA_DIR = Path(os.getenv("MEDIA_DIR", "./media"))
 
 AUDIO_DIR = MEDIA_DIR / "audio"
-AUDIO_DIR.mkdir(parents=True, exist_ok=True)
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_TTS_MODEL = os.getenv("OPENAI_TTS_MODEL", "tts-1")
 OPENAI_TTS_VOICE = os.getenv("OPENAI_TTS_VOICE", "alloy")
 OPENAI_TTS_FORMAT = os.getenv("OPENAI_TTS_FORMAT", "mp3")
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+TTS_POLICY = resilience.CallPolicy(
+    name="tts",
+    timeout=float(os.getenv("OPENAI_TTS_TIMEOUT", "20")),
+    max_attempts=3,
+    hedge=True,
+)
+# 스트리밍 응답은 중간에 취소할 수 없어 hedge 하지 않는다
+TTS_STREAM_POLICY = resilience.CallPolicy(
+    name="tts.stream",
+    timeout=float(os.getenv("OPENAI_TTS_TIMEOUT", "20")),
+    max_attempts=2,
+)
+TTS_STREAM_CHUNK_BYTES = int(os.getenv("TTS_STREAM_CHUNK_BYTES", str(16 * 1024)))
+
+
+def ensure_audio_dir() -> Path:
+    """오디오 저장 디렉토리 생성 (워커 시작 시 호출)"""
+    AUDIO_DIR.mkdir(parents=True, exist_ok=True)
+    return AUDIO_DIR
 
 
 def synthesize_to_file(text: str, filename_hint: Optional[str] = None) -> str:
     """
     Create TTS audio file and save under AUDIO_DIR. Returns public path (to be served by static).
     """
-    fname = f"{filename_hint or 'tts'}-{uuid.uuid4().hex}.{OPENAI_TTS_FORMAT}"
-    out_path = AUDIO_DIR / fname
+    out_path, audio_url = new_audio_file(filename_hint)
+
+    # 시도마다 바이트를 받아오고, 먼저 성공한 결과만 파일로 기록 (hedge 시 파일 경합 방지)
+    def _fetch(timeout: float) -> bytes:
+        response = get_client().with_options(timeout=timeout, max_retries=0).audio.speech.create(
+            model=OPENAI_TTS_MODEL,
+            voice=OPENAI_TTS_VOICE,
+            response_format=OPENAI_TTS_FORMAT,
+            input=text,
+        )
+        return response.content
 
-    # Non-streaming simple generation to file
-    with client.audio.speech.with_streaming_response.create(
-        model=OPENAI_TTS_MODEL,
-        voice=OPENAI_TTS_VOICE,
-        response_format=OPENAI_TTS_FORMAT,
-        input=text,
-    ) as response:
-        response.stream_to_file(out_path)
+    out_path.write_bytes(resilience.call(TTS_POLICY, _fetch))
+    return audio_url
 
+
+def new_audio_file(filename_hint: Optional[str] = None) -> Tuple[Path, str]:
+    """새 오디오 파일 경로와 공개 URL"""
+    fname = f"{filename_hint or 'tts'}-{uuid.uuid4().hex}.{OPENAI_TTS_FORMAT}"
     # 백엔드 서버 URL을 포함한 절대 경로 반환
     backend_url = os.getenv("BACKEND_URL", "http://localhost:8000")
-    return f"{backend_url}/media/audio/{fname}"
+    return AUDIO_DIR / fname, f"{backend_url}/media/audio/{fname}"
+
+
+def iter_speech(text: str, chunk_size: int = TTS_STREAM_CHUNK_BYTES) -> Iterator[bytes]:
+    """TTS 오디오를 받는 대로 청크 단위로 반환"""
+    def _open(timeout: float):
+        return get_client().with_options(timeout=timeout, max_retries=0).audio.speech.with_streaming_response.create(
+            model=OPENAI_TTS_MODEL,
+            voice=OPENAI_TTS_VOICE,
+            response_format=OPENAI_TTS_FORMAT,
+            input=text,
+        ).__enter__()
+
+    response = resilience.call(TTS_STREAM_POLICY, _open)
+    try:
+        yield from response.iter_bytes(chunk_size=chunk_size)
+    finally:
+        response.close()
+
+
+def stream_to_file(text: str, out_path: Path) -> Iterator[bytes]:
+    """TTS 오디오 청크를 반환하면서 out_path에도 기록 (중간에 실패하면 파일 삭제)"""
+    tmp_path = out_path.with_name(out_path.name + ".part")
+    completed = False
+    try:
+        with open(tmp_path, "wb") as f:
+            for chunk in iter_speech(text):
+                f.write(chunk)
+                yield chunk
+        tmp_path.replace(out_path)
+        completed = True
+    finally:
+        if not completed:
+            tmp_path.unlink(missing_ok=True)
+
+
+T = TypeVar("T")
+
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _reset_after_fork():
+    global _inflight, _inflight_lock
+    _inflight = {}
+    _inflight_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def single_flight(key: str, fn: Callable[[], T]) -> T:
+    """
+    같은 key에 대한 동시 호출을 하나로 합친다.
+    먼저 들어온 호출만 fn을 실행하고 나머지는 그 결과(또는 예외)를 기다린다.
+    """
+    with _inflight_lock:
+        fut = _inflight.get(key)
+        owner = fut is None
+        if owner:
+            fut = Future()
+            _inflight[key] = fut
+    if not owner:
+        return fut.result()
+
+    try:
+        result = fn()
+        fut.set_result(result)
+        return result
+    except BaseException as e:
+        fut.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
 
 
 def stream_tts(text: str):
@@ -49,13 +149,4 @@ def stream_tts(text: str):
     """
     # reference implementation uses chunk streaming similar to community examples
     # Frontend can reconstruct blobs between |AUDIO_START| and |AUDIO_END|
-    def _gen():
-        with client.audio.speech.with_streaming_response.create(
-            model=OPENAI_TTS_MODEL,
-            voice=OPENAI_TTS_VOICE,
-            response_format=OPENAI_TTS_FORMAT,
-            input=text,
-        ) as response:
-            for chunk in response.iter_bytes(chunk_size=1024):
-                yield chunk
-    return StreamingResponse(_gen(), media_type=f"audio/{OPENAI_TTS_FORMAT}")
+    return StreamingResponse(iter_speech(text, chunk_size=1024), media_type=f"audio/{OPENAI_TTS_FORMAT}")
@@ -0,0 +1,207 @@
+# backend/app/services/batch_service.py
+"""
+채용 담당자용 일괄 면접 생성 파이프라인
+
+이력서마다 업로드 → 질문 생성(LLM) → 질문 음성(TTS) 단계를 거치며,
+각 단계의 동시 실행 수는 워커 프로세스 단위로 제한된다 (한 워커 안에서 여러 배치가 동시에 돌아도 부하가 일정,
+인스턴스 전체 상한은 BATCH_*_CONCURRENCY × gunicorn 워커 수).
+완료된 결과는 BATCH_WRITE_CHUNK 건씩 모아 bulk INSERT 로 저장한다.
+
+배치는 응답 후 같은 프로세스에서 실행되므로 인스턴스가 중간에 종료되면 멈춘다.
+BATCH_STALE_SECONDS 가 지나도 끝나지 않은 배치는 recover_stale_batches 가 실패 처리하고 남은 크레딧을 환불한다
+(환불은 배치별 reference 로 한 번만 적립).
+"""
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from .. import crud
+from ..database import SessionLocal
+from . import audio_service, entitlement_service, interview_service, resilience
+from .gcs_service import GCSService
+
+logger = logging.getLogger(__name__)
+
+BATCH_MAX_FILES = int(os.getenv("BATCH_MAX_FILES", "50"))
+BATCH_ITEM_CONCURRENCY = int(os.getenv("BATCH_ITEM_CONCURRENCY", "8"))
+BATCH_UPLOAD_CONCURRENCY = int(os.getenv("BATCH_UPLOAD_CONCURRENCY", "8"))
+BATCH_LLM_CONCURRENCY = int(os.getenv("BATCH_LLM_CONCURRENCY", "4"))
+BATCH_TTS_CONCURRENCY = int(os.getenv("BATCH_TTS_CONCURRENCY", "8"))
+BATCH_WRITE_CHUNK = int(os.getenv("BATCH_WRITE_CHUNK", "10"))
+BATCH_ITEM_DEADLINE_SECONDS = float(os.getenv("BATCH_ITEM_DEADLINE_SECONDS", "600"))
+# 이 시간이 지나도 끝나지 않은 배치는 중단된 것으로 본다
+BATCH_STALE_SECONDS = float(os.getenv("BATCH_STALE_SECONDS", "3600"))
+
+
+@dataclass
+class BatchFile:
+    item_id: int
+    filename: str
+    content: bytes
+    content_type: Optional[str] = None
+
+
+class _StageLimits:
+    def __init__(self):
+        self.upload = threading.BoundedSemaphore(BATCH_UPLOAD_CONCURRENCY)
+        self.llm = threading.BoundedSemaphore(BATCH_LLM_CONCURRENCY)
+        self.tts_executor = ThreadPoolExecutor(max_workers=BATCH_TTS_CONCURRENCY, thread_name_prefix="batch-tts")
+
+
+_limits: Optional[_StageLimits] = None
+_limits_lock = threading.Lock()
+
+
+def _get_limits() -> _StageLimits:
+    global _limits
+    with _limits_lock:
+        if _limits is None:
+            _limits = _StageLimits()
+        return _limits
+
+
+def _reset_after_fork():
+    global _limits, _limits_lock
+    _limits = None
+    _limits_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _set_item_status(item_id: int, status: str, **values) -> None:
+    db = SessionLocal()
+    try:
+        crud.update_batch_item(db, item_id, status=status, **values)
+    finally:
+        db.close()
+
+
+def _process_item(batch_id: int, f: BatchFile, company: str, role: str) -> dict:
+    """이력서 1건 처리 - DB 저장 직전까지의 결과를 반환"""
+    limits = _get_limits()
+    with resilience.detached_deadline(BATCH_ITEM_DEADLINE_SECONDS):
+        _set_item_status(f.item_id, "uploading")
+        with limits.upload:
+            file_path, file_url = GCSService().upload_bytes(f.content, f.filename, f.content_type)
+
+        _set_item_status(f.item_id, "generating")
+        resume_text = interview_service.extract_pdf_text(f.content)
+        with limits.llm:
+            questions = interview_service.generate_questions_from_pdf(file_path, company, role, file_content=f.content)
+
+        _set_item_status(f.item_id, "synthesizing")
+        futures = [
+            limits.tts_executor.submit(
+                audio_service.synthesize_to_file, text, filename_hint=f"question-{index}-batch{batch_id}-item{f.item_id}"
+            )
+            for index, text in questions
+        ]
+        audio_urls = [fut.result() for fut in futures]
+
+    return {
+        "item_id": f.item_id,
+        "resume_file_path": file_path,
+        "resume_file_url": file_url,
+        "resume_text": resume_text,
+        "questions": [(index, text, url) for (index, text), url in zip(questions, audio_urls)],
+    }
+
+
+def run_batch(batch_id: int, user_id: int, company: str, role: str, files: List[BatchFile]) -> None:
+    """배치 전체 실행 (BackgroundTasks에서 호출)"""
+    db = SessionLocal()
+    completed = failed = 0
+    pending: List[dict] = []
+
+    def flush():
+        nonlocal completed
+        if not pending:
+            return
+        crud.bulk_create_interviews(db, user_id, company, role, pending)
+        completed += len(pending)
+        pending.clear()
+        crud.update_batch(db, batch_id, completed=completed, failed=failed)
+
+    try:
+        crud.update_batch(db, batch_id, status="running", started_at=datetime.now(timezone.utc))
+        with ThreadPoolExecutor(max_workers=BATCH_ITEM_CONCURRENCY, thread_name_prefix="batch-item") as executor:
+            futures = {executor.submit(_process_item, batch_id, f, company, role): f for f in files}
+            for fut in as_completed(futures):
+                f = futures[fut]
+                try:
+                    pending.append(fut.result())
+                except Exception as e:
+                    failed += 1
+                    logger.warning(f"Batch {batch_id} item {f.item_id} failed: {e}")
+                    crud.update_batch_item(db, f.item_id, status="failed", error=str(e)[:1000])
+                    crud.update_batch(db, batch_id, failed=failed)
+                if len(pending) >= BATCH_WRITE_CHUNK:
+                    flush()
+        flush()
+    except Exception as e:
+        logger.error(f"Batch {batch_id} aborted: {e}", exc_info=True)
+        db.rollback()
+        failed = len(files) - completed
+        crud.fail_unfinished_batch_items(db, batch_id, error=str(e)[:1000])
+    finally:
+        # 중단 복구가 먼저 마무리(환불 포함)한 배치면 다시 환불하지 않는다
+        if crud.finish_batch(db, batch_id, completed=completed, failed=failed, finished_at=datetime.now(timezone.utc)) and failed:
+            entitlement_service.refund(
+                db, user_id, failed * entitlement_service.INTERVIEW_CREDIT_COST, "batch", reference=f"batch:{batch_id}"
+            )
+        db.close()
+    logger.info(f"Batch {batch_id} finished", extra={"batch_id": batch_id, "completed": completed, "failed": failed})
+
+
+def recover_stale_batches() -> int:
+    """
+    인스턴스 종료 등으로 멈춘 배치를 실패 처리하고 처리되지 못한 건수만큼 환불.
+    기동 시와 배치 조회 시 호출된다. 마무리한 배치 수 반환
+    """
+    db = SessionLocal()
+    recovered = 0
+    try:
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=BATCH_STALE_SECONDS)
+        for batch in crud.list_stale_batches(db, cutoff):
+            batch_id, user_id, failed = batch.id, batch.user_id, batch.total - batch.completed
+            if not crud.finish_batch(db, batch_id, failed=failed, finished_at=datetime.now(timezone.utc)):
+                continue  # 다른 워커가 먼저 마무리함
+            crud.fail_unfinished_batch_items(db, batch_id, error="배치 작업이 중단되었습니다")
+            if failed:
+                entitlement_service.refund(
+                    db, user_id, failed * entitlement_service.INTERVIEW_CREDIT_COST, "batch", reference=f"batch:{batch_id}"
+                )
+            recovered += 1
+            logger.warning(f"Recovered stale batch {batch_id}", extra={"batch_id": batch_id, "failed": failed})
+    finally:
+        db.close()
+    return recovered
+
+
+def is_stale(batch) -> bool:
+    if batch.status == "finished" or batch.created_at is None:
+        return False
+    return datetime.now(timezone.utc) - _as_utc(batch.created_at) > timedelta(seconds=BATCH_STALE_SECONDS)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def resumes_per_minute(batch) -> Optional[float]:
+    """처리량 (완료 건수 / 경과 분)"""
+    if batch.started_at is None or not batch.completed:
+        return None
+    # SQLite는 timezone 없이 저장되므로 UTC로 간주
+    started_at = _as_utc(batch.started_at)
+    end = _as_utc(batch.finished_at) if batch.finished_at else datetime.now(timezone.utc)
+    minutes = (end - started_at).total_seconds() / 60
+    if minutes <= 0:
+        return None
+    return round(batch.completed / minutes, 2)
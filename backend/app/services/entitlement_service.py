@@ -0,0 +1,155 @@
+# backend/app/services/entitlement_service.py
+"""
+크레딧(entitlement) 확인/차감
+
+- 잔액 조회(get_credits)는 사용자별 짧은 TTL 캐시로 처리해서 hot path에 추가 DB 왕복이 없다
+- 차감 가능 여부는 캐시로 판단하지 않는다 - crud.debit_credits 의 조건부 UPDATE 한 번이 곧 확인이자 차감
+  (캐시는 워커마다 따로라 다른 워커에서 충전된 크레딧을 모를 수 있으므로, 캐시상 부족해도 거절하지 않는다)
+- 면접 생성 요청이 인스턴스 종료로 끊기면 예외 경로의 환불도 실행되지 않는다.
+  차감은 reference=interview:<id> 로 남기고, recover_interrupted_interviews 가 질문 없이 멈춘 면접을 찾아 같은 reference 로 한 번만 환불
+"""
+import os
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from .. import crud
+
+logger = logging.getLogger(__name__)
+
+INTERVIEW_CREDIT_COST = int(os.getenv("INTERVIEW_CREDIT_COST", "5"))  # LLM 1회 + TTS 5회
+ANSWER_CREDIT_COST = int(os.getenv("ANSWER_CREDIT_COST", "1"))  # LLM 1회 + TTS 1회
+PAYMENT_CREDIT_GRANT = int(os.getenv("PAYMENT_CREDIT_GRANT", "50"))
+# 가입 시 무료 제공 - 면접 1회 + 본 질문 5개와 꼬리질문 5개에 대한 답변 10회
+FREE_CREDITS = int(os.getenv("FREE_CREDITS", str(INTERVIEW_CREDIT_COST + 10 * ANSWER_CREDIT_COST)))
+ENTITLEMENT_CACHE_TTL = float(os.getenv("ENTITLEMENT_CACHE_TTL", "10"))
+# 이 시간이 지나도 질문이 없는 면접은 생성이 중단된 것으로 본다 (WORKER_TIMEOUT 보다 길게)
+INTERVIEW_STALE_SECONDS = float(os.getenv("INTERVIEW_STALE_SECONDS", "900"))
+
+
+class InsufficientCreditsError(Exception):
+    """크레딧 부족"""
+
+
+_cache: Dict[int, Tuple[int, float]] = {}
+_cache_lock = threading.Lock()
+
+
+def _reset_after_fork():
+    global _cache, _cache_lock
+    _cache = {}
+    _cache_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def cached_credits(user_id: int) -> Optional[int]:
+    with _cache_lock:
+        entry = _cache.get(user_id)
+        if entry is None:
+            return None
+        credits, expires_at = entry
+        if time.monotonic() >= expires_at:
+            _cache.pop(user_id, None)
+            return None
+        return credits
+
+
+def _set_cache(user_id: int, credits: int) -> None:
+    with _cache_lock:
+        _cache[user_id] = (credits, time.monotonic() + ENTITLEMENT_CACHE_TTL)
+
+
+def invalidate(user_id: int) -> None:
+    with _cache_lock:
+        _cache.pop(user_id, None)
+
+
+def get_credits(db: Session, user_id: int) -> int:
+    cached = cached_credits(user_id)
+    if cached is not None:
+        return cached
+    credits = crud.get_credits(db, user_id)
+    if credits is None:
+        credits = FREE_CREDITS  # 아직 entitlement 행이 없는 기존 사용자 - 첫 차감 시 생성
+    _set_cache(user_id, credits)
+    return credits
+
+
+def grant(db: Session, user_id: int, amount: int, reason: str, reference: Optional[str] = None) -> Optional[int]:
+    """크레딧 적립. 같은 (reason, reference)가 이미 처리됐으면 None"""
+    remaining = crud.add_credits(db, user_id, amount, reason, reference)
+    if remaining is not None:
+        _set_cache(user_id, remaining)
+    return remaining
+
+
+def grant_signup_credits(db: Session, user_id: int) -> None:
+    if FREE_CREDITS > 0:
+        grant(db, user_id, FREE_CREDITS, "signup", reference=f"user:{user_id}")
+
+
+def debit(db: Session, user_id: int, amount: int, reason: str, reference: Optional[str] = None) -> int:
+    """크레딧 차감 - 차감 후 잔액 반환, 부족하면 InsufficientCreditsError"""
+    if amount <= 0:
+        return get_credits(db, user_id)
+
+    remaining = crud.debit_credits(db, user_id, amount, reason, reference)
+    if remaining is None:
+        # 실패 경로에서만 추가 조회: entitlement 행이 없는 기존 사용자면 가입 크레딧 지급 후 재시도
+        credits = crud.get_credits(db, user_id)
+        if credits is None:
+            grant_signup_credits(db, user_id)
+            remaining = crud.debit_credits(db, user_id, amount, reason, reference)
+        if remaining is None:
+            _set_cache(user_id, crud.get_credits(db, user_id) or 0)
+            raise InsufficientCreditsError()
+
+    _set_cache(user_id, remaining)
+    return remaining
+
+
+def refund(db: Session, user_id: int, amount: int, reason: str, reference: Optional[str] = None) -> None:
+    """작업 실패 시 차감분 환불 (보상 트랜잭션). reference가 있으면 같은 reference로는 한 번만 환불"""
+    if amount <= 0:
+        return
+    db.rollback()  # 실패한 작업의 트랜잭션 상태 정리
+    remaining = crud.add_credits(db, user_id, amount, f"{reason}_refund", reference)
+    if remaining is not None:
+        _set_cache(user_id, remaining)
+
+
+@contextmanager
+def charge(db: Session, user_id: int, amount: int, reason: str, reference: Optional[str] = None):
+    """블록 진입 시 차감, 블록이 예외로 끝나면 환불"""
+    debit(db, user_id, amount, reason, reference)
+    try:
+        yield
+    except BaseException:
+        refund(db, user_id, amount, reason)
+        raise
+
+
+def interview_reference(interview_id: int) -> str:
+    return f"interview:{interview_id}"
+
+
+def recover_interrupted_interviews(db: Session) -> int:
+    """생성 도중 끊긴 면접의 차감분 환불 (기동 시 호출). 환불한 면접 수 반환"""
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=INTERVIEW_STALE_SECONDS)
+    recovered = 0
+    for interview_id, user_id, amount in crud.list_interrupted_interview_charges(db, cutoff):
+        remaining = crud.add_credits(db, user_id, amount, "interview_refund", interview_reference(interview_id))
+        if remaining is None:
+            continue  # 다른 워커가 먼저 환불함
+        _set_cache(user_id, remaining)
+        recovered += 1
+        logger.warning(f"Refunded interrupted interview {interview_id}", extra={"interview_id": interview_id, "credits": amount})
+    return recovered
@@ -0,0 +1,125 @@
+# backend/app/services/export_service.py
+"""
+분석용 대량 export (NDJSON / CSV, 선택적 gzip)
+
+- server-side cursor(yield_per → stream_results)로 읽고 청크 단위로 내보내므로 메모리 사용량이 일정
+- ORM 엔티티 대신 컬럼만 조회해서 identity map이 커지지 않는다
+- (created_at, id) / id watermark 이후의 행만 내보내는 증분 export 지원
+
+CLI:
+    python -m app.export_cli answers --format csv --since-id 1200 --gzip -o answers.csv.gz
+"""
+import argparse
+import csv
+import io
+import json
+import sys
+import zlib
+from datetime import datetime
+from typing import Iterator, Optional
+
+from sqlalchemy import and_, or_, select
+
+from .. import crud, models
+from ..database import SessionLocal
+
+EXPORT_YIELD_PER = 1000
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+# entity → (모델, 내보낼 컬럼). created_at이 없는 테이블은 id만으로 watermark
+EXPORT_ENTITIES = {
+    "interviews": (models.Interview, ["id", "user_id", "company", "role", "status", "created_at"]),
+    "questions": (models.Question, ["id", "interview_id", "index_num", "text", "is_followup", "audio_url"]),
+    "answers": (models.Answer, ["id", "question_id", "user_id", "text", "created_at"]),
+}
+EXPORT_FORMATS = ("ndjson", "csv")
+
+
+def _build_query(db, entity: str, since_created_at: Optional[datetime], since_id: Optional[int]):
+    model, column_names = EXPORT_ENTITIES[entity]
+    columns = [getattr(model, name) for name in column_names]
+    query = select(*columns)
+    has_created_at = "created_at" in column_names
+    if since_created_at is not None and has_created_at:
+        since_created_at = crud.keyset_value(db, since_created_at)
+        if since_id is not None:
+            query = query.where(or_(
+                model.created_at > since_created_at,
+                and_(model.created_at == since_created_at, model.id > since_id),
+            ))
+        else:
+            query = query.where(model.created_at > since_created_at)
+    elif since_id is not None:
+        query = query.where(model.id > since_id)
+    order = [model.created_at.asc(), model.id.asc()] if has_created_at else [model.id.asc()]
+    return query.order_by(*order).execution_options(yield_per=EXPORT_YIELD_PER), column_names
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def iter_rows(entity: str, fmt: str = "ndjson", since_created_at: Optional[datetime] = None, since_id: Optional[int] = None) -> Iterator[str]:
+    """직렬화된 텍스트 청크를 순서대로 반환"""
+    if entity not in EXPORT_ENTITIES:
+        raise ValueError(f"Unknown export entity: {entity}")
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    db = SessionLocal()
+    try:
+        query, column_names = _build_query(db, entity, since_created_at, since_id)
+        buf = io.StringIO()
+        writer = csv.writer(buf) if fmt == "csv" else None
+        if writer:
+            writer.writerow(column_names)
+        for row in db.execute(query):
+            if writer:
+                writer.writerow([v.isoformat() if isinstance(v, datetime) else v for v in row])
+            else:
+                buf.write(json.dumps(dict(zip(column_names, row)), ensure_ascii=False, default=_json_default))
+                buf.write("\n")
+            if buf.tell() >= EXPORT_CHUNK_BYTES:
+                yield buf.getvalue()
+                buf.seek(0)
+                buf.truncate()
+    finally:
+        db.close()
+    if buf.tell():
+        yield buf.getvalue()
+
+
+def iter_export(entity: str, fmt: str = "ndjson", since_created_at: Optional[datetime] = None, since_id: Optional[int] = None, compress: bool = False) -> Iterator[bytes]:
+    """export 바이트 스트림 (compress=True면 gzip으로 즉시 압축)"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None  # wbits=31 → gzip 헤더
+    for chunk in iter_rows(entity, fmt, since_created_at, since_id):
+        data = chunk.encode("utf-8")
+        if compressor:
+            data = compressor.compress(data)
+            if not data:
+                continue
+        yield data
+    if compressor:
+        yield compressor.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="thefasthire 분석용 export")
+    parser.add_argument("entity", choices=sorted(EXPORT_ENTITIES))
+    parser.add_argument("--format", dest="fmt", choices=EXPORT_FORMATS, default="ndjson")
+    parser.add_argument("--since-created-at", type=datetime.fromisoformat, default=None)
+    parser.add_argument("--since-id", type=int, default=None)
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("-o", "--output", default="-", help="출력 파일 (기본: stdout)")
+    args = parser.parse_args(argv)
+
+    out = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    try:
+        for data in iter_export(args.entity, args.fmt, args.since_created_at, args.since_id, args.gzip):
+            out.write(data)
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+
@@ -1,13 +1,37 @@
 import os
-from google.cloud import storage
+import threading
 from fastapi import UploadFile
 import uuid
 from datetime import datetime, timedelta
 
+# storage.Client는 인증/HTTP 세션을 만들기 때문에 프로세스당 한 번, 첫 사용 시 생성
+_storage_client = None
+_storage_client_lock = threading.Lock()
+
+
+def get_storage_client():
+    global _storage_client
+    if _storage_client is None:
+        with _storage_client_lock:
+            if _storage_client is None:
+                from google.cloud import storage
+                _storage_client = storage.Client()
+    return _storage_client
+
+
+def _reset_after_fork():
+    global _storage_client, _storage_client_lock
+    _storage_client = None
+    _storage_client_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
 
 class GCSService:
     def __init__(self):
-        self.client = storage.Client()
+        self.client = get_storage_client()
         self.bucket_name = os.getenv("GCS_BUCKET_NAME")
         self.bucket = self.client.bucket(self.bucket_name)
     
@@ -15,21 +39,26 @@ class GCSService:
         """
         파일을 GCS에 업로드하고 (파일경로, signed URL)을 반환
         """
+        # 파일 내용 읽기
+        file_content = await file.read()
+        return self.upload_bytes(file_content, file.filename, file.content_type, folder)
+
+    def upload_bytes(self, file_content: bytes, filename: str, content_type: str = None, folder: str = "resumes") -> tuple[str, str]:
+        """
+        이미 읽어 둔 바이트를 GCS에 업로드하고 (파일경로, signed URL)을 반환 (배치 처리용 동기 버전)
+        """
         # 고유한 파일명 생성
-        file_extension = file.filename.split('.')[-1]
+        file_extension = filename.split('.')[-1]
         unique_filename = f"{uuid.uuid4()}.{file_extension}"
         blob_name = f"{folder}/{unique_filename}"
         
         # GCS에 업로드
         blob = self.bucket.blob(blob_name)
         
-        # 파일 내용 읽기
-        file_content = await file.read()
-        
         # 업로드
         blob.upload_from_string(
             file_content,
-            content_type=file.content_type
+            content_type=content_type
         )
         
         # 24시간 동안 유효한 signed URL 생성
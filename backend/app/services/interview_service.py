@@ -1,11 +1,47 @@
 #C:\Users\user\모든 개발\thefasthire\backend\app\services\interview_service.py
-from typing import List, Tuple
-from openai import OpenAI
+from typing import Iterator, List, Tuple, Sequence, Optional
 import os
+import io
 import base64
+import logging
+import threading
 
 from .gcs_service import GCSService
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+from . import resilience
+from .openai_client import get_client
+
+# 호출별 복원력 정책 (재시도는 resilience 래퍼가 담당하므로 SDK 재시도는 끈다)
+QUESTIONS_POLICY = resilience.CallPolicy(
+    name="chat.questions",
+    timeout=float(os.getenv("OPENAI_QUESTIONS_TIMEOUT", "90")),
+    max_attempts=2,
+)
+FOLLOWUP_POLICY = resilience.CallPolicy(
+    name="chat.followup",
+    timeout=float(os.getenv("OPENAI_FOLLOWUP_TIMEOUT", "20")),
+    max_attempts=3,
+    hedge=True,
+)
+# 스트리밍 응답은 중간에 취소할 수 없어 hedge 하지 않는다 (재시도는 첫 응답 헤더까지만)
+FOLLOWUP_STREAM_POLICY = resilience.CallPolicy(
+    name="chat.followup.stream",
+    timeout=float(os.getenv("OPENAI_FOLLOWUP_TIMEOUT", "20")),
+    max_attempts=2,
+)
+
+logger = logging.getLogger(__name__)
+
+# 꼬리질문 대화 컨텍스트 설정
+# 이력서 + 이전 턴이 매 호출마다 동일한 접두사(prefix)가 되도록 구성해 provider 측 prompt caching을 활용
+FOLLOWUP_CONTEXT_TOKEN_BUDGET = int(os.getenv("FOLLOWUP_CONTEXT_TOKEN_BUDGET", "6000"))
+RESUME_TOKEN_BUDGET = int(os.getenv("RESUME_TOKEN_BUDGET", "4000"))
+# 오래된 턴은 이 단위로 잘라낸다 - 한 턴씩 밀면 매번 접두사가 바뀌어 캐시가 깨짐
+CONTEXT_TRIM_STEP = int(os.getenv("CONTEXT_TRIM_STEP", "4"))
+
+# LLM 사용량 (캐시 토큰 포함) 누적 지표
+_usage_lock = threading.Lock()
+LLM_USAGE = {"calls": 0, "prompt_tokens": 0, "cached_tokens": 0, "completion_tokens": 0}
+
 SYSTEM_PROMPT = """당신은 전문적인 면접관입니다. 
 주어진 이력서와 회사 정보를 바탕으로 적절한 면접 질문을 생성해주세요.
 질문은 지원자의 경험과 역량을 평가할 수 있도록 구체적이고 실질적이어야 합니다."""
@@ -30,6 +66,18 @@ def build_followup_prompt(previous_question: str, answer_text: str) -> str:
 
 꼬리질문:
 """
+def build_context_prompt(company: str, role: str, resume_text: Optional[str]) -> str:
+    """면접 전체에서 변하지 않는 컨텍스트 (캐시 접두사의 일부)"""
+    return f"""
+다음은 이번 모의 면접의 정보입니다.
+
+회사: {company}
+직무: {role}
+
+이력서 내용:
+{truncate_to_tokens(resume_text or "(이력서 텍스트 없음)", RESUME_TOKEN_BUDGET)}
+"""
+FOLLOWUP_INSTRUCTION = "위 마지막 답변을 바탕으로 적절한 꼬리질문 1개만 생성해주세요. 질문 문장만 출력하세요."
 def build_initial_prompt_for_pdf(company: str, role: str) -> str:
     """PDF용 초기 프롬프트"""
     return f"당신은 {company}의 면접 사정관입니다. 첨부된 자소서와 {role} 직무에 맞는 면접 질문을 자소서와 회사 상황을 고려하여 1,2,3,4,5 인덱스를 붙여서 총 5개를 만드시오"
@@ -40,19 +88,21 @@ def generate_questions(resume_text: str, company: str, role: str) -> List[Tuple[
     """
     raise NotImplementedError("텍스트 이력서는 더 이상 지원하지 않습니다. PDF를 사용해주세요.")
 # 새로운 PDF 기반 함수 추가
-def generate_questions_from_pdf(file_path: str, company: str, role: str) -> List[Tuple[int, str]]:
+def generate_questions_from_pdf(file_path: str, company: str, role: str, file_content: Optional[bytes] = None) -> List[Tuple[int, str]]:
     """
     PDF 파일 기반 질문 생성
+    file_content가 주어지면 GCS에서 다시 내려받지 않는다
     Returns [(index, question_text)*5]
     """
     try:
-        gcs_service = GCSService()
-        file_content = gcs_service.get_file_content(file_path)
+        if file_content is None:
+            gcs_service = GCSService()
+            file_content = gcs_service.get_file_content(file_path)
         
         # Base64 인코딩
         base64_pdf = base64.b64encode(file_content).decode('utf-8')
         
-        resp = client.chat.completions.create(
+        resp = resilience.call(QUESTIONS_POLICY, lambda timeout: get_client().with_options(timeout=timeout, max_retries=0).chat.completions.create(
             model=os.getenv("OPENAI_CHAT_MODEL", "gpt-5-mini"),  # PDF 지원 모델
             messages=[
                 {
@@ -74,11 +124,14 @@ def generate_questions_from_pdf(file_path: str, company: str, role: str) -> List
                 }
             ],
             temperature=1,
-        )
+        ))
         
+        _record_usage(resp)
         text = resp.choices[0].message.content.strip()
         return _parse_questions(text)
         
+    except (resilience.CircuitOpenError, resilience.DeadlineExceeded):
+        raise  # 503/504 핸들러가 처리하도록 그대로 전달
     except Exception as e:
         raise Exception(f"PDF 기반 질문 생성 실패: {str(e)}")
 def _parse_questions(text: str) -> List[Tuple[int, str]]:
@@ -105,15 +158,121 @@ def _parse_questions(text: str) -> List[Tuple[int, str]]:
         items = [(i+1, part) for i, part in enumerate(parts[:5])]
     
     return items[:5]
-def generate_followup(previous_question: str, answer_text: str) -> str:
-    """꼬리질문 생성 (기존 로직 유지)"""
-    resp = client.chat.completions.create(
+def extract_pdf_text(file_content: bytes) -> str:
+    """PDF 바이트에서 텍스트 추출 (실패 시 빈 문자열)"""
+    try:
+        from pypdf import PdfReader  # 이력서 업로드 시에만 필요
+
+        reader = PdfReader(io.BytesIO(file_content))
+        return "\n".join((page.extract_text() or "") for page in reader.pages).strip()
+    except Exception as e:
+        logger.warning(f"PDF 텍스트 추출 실패: {e}")
+        return ""
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 보수적으로 토큰 수 추정 (한글 1자 ≈ 3바이트 ≈ 1토큰)"""
+    return len(text.encode("utf-8")) // 3 + 1
+def truncate_to_tokens(text: str, budget: int) -> str:
+    if estimate_tokens(text) <= budget:
+        return text
+    return text.encode("utf-8")[: budget * 3].decode("utf-8", errors="ignore")
+def context_window_start(turns: Sequence[Tuple[str, str]], budget: int = FOLLOWUP_CONTEXT_TOKEN_BUDGET) -> int:
+    """
+    토큰 예산 안에 들어오도록 잘라낼 앞쪽 턴 수.
+    CONTEXT_TRIM_STEP 단위로 올림해서 몇 턴 동안은 같은 접두사가 유지되도록 한다.
+    마지막(현재) 턴은 항상 포함.
+    """
+    total = sum(estimate_tokens(q) + estimate_tokens(a) for q, a in turns)
+    start = 0
+    while total > budget and start < len(turns) - 1:
+        q, a = turns[start]
+        total -= estimate_tokens(q) + estimate_tokens(a)
+        start += 1
+    if start == 0:
+        return 0
+    step = max(CONTEXT_TRIM_STEP, 1)
+    return min(-(-start // step) * step, len(turns) - 1)
+def build_followup_messages(
+    company: str,
+    role: str,
+    resume_text: Optional[str],
+    turns: Sequence[Tuple[str, str]],
+) -> List[dict]:
+    """
+    [system, 면접 컨텍스트, (질문, 답변)*, 지시문] 순서로 메시지 구성.
+    지시문을 제외한 앞부분은 다음 턴 호출의 접두사와 바이트 단위로 동일하다.
+    """
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": build_context_prompt(company, role, resume_text)},
+    ]
+    for question, answer in turns[context_window_start(turns):]:
+        messages.append({"role": "assistant", "content": question})
+        messages.append({"role": "user", "content": answer})
+    messages.append({"role": "user", "content": FOLLOWUP_INSTRUCTION})
+    return messages
+def _record_usage(resp) -> None:
+    usage = getattr(resp, "usage", None)
+    if usage is None:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = (getattr(details, "cached_tokens", 0) or 0) if details else 0
+    with _usage_lock:
+        LLM_USAGE["calls"] += 1
+        LLM_USAGE["prompt_tokens"] += usage.prompt_tokens or 0
+        LLM_USAGE["cached_tokens"] += cached
+        LLM_USAGE["completion_tokens"] += usage.completion_tokens or 0
+    logger.info(f"LLM usage - prompt: {usage.prompt_tokens}, cached: {cached}, completion: {usage.completion_tokens}")
+def get_usage_stats() -> dict:
+    with _usage_lock:
+        stats = dict(LLM_USAGE)
+    stats["cache_hit_ratio"] = round(stats["cached_tokens"] / stats["prompt_tokens"], 4) if stats["prompt_tokens"] else 0.0
+    return stats
+def generate_followup(
+    previous_question: str,
+    answer_text: str,
+    company: str = "",
+    role: str = "",
+    resume_text: Optional[str] = None,
+    history: Sequence[Tuple[str, str]] = (),
+) -> str:
+    """
+    꼬리질문 생성.
+    history: 현재 턴 이전의 (질문, 답변) 목록 (오래된 순)
+    """
+    turns = list(history) + [(previous_question, answer_text)]
+    messages = build_followup_messages(company, role, resume_text, turns)
+    resp = resilience.call(FOLLOWUP_POLICY, lambda timeout: get_client().with_options(timeout=timeout, max_retries=0).chat.completions.create(
         model=os.getenv("OPENAI_CHAT_MODEL", "gpt-5-mini"),
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": build_followup_prompt(previous_question, answer_text)},
-        ],
+        messages=messages,
         temperature=1,
-    )
+    ))
+    _record_usage(resp)
     return resp.choices[0].message.content.strip()
 
+
+def stream_followup(
+    previous_question: str,
+    answer_text: str,
+    company: str = "",
+    role: str = "",
+    resume_text: Optional[str] = None,
+    history: Sequence[Tuple[str, str]] = (),
+) -> Iterator[str]:
+    """꼬리질문을 생성되는 대로 텍스트 조각 단위로 반환 (generate_followup의 스트리밍 버전)"""
+    turns = list(history) + [(previous_question, answer_text)]
+    messages = build_followup_messages(company, role, resume_text, turns)
+    stream = resilience.call(FOLLOWUP_STREAM_POLICY, lambda timeout: get_client().with_options(timeout=timeout, max_retries=0).chat.completions.create(
+        model=os.getenv("OPENAI_CHAT_MODEL", "gpt-5-mini"),
+        messages=messages,
+        temperature=1,
+        stream=True,
+        stream_options={"include_usage": True},
+    ))
+    try:
+        for chunk in stream:
+            if getattr(chunk, "usage", None):
+                _record_usage(chunk)  # 마지막 청크에만 usage가 담긴다
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    finally:
+        stream.close()
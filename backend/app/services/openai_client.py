@@ -0,0 +1,29 @@
+# backend/app/services/openai_client.py
+import os
+import threading
+
+# openai SDK import와 클라이언트 생성은 첫 호출 시점으로 미룬다 (cold start 단축)
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """프로세스 공용 OpenAI 클라이언트 (지연 생성)"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from openai import OpenAI
+                _client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _client
+
+
+def _reset_after_fork():
+    # 부모 프로세스의 HTTP 커넥션 풀을 자식 워커가 공유하지 않도록 새로 만든다
+    global _client, _client_lock
+    _client = None
+    _client_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,353 @@
+# backend/app/services/resilience.py
+"""
+외부 API(OpenAI) 호출용 복원력 래퍼
+
+- 요청 단위 남은 시간(deadline)에서 호출별 타임아웃 계산
+- 지터가 들어간 재시도 + 전역 재시도 예산(retry budget)
+- 짧고 멱등한 호출(꼬리질문, TTS)에 대한 hedged request
+- 서킷 브레이커
+"""
+import contextvars
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 요청 전체 시간 예산 (Cloud Run 기본 요청 타임아웃 300초)
+REQUEST_DEADLINE_SECONDS = float(os.getenv("REQUEST_DEADLINE_SECONDS", "300"))
+# 응답을 돌려줄 여유 시간 - 남은 예산에서 이만큼은 빼고 호출 타임아웃을 잡는다
+DEADLINE_SAFETY_MARGIN = float(os.getenv("DEADLINE_SAFETY_MARGIN", "1.0"))
+# 재시도는 전체 호출 대비 이 비율까지만 허용
+RETRY_BUDGET_RATIO = float(os.getenv("RETRY_BUDGET_RATIO", "0.2"))
+RETRY_BUDGET_MIN_TOKENS = float(os.getenv("RETRY_BUDGET_MIN_TOKENS", "10"))
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_SECONDS = float(os.getenv("BREAKER_RESET_SECONDS", "30"))
+HEDGE_MAX_WORKERS = int(os.getenv("HEDGE_MAX_WORKERS", "16"))
+
+
+class DeadlineExceeded(Exception):
+    """요청 시간 예산을 모두 소진함"""
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 호출하지 않음"""
+
+
+# ---------------------------------------------------------------------------
+# Deadline
+# ---------------------------------------------------------------------------
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("request_deadline", default=None)
+
+
+@contextmanager
+def request_deadline(seconds: float = REQUEST_DEADLINE_SECONDS):
+    """현재 컨텍스트에 요청 마감 시각을 설정 (중첩 시 더 이른 쪽 유지)"""
+    new_deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        new_deadline = min(current, new_deadline)
+    token = _deadline.set(new_deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def detached_deadline(seconds: float):
+    """요청과 분리된 백그라운드 작업용 마감 설정 (바깥 요청의 마감은 무시)"""
+    token = _deadline.set(time.monotonic() + seconds)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """남은 요청 시간(초). 마감이 설정되지 않았으면 None"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def operation_timeout(op_timeout: float) -> float:
+    """호출별 타임아웃을 남은 요청 시간으로 잘라서 반환"""
+    remaining = remaining_time()
+    if remaining is None:
+        return op_timeout
+    budget = remaining - DEADLINE_SAFETY_MARGIN
+    if budget <= 0:
+        raise DeadlineExceeded("요청 시간 예산을 초과했습니다")
+    return min(op_timeout, budget)
+
+
+# ---------------------------------------------------------------------------
+# Retry budget / circuit breaker / latency tracking
+# ---------------------------------------------------------------------------
+class RetryBudget:
+    """
+    토큰 버킷 방식의 전역 재시도 예산.
+    호출마다 ratio 만큼 적립하고 재시도(또는 hedge) 한 번에 1 토큰을 쓴다.
+    """
+
+    def __init__(self, ratio: float = RETRY_BUDGET_RATIO, min_tokens: float = RETRY_BUDGET_MIN_TOKENS):
+        self.ratio = ratio
+        self.max_tokens = max(min_tokens, 1.0)
+        self._tokens = self.max_tokens
+        self._lock = threading.Lock()
+
+    def record_call(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+
+class CircuitBreaker:
+    """연속 실패가 임계치를 넘으면 reset_timeout 동안 호출을 차단 (이후 half-open 1회 시도)"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = BREAKER_FAILURE_THRESHOLD, reset_timeout: float = BREAKER_RESET_SECONDS):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._probe_in_flight = False
+            self.state = self.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"Circuit '{self.name}' opened after {self._failures} failures")
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class LatencyTracker:
+    """최근 성공 호출 지연시간으로 백분위수 계산 (hedge 지연 산정용)"""
+
+    def __init__(self, window: int = 200):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, p: float) -> Optional[float]:
+        with self._lock:
+            if len(self._samples) < 20:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+# ---------------------------------------------------------------------------
+# Policy & call
+# ---------------------------------------------------------------------------
+@dataclass
+class CallPolicy:
+    name: str
+    timeout: float  # 시도 1회당 최대 타임아웃 (초)
+    max_attempts: int = 3
+    base_backoff: float = 0.2
+    max_backoff: float = 2.0
+    hedge: bool = False  # 멱등한 짧은 호출에만 사용
+    hedge_min_delay: float = 0.5  # p95 샘플이 부족할 때 쓰는 hedge 지연
+
+
+_retry_budget = RetryBudget()
+_breakers: dict[str, CircuitBreaker] = {}
+_latencies: dict[str, LatencyTracker] = {}
+_registry_lock = threading.Lock()
+_hedge_executor = ThreadPoolExecutor(max_workers=HEDGE_MAX_WORKERS, thread_name_prefix="hedge")
+# executor에 들어간 작업 수 - 워커 수를 넘겨 큐에서 기다리는 작업이 생기지 않도록 한다
+_hedge_slots = threading.BoundedSemaphore(HEDGE_MAX_WORKERS)
+
+
+def _reset_after_fork():
+    # 스레드는 fork 시 복제되지 않으므로 워커마다 executor/lock을 새로 만든다
+    global _hedge_executor, _hedge_slots, _registry_lock
+    _registry_lock = threading.Lock()
+    _hedge_executor = ThreadPoolExecutor(max_workers=HEDGE_MAX_WORKERS, thread_name_prefix="hedge")
+    _hedge_slots = threading.BoundedSemaphore(HEDGE_MAX_WORKERS)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def shutdown(wait: bool = True) -> None:
+    """진행 중인 hedge 요청이 끝날 때까지 대기 (종료 시 호출) - 이후 호출을 위해 executor는 새로 만든다"""
+    global _hedge_executor, _hedge_slots
+    executor, _hedge_executor = _hedge_executor, ThreadPoolExecutor(max_workers=HEDGE_MAX_WORKERS, thread_name_prefix="hedge")
+    _hedge_slots = threading.BoundedSemaphore(HEDGE_MAX_WORKERS)
+    executor.shutdown(wait=wait)
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    with _registry_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name)
+        return _breakers[name]
+
+
+def _get_latency(name: str) -> LatencyTracker:
+    with _registry_lock:
+        if name not in _latencies:
+            _latencies[name] = LatencyTracker()
+        return _latencies[name]
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """일시적 오류만 재시도 (타임아웃, 연결 오류, 429, 5xx)"""
+    openai = sys.modules.get("openai")  # SDK가 로드되지 않았다면 SDK 예외일 수도 없음
+    if openai is not None and isinstance(exc, (openai.APITimeoutError, openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError)):
+        return True
+    return isinstance(exc, (TimeoutError, ConnectionError))
+
+
+def _backoff(policy: CallPolicy, attempt: int) -> float:
+    # full jitter
+    return random.uniform(0, min(policy.max_backoff, policy.base_backoff * (2 ** attempt)))
+
+
+def _timed(policy: CallPolicy, fn: Callable[[float], T], timeout: float) -> T:
+    started = time.monotonic()
+    result = fn(timeout)
+    _get_latency(policy.name).record(time.monotonic() - started)
+    return result
+
+
+def _submit_to_free_worker(policy: CallPolicy, fn: Callable[[float], T], timeout: float, spend_budget: bool = False) -> Optional[Future]:
+    """
+    hedge executor에 빈 워커가 있을 때만 제출 (없으면 None).
+    큐에서 기다린 시간이 느린 응답으로 보여 불필요한 hedge가 나가지 않도록, 제출된 작업은 항상 바로 실행된다
+    """
+    slots = _hedge_slots
+    if not slots.acquire(blocking=False):
+        return None
+    if spend_budget and not _retry_budget.try_spend():
+        slots.release()
+        return None
+
+    def run():
+        try:
+            return _timed(policy, fn, timeout)
+        finally:
+            slots.release()
+
+    try:
+        return _hedge_executor.submit(contextvars.copy_context().run, run)
+    except BaseException:
+        slots.release()
+        raise
+
+
+def _hedged(policy: CallPolicy, fn: Callable[[float], T], timeout: float) -> T:
+    """
+    첫 요청이 p95 지연을 넘기면 두 번째 요청을 보내고 먼저 성공한 쪽을 사용.
+    executor가 포화 상태면 hedge 없이 호출한 스레드에서 그대로 실행
+    """
+    hedge_delay = _get_latency(policy.name).percentile(0.95) or policy.hedge_min_delay
+    primary = _submit_to_free_worker(policy, fn, timeout)
+    if primary is None:
+        return _timed(policy, fn, timeout)
+    done, _ = wait([primary], timeout=min(hedge_delay, timeout))
+    if done:
+        return primary.result()
+
+    hedge_timeout = max(timeout - hedge_delay, 0.1)
+    secondary = _submit_to_free_worker(policy, fn, hedge_timeout, spend_budget=True)
+    if secondary is None:
+        return primary.result()
+    logger.info(f"[{policy.name}] hedging after {hedge_delay:.2f}s")
+    pending = {primary, secondary}
+    last_exc: Optional[BaseException] = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for fut in done:
+            if fut.exception() is None:
+                return fut.result()
+            last_exc = fut.exception()
+    raise last_exc
+
+
+def call(policy: CallPolicy, fn: Callable[[float], T]) -> T:
+    """
+    fn(timeout)을 정책에 따라 실행.
+    fn은 전달받은 timeout(초)을 실제 HTTP 호출에 적용해야 한다.
+    """
+    breaker = get_breaker(policy.name)
+    _retry_budget.record_call()
+
+    attempt = 0
+    while True:
+        if not breaker.allow():
+            raise CircuitOpenError(f"{policy.name} 서킷이 열려 있습니다")
+        timeout = operation_timeout(policy.timeout)
+        try:
+            if policy.hedge:
+                result = _hedged(policy, fn, timeout)
+            else:
+                result = _timed(policy, fn, timeout)
+            breaker.record_success()
+            return result
+        except Exception as e:
+            if not is_retryable(e):
+                # 요청 자체의 문제(4xx 등)는 서킷 상태에 반영하지 않음
+                breaker.record_success()
+                raise
+            breaker.record_failure()
+            attempt += 1
+            if attempt >= policy.max_attempts or not _retry_budget.try_spend():
+                raise
+            delay = _backoff(policy, attempt)
+            remaining = remaining_time()
+            if remaining is not None and remaining - delay <= DEADLINE_SAFETY_MARGIN:
+                raise
+            logger.warning(f"[{policy.name}] attempt {attempt} failed ({type(e).__name__}), retrying in {delay:.2f}s")
+            time.sleep(delay)
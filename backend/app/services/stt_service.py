@@ -0,0 +1,129 @@
+# backend/app/services/stt_service.py
+"""
+음성 답변 STT(speech-to-text)
+
+- provider는 STT_PROVIDER 환경변수로 선택 (openai | fake)
+- TranscriptionSession은 녹음 중에 도착하는 세그먼트를 도착 즉시 병렬로 전사하고,
+  업로드가 끝나면 순서대로 이어 붙여 최종 transcript를 만든다
+"""
+import os
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from . import resilience
+from .openai_client import get_client
+
+STT_PROVIDER = os.getenv("STT_PROVIDER", "openai")
+OPENAI_STT_MODEL = os.getenv("OPENAI_STT_MODEL", "gpt-4o-mini-transcribe")
+STT_LANGUAGE = os.getenv("STT_LANGUAGE", "ko")
+STT_MAX_WORKERS = int(os.getenv("STT_MAX_WORKERS", "8"))
+
+STT_POLICY = resilience.CallPolicy(
+    name="stt",
+    timeout=float(os.getenv("OPENAI_STT_TIMEOUT", "30")),
+    max_attempts=3,
+)
+
+
+class SpeechToTextProvider(ABC):
+    """STT provider 인터페이스"""
+
+    @abstractmethod
+    def transcribe(self, audio: bytes, filename: str) -> str:
+        """오디오 세그먼트 1개를 텍스트로 변환"""
+
+
+class OpenAISpeechToText(SpeechToTextProvider):
+    def transcribe(self, audio: bytes, filename: str) -> str:
+        resp = resilience.call(STT_POLICY, lambda timeout: get_client().with_options(timeout=timeout, max_retries=0).audio.transcriptions.create(
+            model=OPENAI_STT_MODEL,
+            file=(filename, audio),
+            language=STT_LANGUAGE,
+        ))
+        return resp.text.strip()
+
+
+class FakeSpeechToText(SpeechToTextProvider):
+    """테스트/로컬용: 오디오 바이트를 UTF-8 텍스트로 간주해서 그대로 반환"""
+
+    def transcribe(self, audio: bytes, filename: str) -> str:
+        return audio.decode("utf-8", errors="ignore").strip()
+
+
+_PROVIDERS = {
+    "openai": OpenAISpeechToText,
+    "fake": FakeSpeechToText,
+}
+_provider: Optional[SpeechToTextProvider] = None
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def get_provider() -> SpeechToTextProvider:
+    global _provider
+    with _lock:
+        if _provider is None:
+            if STT_PROVIDER not in _PROVIDERS:
+                raise ValueError(f"Unknown STT_PROVIDER: {STT_PROVIDER}")
+            _provider = _PROVIDERS[STT_PROVIDER]()
+        return _provider
+
+
+def set_provider(provider: Optional[SpeechToTextProvider]) -> None:
+    """provider 교체 (테스트에서 fake 주입용)"""
+    global _provider
+    with _lock:
+        _provider = provider
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=STT_MAX_WORKERS, thread_name_prefix="stt")
+        return _executor
+
+
+def _reset_after_fork():
+    global _executor, _lock
+    _executor = None
+    _lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class TranscriptionSession:
+    """
+    한 답변의 세그먼트 단위 전사 세션.
+    각 세그먼트는 단독으로 디코딩 가능한 오디오여야 한다 (예: 세그먼트마다 새로 시작한 MediaRecorder 출력).
+    """
+
+    def __init__(self, audio_format: str = "webm", provider: Optional[SpeechToTextProvider] = None):
+        self.audio_format = audio_format
+        self.provider = provider or get_provider()
+        self._segments: Dict[int, Future] = {}
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    def add_segment(self, audio: bytes) -> tuple[int, Future]:
+        """세그먼트 전사를 바로 시작하고 (순번, future)를 반환"""
+        seq = len(self._segments)
+        filename = f"segment-{seq}.{self.audio_format}"
+        fut = _get_executor().submit(self.provider.transcribe, audio, filename)
+        self._segments[seq] = fut
+        return seq, fut
+
+    def finalize(self) -> str:
+        """모든 세그먼트 전사를 기다린 뒤 순서대로 합친 transcript 반환"""
+        parts: List[str] = [self._segments[seq].result() for seq in sorted(self._segments)]
+        return " ".join(p for p in parts if p).strip()
+
+    def cancel(self) -> None:
+        for fut in self._segments.values():
+            fut.cancel()
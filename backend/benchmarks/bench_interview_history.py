@@ -0,0 +1,83 @@
+# backend/benchmarks/bench_interview_history.py
+"""
+면접 기록 목록 keyset pagination 벤치마크 - 사용자 1명에 면접 수만 건
+
+    DATABASE_URL=sqlite:////tmp/bench.db python benchmarks/bench_interview_history.py --interviews 30000
+(DB 스키마는 alembic upgrade head 로 미리 준비)
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from sqlalchemy import insert
+
+from app import crud, models
+from app.database import SessionLocal
+
+
+def seed(db, user_id: int, interviews: int, questions_per_interview: int) -> None:
+    batch = 1000
+    for start in range(0, interviews, batch):
+        rows = [
+            {"user_id": user_id, "company": f"company-{i % 50}", "role": "backend", "status": "finished" if i % 3 else "created"}
+            for i in range(start, min(start + batch, interviews))
+        ]
+        ids = db.scalars(insert(models.Interview).returning(models.Interview.id, sort_by_parameter_order=True), rows).all()
+        db.execute(insert(models.Question), [
+            {"interview_id": interview_id, "index_num": n, "text": f"Q{n}", "is_followup": False}
+            for interview_id in ids for n in range(1, questions_per_interview + 1)
+        ])
+        db.commit()
+
+
+def walk(db, user_id: int, limit: int, **filters):
+    """모든 페이지를 순서대로 조회하며 페이지별 지연 기록"""
+    latencies, cursor, total = [], None, 0
+    while True:
+        started = time.perf_counter()
+        rows = crud.list_interview_summaries(db, user_id, limit + 1, cursor=cursor, **filters)
+        latencies.append(time.perf_counter() - started)
+        total += min(len(rows), limit)
+        if len(rows) <= limit:
+            return total, latencies
+        cursor = (rows[limit - 1].created_at, rows[limit - 1].id)
+
+
+def report(name: str, total: int, latencies: list) -> None:
+    ms = sorted(x * 1000 for x in latencies)
+    quantiles = statistics.quantiles(ms, n=100) if len(ms) >= 2 else ms * 99
+    print(f"{name}: rows={total} pages={len(ms)} first={ms[0]:.2f}ms p50={quantiles[49]:.2f}ms "
+          f"p95={quantiles[94]:.2f}ms last_page={latencies[-1] * 1000:.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--interviews", type=int, default=30000)
+    parser.add_argument("--questions", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        user = crud.create_user(db, email=f"bench-{int(time.time())}@example.com", hashed_password="x")
+        started = time.perf_counter()
+        seed(db, user.id, args.interviews, args.questions)
+        print(f"seeded {args.interviews} interviews in {time.perf_counter() - started:.1f}s")
+
+        report("all", *walk(db, user.id, args.limit))
+        report("status=finished", *walk(db, user.id, args.limit, status="finished"))
+        report("company=company-7", *walk(db, user.id, args.limit, company="company-7"))
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# backend/benchmarks/bench_logging.py
+"""
+요청당 로깅 오버헤드 벤치마크 - 큐 기반 핸들러 vs 일반 StreamHandler (요청 미들웨어의 접근 로그 포함)
+
+    python benchmarks/bench_logging.py --requests 3000 --logs-per-request 5
+
+모드마다 새 프로세스에서 GET /health 를 순서대로 보내 요청당 지연을 잰다. 로그는 Cloud Run처럼 파이프로 나간다.
+  off     로깅 비활성화 (기준선)
+  stream  루트 로거에 같은 StreamHandler(JsonFormatter)를 직접 붙임 - 요청 스레드/이벤트 루프가 stdout에 쓴다
+  queue   setup_logging() 기본 구성 - QueueHandler + 리스너 스레드
+--logs-per-request 만큼 요청 처리 중 INFO 로그를 추가로 남긴다 (실제 요청의 서비스 로그 흉내).
+--sink-delay-us 는 로그 한 줄 쓰기마다 지연을 넣어 stdout이 느린 상황을 흉내 낸다 (0이면 빠른 파이프).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODES = ("off", "stream", "queue")
+
+_CHILD = """
+import json, logging, statistics, sys, time
+
+mode, requests, logs_per_request, sink_delay = sys.argv[1], int(sys.argv[2]), int(sys.argv[3]), float(sys.argv[4]) / 1e6
+
+
+class _SlowSink:
+    # 로그 수집기가 밀려 stdout 쓰기가 늦어지는 상황 흉내 (setup_logging 전에 바꿔 끼운다)
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, data):
+        time.sleep(sink_delay)
+        return self.stream.write(data)
+
+    def flush(self):
+        self.stream.flush()
+
+
+if sink_delay:
+    sys.stdout = _SlowSink(sys.stdout)
+
+from fastapi.testclient import TestClient
+from app import logging_config
+from app.main import app
+
+if mode == "off":
+    logging.disable(logging.CRITICAL)
+elif mode == "stream":
+    logging_config.shutdown_logging()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    handler = logging_config._make_output_handler()  # 큐 모드 리스너와 같은 stdout 핸들러를 요청 경로에 직접 붙인다
+    handler.addFilter(logging_config.RequestContextFilter())
+    root.addHandler(handler)
+
+service_logger = logging.getLogger("app.bench")
+
+@app.middleware("http")
+async def service_logs(request, call_next):
+    for i in range(logs_per_request):
+        service_logger.info("service step", extra={"step": i, "path": request.url.path})
+    return await call_next(request)
+
+latencies = []
+with TestClient(app) as client:
+    for _ in range(200):
+        client.get("/health")
+    for _ in range(requests):
+        started = time.perf_counter()
+        client.get("/health")
+        latencies.append(time.perf_counter() - started)
+logging_config.shutdown_logging()
+latencies.sort()
+sys.stderr.write(json.dumps({
+    "mean_us": statistics.fmean(latencies) * 1e6,
+    "p50_us": latencies[len(latencies) // 2] * 1e6,
+    "p95_us": latencies[int(len(latencies) * 0.95)] * 1e6,
+}) + "\\n")
+"""
+
+
+def run_mode(mode: str, requests: int, logs_per_request: int, sink_delay_us: float) -> dict:
+    with tempfile.TemporaryDirectory(prefix="bench-logging-") as tmp:
+        env = {**os.environ, "DATABASE_URL": f"sqlite:///{tmp}/bench.db", "MEDIA_DIR": os.path.join(tmp, "media"),
+               "LOG_FORMAT": "json", "LOG_LEVEL": "INFO", "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "bench-key")}
+        result = subprocess.run(
+            [sys.executable, "-c", _CHILD, mode, str(requests), str(logs_per_request), str(sink_delay_us)],
+            cwd=BACKEND_DIR, env=env, check=True, capture_output=True, text=True,
+        )
+        return json.loads(result.stderr.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--logs-per-request", type=int, default=5)
+    parser.add_argument("--sink-delay-us", type=float, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = {mode: [run_mode(mode, args.requests, args.logs_per_request, args.sink_delay_us) for _ in range(args.repeat)] for mode in MODES}
+    baseline = statistics.median(r["mean_us"] for r in results["off"])
+    for mode in MODES:
+        mean = statistics.median(r["mean_us"] for r in results[mode])
+        p95 = statistics.median(r["p95_us"] for r in results[mode])
+        print(f"{mode:6s} mean={mean:.0f}us p95={p95:.0f}us logging_overhead={mean - baseline:.0f}us/request")
+
+
+if __name__ == "__main__":
+    main()
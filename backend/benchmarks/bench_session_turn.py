@@ -0,0 +1,306 @@
+# backend/benchmarks/bench_session_turn.py
+"""
+면접 한 턴 지연 벤치마크 - WebSocket 세션 채널 vs POST /interviews/answer + /media 오디오 조회
+
+    python benchmarks/bench_session_turn.py --turns 20 --rtt-ms 80 --llm-ms 1500 --llm-ttft-ms 400 --tts-ms 1200 --tts-ttfb-ms 250
+
+uvicorn 서버를 별도 프로세스로 띄우고(OpenAI 클라이언트만 지연을 흉내 내는 가짜로 교체),
+앞에 왕복 지연(--rtt-ms)을 넣는 TCP 프록시를 두어 두 방식의 턴을 번갈아 측정한다.
+턴마다 답변 전송 시점부터 다음 시점까지의 지연을 기록:
+  text_first   꼬리질문 텍스트 첫 조각 (HTTP는 응답 수신 시점)
+  text_done    꼬리질문 텍스트 전체
+  audio_first  꼬리질문 음성 첫 바이트
+  audio_done   꼬리질문 음성 전체
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from urllib.parse import urlparse
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+METRICS = ("text_first", "text_done", "audio_first", "audio_done")
+
+
+# ---------------------------------------------------------------------------
+# 서버 쪽: 지연을 흉내 내는 가짜 OpenAI 클라이언트
+# ---------------------------------------------------------------------------
+class _FakeChatStream:
+    def __init__(self, args):
+        self.args = args
+        self.closed = False
+
+    def __iter__(self):
+        time.sleep(self.args.llm_ttft_ms / 1000)
+        words = [f"토큰{i} " for i in range(self.args.llm_tokens - 1)] + ["질문인가요?"]
+        gap = max(self.args.llm_ms - self.args.llm_ttft_ms, 0) / 1000 / max(len(words) - 1, 1)
+        for i, word in enumerate(words):
+            if i:
+                time.sleep(gap)
+            yield SimpleNamespace(usage=None, choices=[SimpleNamespace(delta=SimpleNamespace(content=word))])
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeSpeechResponse:
+    def __init__(self, args):
+        self.args = args
+
+    def iter_bytes(self, chunk_size: int):
+        total = self.args.audio_kb * 1024
+        chunks = max(total // chunk_size, 1)
+        gap = max(self.args.tts_ms - self.args.tts_ttfb_ms, 0) / 1000 / chunks
+        for i in range(chunks):
+            if i:
+                time.sleep(gap)
+            yield b"\0" * min(chunk_size, total - i * chunk_size)
+
+    def close(self):
+        pass
+
+
+class FakeOpenAIClient:
+    def __init__(self, args):
+        self.args = args
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._chat))
+        streaming = SimpleNamespace(create=self._speech_stream)
+        self.audio = SimpleNamespace(speech=SimpleNamespace(create=self._speech, with_streaming_response=streaming))
+
+    def with_options(self, **kwargs):
+        return self
+
+    def _chat(self, stream: bool = False, **kwargs):
+        if stream:
+            return _FakeChatStream(self.args)
+        time.sleep(self.args.llm_ms / 1000)
+        text = " ".join(f"토큰{i}" for i in range(self.args.llm_tokens - 1)) + " 질문인가요?"
+        return SimpleNamespace(usage=None, choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+    def _speech(self, **kwargs):
+        time.sleep(self.args.tts_ms / 1000)
+        return SimpleNamespace(content=b"\0" * (self.args.audio_kb * 1024))
+
+    def _speech_stream(self, **kwargs):
+        args = self.args
+
+        class _Context:
+            def __enter__(self):
+                time.sleep(args.tts_ttfb_ms / 1000)
+                return _FakeSpeechResponse(args)
+
+        return _Context()
+
+
+def serve(args) -> None:
+    import uvicorn
+
+    from app.main import app
+    from app.services import audio_service, interview_service, openai_client
+
+    client = FakeOpenAIClient(args)
+    for module in (openai_client, audio_service, interview_service):
+        module.get_client = lambda: client
+    uvicorn.run(app, host="127.0.0.1", port=args.port, log_level="warning")
+
+
+# ---------------------------------------------------------------------------
+# 클라이언트 쪽: 왕복 지연 프록시 + 두 가지 흐름
+# ---------------------------------------------------------------------------
+async def _delayed_pipe(reader, writer, delay: float):
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump_in():
+        try:
+            while data := await reader.read(65536):
+                await queue.put((loop.time() + delay, data))
+        finally:
+            await queue.put((loop.time() + delay, None))
+
+    async def pump_out():
+        while True:
+            due, data = await queue.get()
+            await asyncio.sleep(max(0.0, due - loop.time()))
+            if data is None:
+                writer.close()
+                return
+            writer.write(data)
+            await writer.drain()
+
+    try:
+        await asyncio.gather(pump_in(), pump_out())
+    except (ConnectionError, OSError):
+        writer.close()
+
+
+async def start_proxy(upstream_port: int, rtt_ms: float):
+    """방향마다 rtt/2 만큼 늦게 전달하는 TCP 프록시"""
+    one_way = rtt_ms / 2000
+
+    async def handle(client_reader, client_writer):
+        upstream_reader, upstream_writer = await asyncio.open_connection("127.0.0.1", upstream_port)
+        try:
+            await asyncio.gather(
+                _delayed_pipe(client_reader, upstream_writer, one_way),
+                _delayed_pipe(upstream_reader, client_writer, one_way),
+            )
+        except asyncio.CancelledError:
+            pass  # 벤치마크 종료 시 남은 연결 정리
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+async def http_turn(client, token: str, interview_id: int, question_id: int) -> dict:
+    started = time.perf_counter()
+    response = await client.post(
+        "/interviews/answer",
+        json={"interview_id": interview_id, "question_id": question_id, "answer_text": "백엔드 개발자입니다"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    response.raise_for_status()
+    text_done = time.perf_counter()
+    audio_path = urlparse(response.json()["question"]["audio_url"]).path
+    audio_first = None
+    async with client.stream("GET", audio_path) as audio:
+        audio.raise_for_status()
+        async for _ in audio.aiter_bytes():
+            audio_first = audio_first or time.perf_counter()
+    audio_done = time.perf_counter()
+    return {"text_first": text_done - started, "text_done": text_done - started,
+            "audio_first": audio_first - started, "audio_done": audio_done - started}
+
+
+async def session_turn(ws, question_id: int) -> dict:
+    started = time.perf_counter()
+    await ws.send(json.dumps({"type": "answer", "question_id": question_id, "answer_text": "백엔드 개발자입니다"}))
+    marks = {}
+    while True:
+        message = await ws.recv()
+        now = time.perf_counter()
+        if isinstance(message, bytes):
+            marks.setdefault("audio_first", now)
+            continue
+        data = json.loads(message)
+        if data["type"] == "followup_delta":
+            marks.setdefault("text_first", now)
+        elif data["type"] == "followup":
+            marks["text_done"] = now
+        elif data["type"] == "audio_end":
+            marks["audio_done"] = now
+            return {key: marks[key] - started for key in METRICS}
+        elif data["type"] == "error":
+            raise RuntimeError(data["detail"])
+
+
+def seed(turns: int):
+    from app import crud
+    from app.database import create_tables, SessionLocal
+    from app.routers.user import create_access_token
+    from app.services import entitlement_service
+
+    create_tables()
+    db = SessionLocal()
+    try:
+        user = crud.create_user(db, email="bench@example.com", hashed_password="x")
+        entitlement_service.grant(db, user.id, (turns + 2) * 2 * entitlement_service.ANSWER_CREDIT_COST, "bench")
+        itv = crud.create_interview(db, user.id, "ACME", "Backend", "이력서 " * 200)
+        q = crud.create_question(db, itv.id, 1, "자기소개를 해주세요")
+        return create_access_token({"sub": user.email}), itv.id, q.id
+    finally:
+        db.close()
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def run(args, token: str, interview_id: int, question_id: int, port: int) -> dict:
+    import httpx
+    import websockets
+
+    proxy = await start_proxy(port, args.rtt_ms)
+    base = f"127.0.0.1:{proxy.sockets[0].getsockname()[1]}"
+    results = {"http": [], "session": []}
+    async with httpx.AsyncClient(base_url=f"http://{base}", timeout=60) as client, \
+            websockets.connect(f"ws://{base}/interviews/{interview_id}/session", max_size=None) as ws:
+        await ws.send(json.dumps({"type": "auth", "token": token}))
+        assert json.loads(await ws.recv())["type"] == "ready"
+        for turn in range(args.turns + 1):  # 첫 턴은 워밍업
+            http = await http_turn(client, token, interview_id, question_id)
+            session = await session_turn(ws, question_id)
+            if turn:
+                results["http"].append(http)
+                results["session"].append(session)
+    proxy.close()
+    return results
+
+
+def report(results: dict) -> None:
+    for flow, samples in results.items():
+        parts = []
+        for metric in METRICS:
+            ms = [s[metric] * 1000 for s in samples]
+            p95 = statistics.quantiles(ms, n=20)[18] if len(ms) >= 2 else ms[0]
+            parts.append(f"{metric} p50={statistics.median(ms):.0f}ms p95={p95:.0f}ms")
+        print(f"{flow:8s} " + " | ".join(parts))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--rtt-ms", type=float, default=80)
+    parser.add_argument("--llm-ms", type=float, default=1500, help="꼬리질문 전체 생성 시간")
+    parser.add_argument("--llm-ttft-ms", type=float, default=400, help="첫 토큰까지 시간")
+    parser.add_argument("--llm-tokens", type=int, default=20)
+    parser.add_argument("--tts-ms", type=float, default=1200, help="음성 전체 생성 시간")
+    parser.add_argument("--tts-ttfb-ms", type=float, default=250, help="음성 첫 바이트까지 시간")
+    parser.add_argument("--audio-kb", type=int, default=64)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args)
+        return
+
+    with tempfile.TemporaryDirectory(prefix="bench-session-") as tmp:
+        port = _free_port()
+        os.environ.update({
+            "DATABASE_URL": f"sqlite:///{tmp}/bench.db",
+            "MEDIA_DIR": os.path.join(tmp, "media"),
+            "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "bench-key"),
+            "JWT_SECRET_KEY": os.environ.get("JWT_SECRET_KEY", "bench-secret"),
+            "LOG_LEVEL": "WARNING",
+        })
+        token, interview_id, question_id = seed(args.turns)
+        server = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--serve", "--port", str(port)] + sys.argv[1:], cwd=BACKEND_DIR)
+        try:
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                    break
+                except OSError:
+                    if time.monotonic() > deadline or server.poll() is not None:
+                        raise RuntimeError("서버가 시작되지 않았습니다")
+                    time.sleep(0.2)
+            report(asyncio.run(run(args, token, interview_id, question_id, port)))
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
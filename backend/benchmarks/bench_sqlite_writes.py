@@ -0,0 +1,106 @@
+# backend/benchmarks/bench_sqlite_writes.py
+"""
+SQLite 동시 쓰기 처리량 벤치마크 - /interviews/answer 와 같은 DB 작업(크레딧 차감 + 답변 저장 + 턴 조회)
+
+    python benchmarks/bench_sqlite_writes.py --threads 16 --duration 10
+
+SQLITE_SINGLE_WRITER=true / false 를 각각 새 프로세스와 새 DB 파일에서 실행해 ops/s, p50/p95, 오류 수를 비교한다.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+
+def worker_run(threads: int, duration: float) -> dict:
+    from app import crud
+    from app.database import SessionLocal, create_tables
+    from app.services import entitlement_service
+
+    create_tables()
+    db = SessionLocal()
+    try:
+        user = crud.create_user(db, email="bench@example.com", hashed_password="x")
+        entitlement_service.grant(db, user.id, 10_000_000, "bench")
+        interview_ids, question_ids = [], []
+        for i in range(threads):
+            itv = crud.create_interview(db, user.id, "ACME", "Backend", "resume")
+            interview_ids.append(itv.id)
+            question_ids.append(crud.create_question(db, itv.id, 1, "자기소개를 해주세요").id)
+        user_id = user.id
+    finally:
+        db.close()
+
+    latencies, errors = [], []
+    lock = threading.Lock()
+    stop_at = time.monotonic() + duration
+
+    def loop(i: int):
+        local_latencies, local_errors = [], []
+        while time.monotonic() < stop_at:
+            started = time.perf_counter()
+            session = SessionLocal()
+            try:
+                entitlement_service.debit(session, user_id, entitlement_service.ANSWER_CREDIT_COST, "answer")
+                crud.create_answer(session, question_ids[i], user_id, "백엔드 개발자입니다")
+                crud.list_turns(session, interview_ids[i])
+                local_latencies.append(time.perf_counter() - started)
+            except Exception as e:
+                local_errors.append(type(e).__name__ + ": " + str(e).splitlines()[0][:80])
+                session.rollback()
+            finally:
+                session.close()
+        with lock:
+            latencies.extend(local_latencies)
+            errors.extend(local_errors)
+
+    pool = [threading.Thread(target=loop, args=(i,)) for i in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+
+    ms = sorted(x * 1000 for x in latencies)
+    quantiles = statistics.quantiles(ms, n=100) if len(ms) >= 2 else [0.0] * 99
+    return {
+        "ops": len(ms),
+        "ops_per_s": round(len(ms) / duration, 1),
+        "p50_ms": round(quantiles[49], 1),
+        "p95_ms": round(quantiles[94], 1),
+        "errors": len(errors),
+        "error_kinds": sorted(set(errors))[:3],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker_run(args.threads, args.duration), ensure_ascii=False))
+        return
+
+    for single_writer in ("true", "false"):
+        with tempfile.TemporaryDirectory(prefix="bench-sqlite-") as tmp:
+            env = {**os.environ, "DATABASE_URL": f"sqlite:///{tmp}/bench.db", "SQLITE_SINGLE_WRITER": single_writer,
+                   "LOG_LEVEL": "ERROR", "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "bench-key")}
+            result = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--worker", "--threads", str(args.threads), "--duration", str(args.duration)],
+                cwd=BACKEND_DIR, env=env, check=True, capture_output=True, text=True,
+            )
+            print(f"SQLITE_SINGLE_WRITER={single_writer}: {result.stdout.strip().splitlines()[-1]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# backend/benchmarks/bench_startup.py
+"""
+콜드 스타트 벤치마크 - 새 프로세스에서 import 시간, lifespan 시작, 첫 요청 지연 측정
+
+    python benchmarks/bench_startup.py --runs 5
+    python benchmarks/bench_startup.py --app-dir /tmp/before/backend   # 다른 리비전과 비교
+
+매 실행마다 새 SQLite 파일(스키마 + 사용자 1명)을 만들고, 자식 프로세스에서
+`import app.main` → TestClient lifespan 시작 → 첫 GET /health → 첫 DB 조회 요청(GET /users/me) 순서로 잰다.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PREPARE = """
+from sqlalchemy import create_engine, text
+from app import database, models
+engine = create_engine(sys.argv[1])
+database.Base.metadata.create_all(bind=engine)
+with engine.begin() as conn:
+    conn.execute(text("INSERT INTO users (email, hashed_password, is_active) VALUES ('bench@example.com', 'x', 1)"))
+"""
+
+_CHILD = """
+import json, time
+from fastapi.testclient import TestClient  # 측정 도구 자체의 import 는 제외
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+from app.routers.user import create_access_token
+token = create_access_token({"sub": "bench@example.com"})
+with TestClient(app.main.app) as client:
+    ready = time.perf_counter()
+    assert client.get("/health").status_code == 200
+    health = time.perf_counter()
+    response = client.get("/users/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200, response.text
+    first_db = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "lifespan_ms": (ready - imported) * 1000,
+    "first_health_ms": (health - ready) * 1000,
+    "first_db_request_ms": (first_db - health) * 1000,
+    "total_ms": (first_db - started) * 1000,
+}))
+"""
+
+
+def _env(app_dir: str, db_url: str, media_dir: str) -> dict:
+    env = {key: value for key, value in os.environ.items() if not key.startswith(("DB_", "CLOUD_SQL", "GOOGLE_CLOUD"))}
+    env.update({
+        "PYTHONPATH": app_dir,
+        "DATABASE_URL": db_url,
+        "MEDIA_DIR": media_dir,
+        "OPENAI_API_KEY": env.get("OPENAI_API_KEY", "bench-key"),
+        "JWT_SECRET_KEY": env.get("JWT_SECRET_KEY", "bench-secret"),
+        "WARMUP_ON_START": "false",
+        "LOG_FORMAT": "text",
+        "LOG_LEVEL": "WARNING",
+    })
+    return env
+
+
+def run_once(app_dir: str) -> dict:
+    with tempfile.TemporaryDirectory(prefix="bench-startup-") as tmp:
+        env = _env(app_dir, f"sqlite:///{tmp}/startup.db", os.path.join(tmp, "media"))
+        subprocess.run([sys.executable, "-c", "import sys" + _PREPARE, env["DATABASE_URL"]], cwd=app_dir, env=env, check=True)
+        result = subprocess.run([sys.executable, "-c", _CHILD], cwd=app_dir, env=env, check=True, capture_output=True, text=True)
+        return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--app-dir", default=BACKEND_DIR, help="app 패키지가 있는 backend 디렉토리")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    samples = [run_once(args.app_dir) for _ in range(args.runs)]
+    for key in samples[0]:
+        values = [s[key] for s in samples]
+        print(f"{key}: median={statistics.median(values):.1f} min={min(values):.1f} max={max(values):.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# backend/benchmarks/load_test.py
+"""
+실행 중인 서버에 동시 요청을 보내 처리량/지연 측정 (WEB_CONCURRENCY 결정용)
+
+    python benchmarks/load_test.py http://localhost:8000/health --concurrency 50 --duration 20
+    python benchmarks/load_test.py http://localhost:8000/interviews --token <JWT>
+    python benchmarks/load_test.py http://localhost:8000/users/login --method POST --form username=a@b.com --form password=secret
+
+--form 을 주면 application/x-www-form-urlencoded 본문으로 보낸다 (로그인의 bcrypt 검증처럼 CPU를 쓰는 요청 측정용).
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def _client_loop(
+    client: httpx.AsyncClient, method: str, url: str, headers: dict, form: dict, stop_at: float, latencies: list, errors: list
+):
+    while time.monotonic() < stop_at:
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, headers=headers, data=form or None)
+            if response.status_code >= 500:
+                errors.append(response.status_code)
+            else:
+                latencies.append(time.perf_counter() - started)
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+
+
+async def run(url: str, concurrency: int, duration: float, token: str = None, method: str = "GET", form: dict = None) -> dict:
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    latencies: list = []
+    errors: list = []
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(timeout=30, limits=limits) as client:
+        stop_at = time.monotonic() + duration
+        await asyncio.gather(*[_client_loop(client, method, url, headers, form, stop_at, latencies, errors) for _ in range(concurrency)])
+
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) >= 2 else [0.0] * 99
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": round(len(latencies) / duration, 1),
+        "p50_ms": round(quantiles[49] * 1000, 1),
+        "p95_ms": round(quantiles[94] * 1000, 1),
+        "p99_ms": round(quantiles[98] * 1000, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="간단한 HTTP 부하 테스트")
+    parser.add_argument("url")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--token", default=None, help="Bearer 토큰 (인증 필요한 엔드포인트)")
+    parser.add_argument("--method", default="GET")
+    parser.add_argument("--form", action="append", default=[], metavar="KEY=VALUE", help="폼 필드 (여러 번 지정 가능)")
+    args = parser.parse_args()
+    form = dict(field.split("=", 1) for field in args.form)
+    print(asyncio.run(run(args.url, args.concurrency, args.duration, args.token, args.method.upper(), form)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# backend/gunicorn.conf.py
+# 운영용 서버 설정: gunicorn -c gunicorn.conf.py app.main:app
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+worker_class = "uvicorn_worker.UvicornWorker"
+
+# 워커 수: WEB_CONCURRENCY가 없으면 CPU 코어당 1개
+# (bcrypt 해싱 같은 CPU 작업이 한 프로세스의 이벤트 루프를 막지 않도록 분산)
+# 요청 대부분은 외부 API 대기(I/O)라 코어당 1개로 충분하며, 늘리려면 benchmarks/load_test.py 로 먼저 측정
+workers = int(os.getenv("WEB_CONCURRENCY", str(max(multiprocessing.cpu_count(), 1))))
+
+# 앱을 마스터에서 미리 import 해서 워커 기동을 빠르게 하고 메모리를 공유
+# DB 엔진, OpenAI/GCS 클라이언트 등은 지연 생성 + fork 후 초기화되므로 워커마다 따로 만들어진다
+preload_app = os.getenv("PRELOAD_APP", "true").lower() == "true"
+
+# SIGTERM 수신 시 새 요청은 받지 않고 진행 중인 요청을 graceful_timeout 동안 기다린다.
+# Cloud Run은 SIGTERM 10초 후 SIGKILL 하므로 그보다 짧게 둔다 - 그 안에 끝나지 않는
+# 면접 생성/배치 작업은 중단된다 (차감된 크레딧은 다음 기동 시 복구에서 환불, 클라이언트는 재시도 -
+# 배치: batch_service.recover_stale_batches, 면접 생성: entitlement_service.recover_interrupted_interviews)
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "8"))
+timeout = int(os.getenv("WORKER_TIMEOUT", "300"))
+keepalive = 5
+
+# 접근 로그는 앱 미들웨어가 구조화(JSON)해서 남김
+accesslog = None
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
+
+
+def post_fork(server, worker):
+    server.log.info(f"Worker spawned (pid: {worker.pid})")
+
+
+def worker_int(worker):
+    # SIGINT/SIGQUIT - 진행 중인 요청을 기다리지 않는 빠른 종료
+    worker.log.info(f"Worker interrupted, exiting without drain (pid: {worker.pid})")
+
+
+def worker_exit(server, worker):
+    server.log.info(f"Worker exited (pid: {worker.pid})")
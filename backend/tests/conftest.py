@@ -0,0 +1,102 @@
+# backend/tests/conftest.py
+import os
+import tempfile
+import threading
+from types import SimpleNamespace
+
+# app 모듈은 import 시점에 환경변수를 읽으므로 가장 먼저 설정
+_tmp_dir = tempfile.mkdtemp(prefix="thefasthire-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp_dir}/test.db"
+os.environ["MEDIA_DIR"] = os.path.join(_tmp_dir, "media")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+os.environ.setdefault("LOG_FORMAT", "text")
+
+import pytest
+
+from app import database
+from app.services import resilience
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _schema():
+    database.create_tables()
+    yield
+
+
+@pytest.fixture
+def db():
+    session = database.SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_retry_budget(monkeypatch):
+    # 재시도 예산은 프로세스 전역이라 테스트끼리 영향을 주지 않도록 매번 새로 만든다
+    monkeypatch.setattr(resilience, "_retry_budget", resilience.RetryBudget())
+
+
+class FakeOpenAIClient:
+    """
+    장애 주입용 가짜 OpenAI 클라이언트
+    outcomes: 호출 순서대로 반환할 값 - 예외 인스턴스면 raise, 문자열이면 chat 응답 content
+    """
+
+    def __init__(self, outcomes, delay: float = 0.0):
+        self.outcomes = list(outcomes)
+        self.delay = delay
+        self.calls = []  # 호출마다 적용된 timeout
+        self._lock = threading.Lock()
+        self._timeout = None
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def with_options(self, timeout=None, max_retries=None):
+        clone = FakeOpenAIClient.__new__(FakeOpenAIClient)
+        clone.__dict__.update(self.__dict__)
+        clone._timeout = timeout
+        clone.chat = SimpleNamespace(completions=SimpleNamespace(create=clone._create))
+        return clone
+
+    def _create(self, **kwargs):
+        with self._lock:
+            self.calls.append(self._timeout)
+            outcome = self.outcomes.pop(0) if self.outcomes else "OK"
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=outcome))], usage=None)
+
+
+@pytest.fixture
+def fake_openai():
+    return FakeOpenAIClient
+
+
+@pytest.fixture
+def client():
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def make_user(db):
+    """크레딧을 가진 사용자와 access token 생성"""
+    import uuid
+
+    from app import crud
+    from app.routers.user import create_access_token
+    from app.services import entitlement_service
+
+    def _make(credits: int = 0):
+        email = f"user-{uuid.uuid4().hex[:8]}@example.com"
+        user = crud.create_user(db, email=email, hashed_password="not-used")
+        if credits:
+            entitlement_service.grant(db, user.id, credits, "test_seed", reference=email)
+        return user, create_access_token({"sub": email})
+
+    return _make
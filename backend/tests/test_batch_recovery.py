@@ -0,0 +1,83 @@
+# backend/tests/test_batch_recovery.py
+from datetime import datetime, timedelta, timezone
+
+from app import crud, models
+from app.services import batch_service, entitlement_service
+
+COST = entitlement_service.INTERVIEW_CREDIT_COST
+
+
+def _start_batch(db, user_id: int, filenames):
+    entitlement_service.debit(db, user_id, len(filenames) * COST, "batch")
+    return crud.create_batch(db, user_id, "ACME", "Backend", filenames)
+
+
+def _credits(db, user_id: int) -> int:
+    db.expire_all()
+    return crud.get_credits(db, user_id)
+
+
+def _items(db, batch_id: int):
+    return db.query(models.InterviewBatchItem).filter(models.InterviewBatchItem.batch_id == batch_id).order_by(models.InterviewBatchItem.id).all()
+
+
+def test_stale_running_batch_is_failed_and_refunded_once(db, make_user):
+    user, _ = make_user(credits=3 * COST)
+    batch = _start_batch(db, user.id, ["a.pdf", "b.pdf", "c.pdf"])
+    batch_id = batch.id
+    first_item = _items(db, batch_id)[0]
+    crud.update_batch_item(db, first_item.id, status="done")
+    crud.update_batch(
+        db, batch_id, status="running", completed=1,
+        created_at=datetime.now(timezone.utc) - timedelta(seconds=batch_service.BATCH_STALE_SECONDS + 60),
+    )
+    assert _credits(db, user.id) == 0
+
+    assert batch_service.recover_stale_batches() == 1
+    db.expire_all()
+    batch = crud.get_batch(db, batch_id, user.id)
+    assert (batch.status, batch.completed, batch.failed) == ("finished", 1, 2)
+    assert [item.status for item in _items(db, batch_id)] == ["done", "failed", "failed"]
+    assert _credits(db, user.id) == 2 * COST
+
+    # 재실행이나 뒤늦게 끝난 run_batch 가 다시 환불하지 않는다
+    assert batch_service.recover_stale_batches() == 0
+    assert crud.finish_batch(db, batch_id, failed=2) is False
+    entitlement_service.refund(db, user.id, 2 * COST, "batch", reference=f"batch:{batch_id}")
+    assert _credits(db, user.id) == 2 * COST
+
+
+def test_recent_batch_is_left_running(db, make_user):
+    user, _ = make_user(credits=COST)
+    batch = _start_batch(db, user.id, ["a.pdf"])
+    crud.update_batch(db, batch.id, status="running")
+
+    assert batch_service.recover_stale_batches() == 0
+    db.expire_all()
+    assert crud.get_batch(db, batch.id, user.id).status == "running"
+
+
+def test_run_batch_refunds_failed_items(db, make_user, monkeypatch):
+    user, _ = make_user(credits=2 * COST)
+    batch = _start_batch(db, user.id, ["ok.pdf", "broken.pdf"])
+    items = _items(db, batch.id)
+
+    def fake_process_item(batch_id, f, company, role):
+        if f.filename == "broken.pdf":
+            raise ValueError("PDF에서 텍스트를 추출할 수 없습니다")
+        return {
+            "item_id": f.item_id,
+            "resume_file_path": f"resumes/{f.filename}",
+            "resume_file_url": None,
+            "resume_text": "resume",
+            "questions": [(1, "자기소개를 해주세요", None)],
+        }
+
+    monkeypatch.setattr(batch_service, "_process_item", fake_process_item)
+    files = [batch_service.BatchFile(item_id=item.id, filename=item.filename, content=b"%PDF") for item in items]
+    batch_service.run_batch(batch.id, user.id, "ACME", "Backend", files)
+
+    db.expire_all()
+    batch = crud.get_batch(db, batch.id, user.id)
+    assert (batch.status, batch.completed, batch.failed) == ("finished", 1, 1)
+    assert _credits(db, user.id) == COST
@@ -0,0 +1,56 @@
+# backend/tests/test_database.py
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import func, select
+
+from app import crud, database, models
+
+
+def test_file_sqlite_uses_single_writer_session(db):
+    assert isinstance(db, database.SQLiteRoutingSession)
+
+
+def test_concurrent_writes_do_not_lock(db, make_user):
+    user, _ = make_user()
+    user_id = user.id
+    itv = crud.create_interview(db, user_id, "ACME", "Backend", "resume")
+    interview_id = itv.id
+
+    def write(i: int) -> int:
+        session = database.SessionLocal()
+        try:
+            q = crud.create_question(session, interview_id, i, f"Q{i}")
+            crud.create_answer(session, q.id, user_id, f"A{i}")
+            return q.id
+        finally:
+            session.close()
+
+    # 쓰기 커넥션 하나로 순서대로 commit 되므로 "database is locked" 없이 모두 성공해야 한다
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        question_ids = list(executor.map(write, range(64)))
+
+    assert len(set(question_ids)) == 64
+    db.expire_all()
+    assert db.scalar(select(func.count(models.Answer.id)).join(models.Question).where(
+        models.Question.interview_id == interview_id
+    )) == 64
+
+
+def test_session_reads_its_own_uncommitted_writes(make_user):
+    user, _ = make_user()
+    session = database.SessionLocal()
+    try:
+        session.add(models.Interview(user_id=user.id, company="ACME", role="Backend", status="created"))
+        session.flush()
+        # flush 이후의 읽기는 같은 트랜잭션(쓰기 커넥션)에서 실행된다
+        assert session.info.get("sqlite_writing")
+        assert session.scalar(select(func.count()).select_from(models.Interview).where(
+            models.Interview.user_id == user.id
+        )) == 1
+        session.rollback()
+        assert not session.info.get("sqlite_writing")
+        assert session.scalar(select(func.count()).select_from(models.Interview).where(
+            models.Interview.user_id == user.id
+        )) == 0
+    finally:
+        session.close()
@@ -0,0 +1,90 @@
+# backend/tests/test_entitlements.py
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import func, select
+
+from app import crud, database, models
+from app.routers import payment
+from app.services import entitlement_service
+from app.services.entitlement_service import InsufficientCreditsError
+
+
+def _concurrent_debits(user_id: int, attempts: int, amount: int):
+    def debit(_):
+        db = database.SessionLocal()
+        try:
+            entitlement_service.debit(db, user_id, amount, "answer")
+            return True
+        except InsufficientCreditsError:
+            return False
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        return list(executor.map(debit, range(attempts)))
+
+
+@pytest.mark.parametrize("credits,amount", [(50, 1), (12, 5)])
+def test_concurrent_debits_never_double_spend(db, make_user, credits, amount):
+    user, _ = make_user(credits=credits)
+    user_id = user.id
+    entitlement_service.invalidate(user_id)
+
+    results = _concurrent_debits(user_id, attempts=100, amount=amount)
+
+    assert sum(results) == credits // amount
+    db.expire_all()
+    remaining = db.scalar(select(models.Entitlement.credits).where(models.Entitlement.user_id == user_id))
+    assert remaining == credits % amount
+    spent = db.scalar(select(func.sum(models.UsageLedger.delta)).where(
+        models.UsageLedger.user_id == user_id, models.UsageLedger.reason == "answer"
+    ))
+    assert -spent == sum(results) * amount
+
+
+def test_charge_refunds_when_the_block_fails(db, make_user):
+    user, _ = make_user(credits=3)
+    with pytest.raises(RuntimeError):
+        with entitlement_service.charge(db, user.id, 2, "answer"):
+            raise RuntimeError("LLM failed")
+    assert entitlement_service.get_credits(db, user.id) == 3
+
+
+def test_free_credits_cover_one_full_interview(db, make_user):
+    user, _ = make_user()
+    entitlement_service.grant_signup_credits(db, user.id)
+
+    entitlement_service.debit(db, user.id, entitlement_service.INTERVIEW_CREDIT_COST, "interview")
+    for _ in range(10):  # 본 질문 5개 + 꼬리질문 5개
+        entitlement_service.debit(db, user.id, entitlement_service.ANSWER_CREDIT_COST, "answer")
+
+
+def test_payment_verification_is_disabled_by_default(client, make_user):
+    _, token = make_user()
+    response = client.post("/payments/payments/verify", data={"session_id": "cs_random"}, headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 501
+
+
+def test_payment_grant_is_idempotent_when_enabled(client, make_user, monkeypatch):
+    monkeypatch.setattr(payment, "PAYMENT_GRANTS_ENABLED", True)
+    _, token = make_user()
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = client.post("/payments/payments/verify", data={"session_id": "cs_1"}, headers=headers).json()
+    second = client.post("/payments/payments/verify", data={"session_id": "cs_1"}, headers=headers).json()
+    assert first["status"] == "verified" and first["credits"] == entitlement_service.PAYMENT_CREDIT_GRANT
+    assert second["status"] == "already_verified" and second["credits"] == first["credits"]
+
+
+def test_debit_sees_credits_granted_by_another_worker(db, make_user):
+    user, _ = make_user(credits=1)
+    entitlement_service.debit(db, user.id, 1, "answer")
+    with pytest.raises(InsufficientCreditsError):
+        entitlement_service.debit(db, user.id, 1, "answer")
+    assert entitlement_service.cached_credits(user.id) == 0
+
+    # 다른 워커의 결제 처리 - 이 워커의 캐시는 모른다
+    crud.add_credits(db, user.id, 5, "payment", "order-1")
+
+    assert entitlement_service.debit(db, user.id, 1, "answer") == 4
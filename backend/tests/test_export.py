@@ -0,0 +1,50 @@
+# backend/tests/test_export.py
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from app import crud
+from app.routers import export
+from app.services import export_service
+
+
+@pytest.fixture
+def answers(db, make_user):
+    user, _ = make_user()
+    itv = crud.create_interview(db, user.id, "ACME", "Backend", "resume")
+    q = crud.create_question(db, itv.id, 1, 'Q, "quoted"')
+    return [crud.create_answer(db, q.id, user.id, f"answer {i}\nline two").id for i in range(5)]
+
+
+def _export(*args, **kwargs) -> bytes:
+    return b"".join(export_service.iter_export(*args, **kwargs))
+
+
+def test_ndjson_since_id(answers):
+    rows = [json.loads(line) for line in _export("answers", "ndjson", since_id=answers[1]).decode().splitlines()]
+    assert [row["id"] for row in rows if row["id"] in answers] == answers[2:]
+
+
+def test_watermark_uses_created_at_then_id(answers):
+    first = json.loads(_export("answers", "ndjson", since_id=answers[0] - 1).decode().splitlines()[0])
+    created_at = export_service.datetime.fromisoformat(first["created_at"])
+    rows = [json.loads(line) for line in _export("answers", "ndjson", since_created_at=created_at, since_id=answers[2]).decode().splitlines()]
+    ids = [row["id"] for row in rows]
+    assert answers[3] in ids and answers[2] not in ids
+
+
+def test_gzip_csv_round_trip(answers):
+    text = gzip.decompress(_export("questions", "csv", compress=True)).decode()
+    rows = list(csv.DictReader(io.StringIO(text)))
+    assert 'Q, "quoted"' in [row["text"] for row in rows]
+
+
+def test_endpoint_requires_token(client, monkeypatch):
+    assert client.get("/exports/answers").status_code == 404  # 토큰 미설정 시 비활성화
+    monkeypatch.setattr(export, "EXPORT_API_TOKEN", "secret")
+    assert client.get("/exports/answers", headers={"X-Export-Token": "wrong"}).status_code == 401
+    response = client.get("/exports/answers", headers={"X-Export-Token": "secret"})
+    assert response.status_code == 200 and response.headers["content-type"].startswith("application/x-ndjson")
@@ -0,0 +1,48 @@
+# backend/tests/test_interview_history.py
+from app import crud, models
+
+
+def _auth(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_counts_use_main_questions_only(client, db, make_user):
+    user, token = make_user()
+    itv = crud.create_interview(db, user.id, "ACME", "Backend", "resume")
+    for index in range(1, 4):
+        q = crud.create_question(db, itv.id, index, f"Q{index}")
+        crud.create_answer(db, q.id, user.id, "answer")
+        follow = crud.create_question(db, itv.id, index, f"F{index}", is_followup=True)
+        crud.create_answer(db, follow.id, user.id, "follow-up answer")
+
+    item = client.get("/interviews", headers=_auth(token)).json()["items"][0]
+    assert (item["question_count"], item["answer_count"]) == (3, 3)
+
+
+def test_keyset_pages_cover_every_interview_once(client, db, make_user):
+    user, token = make_user()
+    # 같은 created_at(초 단위) 안에 여러 건이 있어도 중복/누락이 없어야 한다
+    db.add_all([models.Interview(user_id=user.id, company=f"C{i}", role="r", status="created") for i in range(53)])
+    db.commit()
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 10, **({"cursor": cursor} if cursor else {})}
+        page = client.get("/interviews", params=params, headers=_auth(token)).json()
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == len(set(seen)) == 53
+    assert seen == sorted(seen, reverse=True)
+
+
+def test_status_filter(client, db, make_user):
+    user, token = make_user()
+    crud.create_interview(db, user.id, "A", "r", "")
+    finished = crud.create_interview(db, user.id, "B", "r", "")
+    crud.set_interview_status(db, finished.id, "finished")
+
+    items = client.get("/interviews", params={"status": "finished"}, headers=_auth(token)).json()["items"]
+    assert [item["id"] for item in items] == [finished.id]
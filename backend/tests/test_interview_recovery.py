@@ -0,0 +1,95 @@
+# backend/tests/test_interview_recovery.py
+from datetime import datetime, timedelta, timezone
+
+from app import crud, models
+from app.routers import interview as interview_router
+from app.services import entitlement_service, interview_service
+
+COST = entitlement_service.INTERVIEW_CREDIT_COST
+
+
+def _start_interview(db, user_id: int, age_seconds: float = entitlement_service.INTERVIEW_STALE_SECONDS + 60) -> int:
+    """create_interview 가 차감까지 마치고 끊긴 상태"""
+    itv = crud.create_interview(db, user_id, "ACME", "Backend", resume_text=None)
+    entitlement_service.debit(db, user_id, COST, "interview", reference=entitlement_service.interview_reference(itv.id))
+    db.query(models.Interview).filter(models.Interview.id == itv.id).update(
+        {"created_at": datetime.now(timezone.utc) - timedelta(seconds=age_seconds)}
+    )
+    db.commit()
+    return itv.id
+
+
+def _credits(db, user_id: int) -> int:
+    db.expire_all()
+    return crud.get_credits(db, user_id)
+
+
+def test_interrupted_interview_is_refunded_once(db, make_user):
+    user, _ = make_user(credits=COST)
+    interview_id = _start_interview(db, user.id)
+    assert _credits(db, user.id) == 0
+
+    assert entitlement_service.recover_interrupted_interviews(db) == 1
+    assert _credits(db, user.id) == COST
+
+    # 재실행이나 뒤늦게 실행된 요청의 예외 경로가 다시 환불하지 않는다
+    assert entitlement_service.recover_interrupted_interviews(db) == 0
+    entitlement_service.refund(db, user.id, COST, "interview", reference=entitlement_service.interview_reference(interview_id))
+    assert _credits(db, user.id) == COST
+
+
+def test_recent_or_completed_interviews_are_not_refunded(db, make_user):
+    user, _ = make_user(credits=3 * COST)
+    _start_interview(db, user.id, age_seconds=0)  # 아직 생성 중일 수 있음
+    completed_id = _start_interview(db, user.id)
+    crud.create_question(db, completed_id, 1, "자기소개를 해주세요")
+    crud.create_interview(db, user.id, "ACME", "Backend", resume_text=None)  # 차감 내역 없는 면접 (배치, 이전 버전)
+
+    assert entitlement_service.recover_interrupted_interviews(db) == 0
+    assert _credits(db, user.id) == COST
+
+
+def test_failed_creation_is_refunded_by_reference(client, db, make_user, monkeypatch):
+    class _FakeGCS:
+        async def upload_file(self, file, folder: str = "resumes"):
+            return f"{folder}/{file.filename}", None
+
+    def broken_questions(file_path, company, role):
+        raise ValueError("질문 생성 실패")
+
+    monkeypatch.setattr(interview_router, "GCSService", _FakeGCS)
+    monkeypatch.setattr(interview_service, "extract_pdf_text", lambda content: "resume")
+    monkeypatch.setattr(interview_service, "generate_questions_from_pdf", broken_questions)
+    user, token = make_user(credits=COST)
+
+    response = client.post(
+        "/interviews",
+        data={"company": "ACME", "role": "Backend"},
+        files={"resume_file": ("resume.pdf", b"%PDF-1.4", "application/pdf")},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 500
+    assert _credits(db, user.id) == COST
+    db.query(models.Interview).filter(models.Interview.user_id == user.id).update(
+        {"created_at": datetime.now(timezone.utc) - timedelta(seconds=entitlement_service.INTERVIEW_STALE_SECONDS + 60)}
+    )
+    db.commit()
+    assert entitlement_service.recover_interrupted_interviews(db) == 0
+    assert _credits(db, user.id) == COST
+
+
+def test_rejected_creation_leaves_no_interview(client, db, make_user):
+    user, token = make_user(credits=1)
+    entitlement_service.debit(db, user.id, 1, "answer")
+
+    response = client.post(
+        "/interviews",
+        data={"company": "ACME", "role": "Backend"},
+        files={"resume_file": ("resume.pdf", b"%PDF-1.4", "application/pdf")},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 402
+    db.expire_all()
+    assert db.query(models.Interview).filter(models.Interview.user_id == user.id).count() == 0
@@ -0,0 +1,78 @@
+# backend/tests/test_interview_service.py
+import json
+from types import SimpleNamespace
+
+from app.services import interview_service
+from app.services.interview_service import (
+    CONTEXT_TRIM_STEP,
+    FOLLOWUP_CONTEXT_TOKEN_BUDGET,
+    build_followup_messages,
+    context_window_start,
+    estimate_tokens,
+)
+
+
+def _turns(count: int, answer_tokens: int = 600):
+    return [(f"질문 {i}: 그 프로젝트에서 맡은 역할은 무엇이었나요?", f"답변 {i} " + "a" * (answer_tokens * 3)) for i in range(count)]
+
+
+def _turn_tokens(turns) -> int:
+    return sum(estimate_tokens(q) + estimate_tokens(a) for q, a in turns)
+
+
+def _encoded(messages):
+    return [json.dumps(m, ensure_ascii=False).encode("utf-8") for m in messages]
+
+
+def test_followup_messages_are_a_byte_identical_prefix_until_a_trim_boundary():
+    turns = _turns(40)
+    boundaries = 0
+    for n in range(1, len(turns)):
+        current = build_followup_messages("ACME", "Backend", "이력서 " * 300, turns[:n])
+        following = build_followup_messages("ACME", "Backend", "이력서 " * 300, turns[:n + 1])
+        start, next_start = context_window_start(turns[:n]), context_window_start(turns[:n + 1])
+
+        if start == next_start:
+            # 지시문만 빼면 이번 턴의 메시지가 그대로 다음 턴의 접두사
+            assert _encoded(following[:len(current) - 1]) == _encoded(current[:-1])
+        else:
+            boundaries += 1
+            assert next_start - start == CONTEXT_TRIM_STEP
+
+    assert boundaries >= 2  # 잘라내기가 실제로 여러 번 일어나는 길이인지 확인
+
+
+def test_context_window_trims_in_steps_within_the_budget():
+    assert context_window_start(_turns(3)) == 0
+    for count in range(1, 60):
+        turns = _turns(count)
+        start = context_window_start(turns)
+        assert start % CONTEXT_TRIM_STEP == 0
+        assert _turn_tokens(turns[start:]) <= FOLLOWUP_CONTEXT_TOKEN_BUDGET
+        if start:
+            # 한 단계 덜 잘랐다면 예산을 넘는다 - 필요 이상으로 버리지 않음
+            assert _turn_tokens(turns[start - CONTEXT_TRIM_STEP:]) > FOLLOWUP_CONTEXT_TOKEN_BUDGET
+
+
+def test_context_window_always_keeps_the_current_turn():
+    turns = _turns(3, answer_tokens=FOLLOWUP_CONTEXT_TOKEN_BUDGET * 2)
+    assert context_window_start(turns) == len(turns) - 1
+
+
+def test_cached_tokens_are_accumulated_into_metrics(client, monkeypatch):
+    usage = SimpleNamespace(prompt_tokens=1200, completion_tokens=40, prompt_tokens_details=SimpleNamespace(cached_tokens=1024))
+    response = SimpleNamespace(usage=usage, choices=[SimpleNamespace(message=SimpleNamespace(content="어떤 점이 어려웠나요?"))])
+    fake = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **kwargs: response)))
+    fake.with_options = lambda **kwargs: fake
+    monkeypatch.setattr(interview_service, "get_client", lambda: fake)
+    before = client.get("/metrics").json()["llm"]
+
+    for _ in range(2):
+        interview_service.generate_followup("자기소개를 해주세요", "백엔드 개발자입니다", "ACME", "Backend")
+
+    after = client.get("/metrics").json()["llm"]
+    assert after["calls"] - before["calls"] == 2
+    assert after["prompt_tokens"] - before["prompt_tokens"] == 2400
+    assert after["cached_tokens"] - before["cached_tokens"] == 2048
+    assert after["completion_tokens"] - before["completion_tokens"] == 80
+    assert 0 < after["cache_hit_ratio"] <= 1
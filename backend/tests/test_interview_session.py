@@ -0,0 +1,106 @@
+# backend/tests/test_interview_session.py
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from app import crud, database, models
+from app.routers import interview as interview_router
+from app.services import audio_service, interview_service
+
+
+@pytest.fixture
+def stub_streams(monkeypatch):
+    def fake_followup(**kwargs):
+        yield "왜 그렇게 "
+        yield "생각하셨나요?"
+
+    def fake_audio(text, out_path):
+        yield b"ID3"
+        yield b"audio"
+
+    monkeypatch.setattr(interview_service, "stream_followup", fake_followup)
+    monkeypatch.setattr(audio_service, "stream_to_file", fake_audio)
+
+
+def _open_session(db, make_user, credits=5):
+    user, token = make_user(credits=credits)
+    itv = crud.create_interview(db, user.id, "ACME", "Backend", "resume")
+    q = crud.create_question(db, itv.id, 1, "자기소개를 해주세요")
+    ids = user.id, itv.id, q.id
+    db.close()  # 테스트 쪽 세션이 잡은 커넥션은 반환
+    return ids, f"/interviews/{itv.id}/session", token
+
+
+def test_session_turn_and_finish(client, db, make_user, stub_streams):
+    (user_id, interview_id, question_id), url, token = _open_session(db, make_user)
+    pool = database.get_engine().pool
+
+    with client.websocket_connect(url) as ws:
+        ws.send_json({"type": "auth", "token": token})
+        ready = ws.receive_json()
+        # 턴 사이 유휴 상태에서는 DB 커넥션을 잡고 있지 않는다
+        assert pool.checkedout() == 0
+        ws.send_json({"type": "answer", "question_id": question_id, "answer_text": "백엔드 개발자입니다"})
+        saved = ws.receive_json()
+        deltas = [ws.receive_json(), ws.receive_json()]
+        followup = ws.receive_json()
+        audio_start = ws.receive_json()
+        chunks = [ws.receive_bytes(), ws.receive_bytes()]
+        audio_end = ws.receive_json()
+        assert pool.checkedout() == 0
+        ws.send_json({"type": "finish"})
+        finished = ws.receive_json()
+
+    assert [q["id"] for q in ready["questions"]] == [question_id]
+    assert saved["type"] == "answer_saved" and saved["question_id"] == question_id
+    assert "".join(d["text"] for d in deltas) == "왜 그렇게 생각하셨나요?"
+    assert followup["question"]["is_followup"] is True and followup["question"]["audio_url"] is None
+    assert audio_start["question_id"] == followup["question"]["id"]
+    assert b"".join(chunks) == b"ID3audio"
+    assert audio_end["audio_url"]
+    assert finished["status"] == "finished"
+
+    assert crud.get_credits(db, user_id) == 4
+    follow = crud.get_question(db, followup["question"]["id"])
+    assert follow.audio_url == audio_end["audio_url"]
+    assert db.get(models.Interview, interview_id).status == "finished"
+
+
+@pytest.mark.parametrize("first_message", [
+    lambda token, other: {"type": "auth", "token": other},
+    lambda token, other: {"type": "answer", "token": token},
+    lambda token, other: {"type": "auth"},
+], ids=["other_user", "not_auth", "missing_token"])
+def test_session_rejects_bad_auth(client, db, make_user, first_message):
+    _, url, token = _open_session(db, make_user)
+    _, other_token = make_user()
+
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect(url) as ws:
+            ws.send_json(first_message(token, other_token))
+            ws.receive_json()
+    assert exc.value.code == 1008
+
+
+def test_session_requires_auth_message(client, db, make_user, monkeypatch):
+    # URL 쿼리의 토큰은 더 이상 받지 않는다 (요청 로그에 남음)
+    monkeypatch.setattr(interview_router, "WS_AUTH_TIMEOUT_SECONDS", 0.1)
+    _, url, token = _open_session(db, make_user)
+
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect(f"{url}?token={token}") as ws:
+            ws.receive_json()
+    assert exc.value.code == 1008
+
+
+def test_session_closes_after_missed_heartbeats(client, db, make_user, monkeypatch):
+    monkeypatch.setattr(interview_router, "SESSION_HEARTBEAT_SECONDS", 0.05)
+    monkeypatch.setattr(interview_router, "SESSION_MAX_MISSED_HEARTBEATS", 1)
+    _, url, token = _open_session(db, make_user)
+
+    with client.websocket_connect(url) as ws:
+        ws.send_json({"type": "auth", "token": token})
+        assert ws.receive_json()["type"] == "ready"
+        assert ws.receive_json()["type"] == "ping"
+        with pytest.raises(WebSocketDisconnect) as exc:
+            ws.receive_json()
+    assert exc.value.code == 1001
@@ -0,0 +1,105 @@
+# backend/tests/test_logging_config.py
+import json
+import logging
+import queue
+import threading
+
+from app.logging_config import (
+    JsonFormatter,
+    RequestContextFilter,
+    _StructuredQueueHandler,
+    request_id_var,
+    stage,
+    timings_var,
+)
+
+
+def _record(msg="hello %s", args=("world",), **extra) -> logging.LogRecord:
+    record = logging.LogRecord("app.test", logging.INFO, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_keeps_request_id_and_extra_fields():
+    token = request_id_var.set("req-123")
+    try:
+        record = _record(batch_id=7)
+        RequestContextFilter().filter(record)
+    finally:
+        request_id_var.reset(token)
+
+    payload = json.loads(JsonFormatter().format(record))
+    assert payload["msg"] == "hello world"
+    assert payload["request_id"] == "req-123"
+    assert payload["batch_id"] == 7
+    assert payload["level"] == "INFO"
+
+
+def test_request_id_is_captured_on_the_calling_thread():
+    # 큐 리스너 스레드가 아니라 로그를 남긴 쪽의 request_id가 레코드에 실려야 한다
+    record = _record()
+    token = request_id_var.set("req-caller")
+    try:
+        RequestContextFilter().filter(record)
+    finally:
+        request_id_var.reset(token)
+    seen = {}
+    thread = threading.Thread(target=lambda: seen.update(json.loads(JsonFormatter().format(record))))
+    thread.start()
+    thread.join()
+    assert seen["request_id"] == "req-caller"
+
+
+def test_queue_handler_prepare_keeps_extra_and_traceback():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        import sys
+
+        record = _record(exc_info=sys.exc_info(), stage_ms=12.5)
+    prepared = _StructuredQueueHandler(None).prepare(record)
+
+    payload = json.loads(JsonFormatter().format(prepared))
+    assert payload["msg"] == "hello world"
+    assert payload["stage_ms"] == 12.5
+    assert "ValueError: boom" in payload["exc"]
+    # 같은 레코드를 받는 다른 핸들러는 원본(args, exc_info)을 그대로 본다
+    assert prepared is not record
+    assert record.args == ("world",) and record.exc_info is not None
+
+
+def test_other_handlers_keep_the_traceback(caplog):
+    handler = _StructuredQueueHandler(queue.SimpleQueue())
+    logger = logging.getLogger("app.test.traceback")
+    logger.addHandler(handler)
+    try:
+        with caplog.at_level(logging.ERROR, logger="app.test.traceback"):
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.exception("failed")
+    finally:
+        logger.removeHandler(handler)
+
+    assert caplog.records[0].exc_info is not None
+    assert "ValueError: boom" in caplog.text
+    assert "ValueError: boom" in handler.queue.get_nowait().exc_text
+
+
+def test_stage_accumulates_timings():
+    token = timings_var.set({})
+    try:
+        with stage("llm"):
+            pass
+        with stage("llm"):
+            pass
+        timings = timings_var.get()
+    finally:
+        timings_var.reset(token)
+    assert set(timings) == {"llm"} and timings["llm"] >= 0
+
+
+def test_request_id_header_is_echoed(client):
+    response = client.get("/health", headers={"X-Request-ID": "req-from-client"})
+    assert response.headers["X-Request-ID"] == "req-from-client"
+    assert client.get("/health").headers["X-Request-ID"]
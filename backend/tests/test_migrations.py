@@ -0,0 +1,42 @@
+# backend/tests/test_migrations.py
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from app import database, models  # noqa: F401  모델 메타데이터 등록
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def _alembic(db_url: str, *args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "DATABASE_URL": db_url}
+    return subprocess.run(
+        [sys.executable, "-m", "alembic", *args], cwd=BACKEND_DIR, env=env, capture_output=True, text=True, timeout=120
+    )
+
+
+@pytest.mark.parametrize("existing_schema", [False, True], ids=["fresh", "create_all"])
+def test_upgrade_head(tmp_path, existing_schema):
+    db_url = f"sqlite:///{tmp_path}/migrate.db"
+    if existing_schema:
+        # AUTO_CREATE_TABLES 로 만들어진 기존 DB - 0001 이 테이블을 그대로 채택해야 한다
+        engine = create_engine(db_url)
+        database.Base.metadata.create_all(bind=engine)
+        assert "users" in inspect(engine).get_table_names()
+        engine.dispose()
+
+    result = _alembic(db_url, "upgrade", "head")
+    assert result.returncode == 0, result.stderr
+    assert _alembic(db_url, "check").returncode == 0
+
+    engine = create_engine(db_url)
+    try:
+        with engine.connect() as conn:
+            assert conn.scalar(text("SELECT version_num FROM alembic_version"))
+        assert "interview_batches" in inspect(engine).get_table_names()
+    finally:
+        engine.dispose()
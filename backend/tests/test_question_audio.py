@@ -0,0 +1,119 @@
+# backend/tests/test_question_audio.py
+import threading
+import time
+
+import pytest
+
+from app import crud, database
+from app.routers import interview as interview_router
+from app.services import audio_service, interview_service, resilience
+
+
+class _FakeGCS:
+    async def upload_file(self, file, folder: str = "resumes"):
+        await file.read()
+        return f"{folder}/{file.filename}", f"https://storage.test/{folder}/{file.filename}"
+
+
+@pytest.fixture
+def tts_calls(monkeypatch):
+    """synthesize_to_file 호출 기록 - 남은 요청 마감도 실제 TTS 호출처럼 확인한다"""
+    calls = []
+    lock = threading.Lock()
+
+    def fake_synthesize(text, filename_hint=None):
+        resilience.operation_timeout(30)
+        with lock:
+            calls.append(filename_hint)
+        return f"/media/audio/{filename_hint}.mp3"
+
+    monkeypatch.setattr(audio_service, "synthesize_to_file", fake_synthesize)
+    return calls
+
+
+def _question_ids(db, interview_id: int):
+    return [q.id for q in crud.list_questions(db, interview_id)]
+
+
+def test_create_interview_returns_first_audio_and_prefetches_rest(client, make_user, monkeypatch, tts_calls):
+    monkeypatch.setattr(interview_router, "LAZY_QUESTION_AUDIO", True)
+    monkeypatch.setattr(interview_router, "GCSService", _FakeGCS)
+    monkeypatch.setattr(interview_service, "extract_pdf_text", lambda content: "resume")
+    monkeypatch.setattr(
+        interview_service, "generate_questions_from_pdf",
+        lambda file_path, company, role: [(i, f"질문 {i}") for i in range(1, 6)],
+    )
+    _, token = make_user(credits=5)
+
+    response = client.post(
+        "/interviews",
+        data={"company": "ACME", "role": "Backend"},
+        files={"resume_file": ("resume.pdf", b"%PDF-1.4", "application/pdf")},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 200, response.text
+    questions = response.json()["questions"]
+    assert [q["index_num"] for q in questions] == [1, 2, 3, 4, 5]
+    assert questions[0]["audio_url"]
+    assert [q["audio_url"] for q in questions[1:]] == [None] * 4
+
+    # TestClient는 응답 후 BackgroundTasks까지 실행하고 돌아온다
+    interview_id = response.json()["id"]
+    assert tts_calls == [f"question-{i}-interview{interview_id}" for i in range(1, 6)]
+    db = database.SessionLocal()
+    try:
+        assert all(q.audio_url for q in crud.list_questions(db, interview_id))
+    finally:
+        db.close()
+
+
+def test_prefetch_ignores_the_spent_request_deadline(db, make_user, tts_calls):
+    user, _ = make_user()
+    itv = crud.create_interview(db, user.id, "ACME", "Backend", "resume")
+    for i in (2, 3):
+        crud.create_question(db, itv.id, i, f"질문 {i}")
+    question_ids = _question_ids(db, itv.id)
+
+    # 면접 생성에서 요청 마감을 거의 다 쓴 상태로 prefetch가 시작되는 상황
+    with resilience.request_deadline(resilience.DEADLINE_SAFETY_MARGIN / 2):
+        interview_router.prefetch_question_audio(question_ids)
+
+    assert len(tts_calls) == 2
+    db.expire_all()
+    assert all(q.audio_url for q in crud.list_questions(db, itv.id))
+
+
+def test_concurrent_prefetch_and_get_synthesize_once(client, db, make_user, monkeypatch):
+    user, token = make_user()
+    itv = crud.create_interview(db, user.id, "ACME", "Backend", "resume")
+    q = crud.create_question(db, itv.id, 2, "질문 2")
+    interview_id, question_id = itv.id, q.id
+
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow_synthesize(text, filename_hint=None):
+        calls.append(filename_hint)
+        started.set()
+        release.wait(timeout=5)
+        return "/media/audio/q2.mp3"
+
+    monkeypatch.setattr(audio_service, "synthesize_to_file", slow_synthesize)
+    prefetch = threading.Thread(target=interview_router.prefetch_question_audio, args=([question_id],))
+    prefetch.start()
+    assert started.wait(timeout=5)
+
+    responses = []
+    getter = threading.Thread(target=lambda: responses.append(client.get(
+        f"/interviews/{interview_id}/questions/{question_id}/audio", headers={"Authorization": f"Bearer {token}"}
+    )))
+    getter.start()
+    time.sleep(0.2)  # GET이 prefetch의 결과를 기다리는 중
+    release.set()
+    prefetch.join(timeout=5)
+    getter.join(timeout=5)
+
+    assert calls == [f"question-2-interview{interview_id}"]
+    assert responses[0].status_code == 200
+    assert responses[0].json()["audio_url"] == "/media/audio/q2.mp3"
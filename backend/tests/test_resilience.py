@@ -0,0 +1,127 @@
+# backend/tests/test_resilience.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services import interview_service, resilience
+from app.services.resilience import CallPolicy, CircuitOpenError, DeadlineExceeded
+
+
+def _policy(name, **kwargs):
+    kwargs.setdefault("timeout", 5)
+    kwargs.setdefault("base_backoff", 0)
+    return CallPolicy(name=name, **kwargs)
+
+
+def test_transient_errors_are_retried(fake_openai, monkeypatch):
+    client = fake_openai([TimeoutError(), ConnectionError(), "꼬리질문입니다?"])
+    monkeypatch.setattr(interview_service, "get_client", lambda: client)
+    monkeypatch.setattr(interview_service, "FOLLOWUP_POLICY", _policy("test.retry", max_attempts=3))
+
+    assert interview_service.generate_followup("Q", "A") == "꼬리질문입니다?"
+    assert len(client.calls) == 3
+    assert all(timeout <= 5 for timeout in client.calls)
+
+
+def test_non_retryable_error_is_not_retried(fake_openai, monkeypatch):
+    client = fake_openai([ValueError("bad request"), "unused"])
+    monkeypatch.setattr(interview_service, "get_client", lambda: client)
+    monkeypatch.setattr(interview_service, "FOLLOWUP_POLICY", _policy("test.no_retry"))
+
+    with pytest.raises(ValueError):
+        interview_service.generate_followup("Q", "A")
+    assert len(client.calls) == 1
+
+
+def test_retries_stop_at_max_attempts(fake_openai):
+    client = fake_openai([TimeoutError()] * 5)
+    policy = _policy("test.max_attempts", max_attempts=2)
+
+    with pytest.raises(TimeoutError):
+        resilience.call(policy, lambda timeout: client.with_options(timeout=timeout).chat.completions.create())
+    assert len(client.calls) == 2
+
+
+def test_breaker_opens_after_consecutive_failures(fake_openai):
+    client = fake_openai([TimeoutError()] * 20)
+    policy = _policy("test.breaker", max_attempts=1)
+    fn = lambda timeout: client.with_options(timeout=timeout).chat.completions.create()
+
+    for _ in range(resilience.BREAKER_FAILURE_THRESHOLD):
+        with pytest.raises(TimeoutError):
+            resilience.call(policy, fn)
+    with pytest.raises(CircuitOpenError):
+        resilience.call(policy, fn)
+    assert len(client.calls) == resilience.BREAKER_FAILURE_THRESHOLD
+
+
+def test_call_timeout_is_capped_by_request_deadline(fake_openai):
+    client = fake_openai(["OK"])
+    policy = _policy("test.deadline", timeout=30)
+
+    with resilience.request_deadline(resilience.DEADLINE_SAFETY_MARGIN + 2):
+        resilience.call(policy, lambda timeout: client.with_options(timeout=timeout).chat.completions.create())
+    assert client.calls[0] <= 2
+
+
+def test_exhausted_deadline_raises_without_calling(fake_openai):
+    client = fake_openai(["OK"])
+    policy = _policy("test.deadline_exhausted")
+
+    with resilience.request_deadline(resilience.DEADLINE_SAFETY_MARGIN / 2):
+        with pytest.raises(DeadlineExceeded):
+            resilience.call(policy, lambda timeout: client.with_options(timeout=timeout).chat.completions.create())
+    assert client.calls == []
+
+
+def test_hedge_returns_the_faster_attempt():
+    calls = []
+
+    def fn(timeout):
+        calls.append(timeout)
+        if len(calls) == 1:
+            time.sleep(1.0)  # 첫 시도만 느림
+            return "slow"
+        return "fast"
+
+    policy = _policy("test.hedge", hedge=True, hedge_min_delay=0.05)
+    started = time.monotonic()
+    assert resilience.call(policy, fn) == "fast"
+    assert time.monotonic() - started < 0.9
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("error", [CircuitOpenError("open"), DeadlineExceeded("late")])
+def test_question_generation_passes_through_resilience_errors(monkeypatch, error):
+    def fail(policy, fn):
+        raise error
+
+    monkeypatch.setattr(resilience, "call", fail)
+    with pytest.raises(type(error)):
+        interview_service.generate_questions_from_pdf("resume.pdf", "ACME", "Backend", file_content=b"%PDF")
+
+
+def test_saturated_hedge_executor_does_not_fire_hedges(monkeypatch):
+    # 워커 4개에 0.3초짜리 호출 16개 - 큐 대기 때문에 hedge가 나가거나 직렬화되면 안 된다
+    monkeypatch.setattr(resilience, "_hedge_executor", ThreadPoolExecutor(max_workers=4, thread_name_prefix="hedge-test"))
+    monkeypatch.setattr(resilience, "_hedge_slots", threading.BoundedSemaphore(4))
+    calls = []
+    lock = threading.Lock()
+
+    def fn(timeout):
+        with lock:
+            calls.append(timeout)
+        time.sleep(0.3)
+        return "OK"
+
+    policy = _policy("test.hedge_saturated", hedge=True, hedge_min_delay=0.2)
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=16) as callers:
+        results = list(callers.map(lambda _: resilience.call(policy, fn), range(16)))
+    elapsed = time.monotonic() - started
+
+    assert results == ["OK"] * 16
+    assert len(calls) == 16
+    assert elapsed < 0.6
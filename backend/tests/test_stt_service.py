@@ -0,0 +1,112 @@
+# backend/tests/test_stt_service.py
+import threading
+
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from app import crud, database
+from app.services import audio_service, interview_service, resilience, stt_service
+
+
+class _SlowFirstSegment(stt_service.FakeSpeechToText):
+    """첫 세그먼트만 늦게 끝나는 provider - 순서와 무관하게 결과가 도착하는 상황 재현"""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def transcribe(self, audio: bytes, filename: str) -> str:
+        if filename.startswith("segment-0."):
+            self.release.wait(timeout=5)
+        return super().transcribe(audio, filename)
+
+
+def test_provider_interface_is_abstract():
+    with pytest.raises(TypeError):
+        stt_service.SpeechToTextProvider()
+
+
+def test_session_joins_segments_in_upload_order():
+    provider = _SlowFirstSegment()
+    session = stt_service.TranscriptionSession(provider=provider)
+    _, first = session.add_segment("안녕하세요".encode())
+    _, second = session.add_segment("반갑습니다".encode())
+
+    assert second.result(timeout=5) == "반갑습니다"
+    assert not first.done()
+    provider.release.set()
+    assert session.finalize() == "안녕하세요 반갑습니다"
+
+
+@pytest.fixture
+def stub_followup(monkeypatch):
+    monkeypatch.setattr(interview_service, "generate_followup", lambda **kwargs: "왜 그렇게 생각하셨나요?")
+    monkeypatch.setattr(audio_service, "synthesize_to_file", lambda text, filename_hint=None: "http://test/audio.mp3")
+
+
+@pytest.fixture
+def fake_stt():
+    stt_service.set_provider(stt_service.FakeSpeechToText())
+    yield
+    stt_service.set_provider(None)
+
+
+def test_spoken_answer_stream(client, db, make_user, fake_stt, stub_followup):
+    user, token = make_user(credits=5)
+    itv = crud.create_interview(db, user.id, "ACME", "Backend", "resume")
+    q = crud.create_question(db, itv.id, 1, "자기소개를 해주세요")
+    user_id = user.id
+    url = f"/interviews/{itv.id}/questions/{q.id}/answer/stream?format=webm"
+    db.close()  # 테스트 쪽 세션이 잡은 커넥션은 반환
+    pool = database.get_engine().pool
+
+    with client.websocket_connect(url) as ws:
+        ws.send_json({"type": "auth", "token": token})
+        ws.send_bytes("저는 백엔드".encode())
+        ws.send_bytes("개발자입니다".encode())
+        partials = [ws.receive_json(), ws.receive_json()]
+        # 녹음 중에는 DB 커넥션을 잡고 있지 않는다
+        assert pool.checkedout() == 0
+        ws.send_json({"type": "end"})
+        final = ws.receive_json()
+        followup = ws.receive_json()
+
+    assert sorted(p["seq"] for p in partials) == [0, 1]
+    assert final["type"] == "final" and final["text"] == "저는 백엔드 개발자입니다"
+    assert followup["type"] == "followup" and followup["question"]["is_followup"] is True
+    assert crud.get_credits(db, user_id) == 4
+
+
+def test_spoken_answer_stream_rejects_bad_token(client, db, make_user):
+    user, _ = make_user()
+    itv = crud.create_interview(db, user.id, "ACME", "Backend", "resume")
+    q = crud.create_question(db, itv.id, 1, "Q")
+
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect(f"/interviews/{itv.id}/questions/{q.id}/answer/stream") as ws:
+            ws.send_json({"type": "auth", "token": "invalid"})
+            ws.receive_json()
+    assert exc.value.code == 1008
+
+
+def test_spoken_answer_followup_failure_sends_error_and_refunds(client, db, make_user, fake_stt, monkeypatch):
+    def fail(**kwargs):
+        raise resilience.CircuitOpenError("followup 서킷이 열려 있습니다")
+
+    monkeypatch.setattr(interview_service, "generate_followup", fail)
+    user, token = make_user(credits=5)
+    itv = crud.create_interview(db, user.id, "ACME", "Backend", "resume")
+    q = crud.create_question(db, itv.id, 1, "자기소개를 해주세요")
+    user_id, url = user.id, f"/interviews/{itv.id}/questions/{q.id}/answer/stream"
+
+    with client.websocket_connect(url) as ws:
+        ws.send_json({"type": "auth", "token": token})
+        ws.send_bytes("답변입니다".encode())
+        ws.send_json({"type": "end"})
+        messages = [ws.receive_json() for _ in range(3)]
+        with pytest.raises(WebSocketDisconnect) as exc:
+            ws.receive_json()
+
+    assert [m["type"] for m in messages] == ["partial", "final", "error"]
+    assert exc.value.code == 1011
+    db.expire_all()
+    assert crud.get_credits(db, user_id) == 5